@@ -0,0 +1,9 @@
+"""
+description: |
+    this module provides the benchmark of match_schema,
+    it can be run by python -m fast_tornado.bench.
+"""
+
+from .generate_payload import generate_payload
+from .run_benchmark import run_benchmark
+from .compare_results import compare_results
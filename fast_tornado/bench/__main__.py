@@ -0,0 +1,98 @@
+"""
+description: |
+    this module runs the benchmark of match_schema, for example:
+        python -m fast_tornado.bench --save baseline.json
+        python -m fast_tornado.bench --baseline baseline.json --tolerance 0.1
+    if any case is slower than the baseline beyond the tolerance, the exit code is 1.
+"""
+
+import sys
+import json
+import argparse
+
+from fast_tornado import VERSION
+from fast_tornado.constants import BENCH
+from fast_tornado.constants import MATCH_SCHEMA
+from fast_tornado.constants import ENCODE
+from fast_tornado.constants import FILE_MODE
+
+from .run_benchmark import run_benchmark
+from .compare_results import compare_results
+
+def __parse_arguments(arguments):
+    parser = argparse.ArgumentParser(
+        prog='python -m fast_tornado.bench', description='benchmark of match_schema.'
+    )
+    parser.add_argument(
+        '--backend', choices=[MATCH_SCHEMA.WALKER, MATCH_SCHEMA.CODE], default=MATCH_SCHEMA.BACKEND
+    )
+    parser.add_argument(
+        '--case', action='append', choices=sorted(BENCH.CASES),
+        help='the cases to run, default all.'
+    )
+    parser.add_argument('--repeat', type=int, default=BENCH.REPEAT)
+    parser.add_argument('--save', help='the path of json file, which the results are saved into.')
+    parser.add_argument(
+        '--baseline', help='the path of json file, which the results are compared with.'
+    )
+    parser.add_argument('--tolerance', type=float, default=BENCH.TOLERANCE)
+    return parser.parse_args(arguments)
+
+def __render_results(results):
+    lines = ['{:<12}  {:>14}  {:>14}'.format('case', 'ops/sec', 'peak memory')]
+    for name, result in results.items():
+        lines.append(
+            '{:<12}  {:>14.1f}  {:>14}'.format(
+                name, result['ops_per_second'], result['peak_memory']
+            )
+        )
+    return '\n'.join(lines)
+
+def __render_comparisons(comparisons):
+    lines = ['{:<12}  {:>14}  {:>14}  {:>8}'.format('case', 'baseline', 'current', 'ratio')]
+    for comparison in comparisons:
+        lines.append(
+            '{:<12}  {:>14.1f}  {:>14.1f}  {:>8.3f}{mark}'.format(
+                comparison.name,
+                comparison.baseline,
+                comparison.current,
+                comparison.ratio,
+                mark='  regressed' if comparison.regressed else ''
+            )
+        )
+    return '\n'.join(lines)
+
+def main(arguments=None):
+    """
+    description: this function is the entry of the benchmark, it returns the exit code.
+    arguments:
+        arguments:
+            type: [list, None]
+            description: the command line arguments, the default is sys.argv[1:].
+    """
+    arguments = __parse_arguments(arguments)
+    cases = BENCH.CASES
+    if arguments.case is not None:
+        cases = {name: BENCH.CASES[name] for name in arguments.case}
+
+    results = run_benchmark(cases, arguments.backend, arguments.repeat)
+    print(__render_results(results))
+
+    if arguments.save is not None:
+        document = {'version': VERSION, 'backend': arguments.backend, 'results': results}
+        with open(arguments.save, FILE_MODE.WRITE, encoding=ENCODE.UTF8) as file:
+            json.dump(document, file, indent=4)
+
+    if arguments.baseline is None:
+        return 0
+
+    with open(arguments.baseline, FILE_MODE.READ, encoding=ENCODE.UTF8) as file:
+        baseline = json.load(file)['results']
+
+    comparisons = compare_results(baseline, results, arguments.tolerance)
+    print()
+    print(__render_comparisons(comparisons))
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
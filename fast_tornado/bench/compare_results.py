@@ -0,0 +1,46 @@
+"""
+description: this module provides the function compare_results.
+"""
+
+import collections
+
+from fast_tornado.constants import BENCH
+
+Comparison = collections.namedtuple(
+    'Comparison',
+    ['name', 'baseline', 'current', 'ratio', 'regressed']
+)
+
+def compare_results(baseline, results, tolerance=None):
+    """
+    description: |
+        this function is used to compare the ops per second of results with the baseline.
+        a case is regressed if its ops per second is less than (1 - tolerance) of the baseline,
+        the cases which are not in both of them are ignored.
+    arguments:
+        baseline:
+            type: dict
+            description: the results saved before, see run_benchmark.
+        results:
+            type: dict
+            description: the current results, see run_benchmark.
+        tolerance:
+            type: [float, None]
+            description: the allowed ratio of slowdown, the default is BENCH.TOLERANCE.
+    return:
+        type: list
+        description: the list of Comparison, in the order of results.
+    """
+    tolerance = BENCH.TOLERANCE if tolerance is None else tolerance
+
+    comparisons = list()
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        baseline_speed = baseline[name]['ops_per_second']
+        current_speed = result['ops_per_second']
+        ratio = current_speed / baseline_speed
+        regressed = ratio < 1 - tolerance
+        comparisons.append(Comparison(name, baseline_speed, current_speed, ratio, regressed))
+    return comparisons
@@ -0,0 +1,74 @@
+"""
+description: this module provides the function generate_payload.
+"""
+
+import itertools
+
+from fast_tornado.constants import BENCH
+
+def __generate_leaf(constraint, index):
+    if constraint == BENCH.RANGES:
+        schema = {'type': 'int', 'minimum': 0, 'maximum': 1000000, 'multiple_of': 3}
+        return schema, index * 3
+
+    if constraint == BENCH.STRINGS:
+        schema = {
+            'type': 'str',
+            'pattern': '[a-z]+[0-9]*',
+            'full_match': True,
+            'minimum_length': 1,
+            'maximum_length': 32,
+            'assertion': 'lambda x: not x.startswith("z")',
+        }
+        return schema, 'value{index}'.format(index=index)
+
+    return {'type': 'int'}, index
+
+def __generate_node(depth, width, constraints, counter):
+    if depth == 0:
+        index = next(counter)
+        return __generate_leaf(constraints[index % len(constraints)], index)
+
+    schema = {'type': 'dict', 'additional_properities': False, 'properties': dict()}
+    data = dict()
+    for index in range(width):
+        key = 'property_{index}'.format(index=index)
+        schema['properties'][key], data[key] = __generate_node(
+            depth - 1, width, constraints, counter
+        )
+    return schema, data
+
+def generate_payload(depth, width, length, constraint):
+    """
+    description: |
+        this function is used to generate a schema and a valid data of the schema.
+        the data is a tree of dicts, whose leaves are checked by the constraints,
+        if constraint is mixed, the leaves use types, ranges and strings in turn.
+    arguments:
+        depth:
+            type: int
+            description: the depth of the dicts.
+        width:
+            type: int
+            description: the number of properties of every dict.
+        length:
+            type: int
+            description: the length of the root list, 0 means the root is the dict itself.
+        constraint:
+            type: str
+            description: one of types, ranges, strings and mixed in fast_tornado.constants.BENCH.
+    return:
+        type: tuple
+        description: the schema and the data.
+    """
+    constraints = BENCH.CONSTRAINTS if constraint == BENCH.MIXED else (constraint,)
+    schema, data = __generate_node(depth, width, constraints, itertools.count())
+    if length == 0:
+        return schema, data
+
+    # the items are different objects with the same values, so that no check is skipped by sharing.
+    items = [data]
+    for _ in range(length - 1):
+        _, item = __generate_node(depth, width, constraints, itertools.count())
+        items.append(item)
+    return {'type': 'list', 'items': schema}, items
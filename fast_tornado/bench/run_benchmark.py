@@ -0,0 +1,68 @@
+"""
+description: this module provides the function run_benchmark.
+"""
+
+import timeit
+import tracemalloc
+import yaml
+
+from fast_tornado.constants import BENCH
+from fast_tornado.match_schema.check_schema import get_validator
+
+from .generate_payload import generate_payload
+
+def __get_number(timer):
+    # the number of calls is doubled until one timing is long enough to be measured precisely.
+    number = 1
+    while timer.timeit(number) < BENCH.MINIMUM_TIME:
+        number *= 2
+    return number
+
+def __measure_memory(validator, data):
+    tracemalloc.start()
+    try:
+        current, _ = tracemalloc.get_traced_memory()
+        validator.validate(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - current
+
+def run_benchmark(cases=None, backend=None, repeat=None):
+    """
+    description: |
+        this function is used to measure the speed and the memory of checking the synthetic
+        payloads. the schemas are dumped into yaml and compiled by get_validator, which is used by
+        check_schema, so the compilation is not measured. every case is timed repeat times, and
+        the best one is used.
+    arguments:
+        cases:
+            type: [dict, None]
+            description: the map from name to the arguments of generate_payload, or BENCH.CASES.
+        backend:
+            type: [str, None]
+            description: the backend of the validator, the default is MATCH_SCHEMA.BACKEND.
+        repeat:
+            type: [int, None]
+            description: the number of timings of every case, the default is BENCH.REPEAT.
+    return:
+        type: dict
+        description: the map from name to the ops per second and the peak memory in bytes.
+    """
+    cases = BENCH.CASES if cases is None else cases
+    repeat = BENCH.REPEAT if repeat is None else repeat
+
+    results = dict()
+    for name, arguments in cases.items():
+        schema, data = generate_payload(*arguments)
+        validator = get_validator(yaml.safe_dump(schema), backend)
+
+        timer = timeit.Timer(lambda validator=validator, data=data: validator.validate(data))
+        number = __get_number(timer)
+        best_time = min(timer.repeat(repeat=repeat, number=number))
+
+        results[name] = {
+            'ops_per_second': number / best_time,
+            'peak_memory': __measure_memory(validator, data),
+        }
+    return results
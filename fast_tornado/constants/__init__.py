@@ -5,4 +5,8 @@ description: this module contains constants of fast_tornado.
 from . import logger as LOGGER
 from . import file_mode as FILE_MODE
 from . import encode as ENCODE
+from . import match_schema as MATCH_SCHEMA
+from . import json_event as JSON_EVENT
+from . import server as SERVER
+from . import bench as BENCH
 from .server import DOCUMENT_SCHEMA
@@ -0,0 +1,25 @@
+"""
+description: this module provides the constants about the benchmark of match_schema.
+"""
+
+TYPES = 'types'
+RANGES = 'ranges'
+STRINGS = 'strings'
+MIXED = 'mixed'
+CONSTRAINTS = (TYPES, RANGES, STRINGS)
+
+# the name of case: depth, width, length of the root list, constraints.
+# the length 0 means the root is a dict instead of a list.
+CASES = {
+    'flat': (1, 16, 0, TYPES),
+    'wide': (1, 256, 0, TYPES),
+    'deep': (8, 2, 0, TYPES),
+    'long_list': (1, 4, 10000, TYPES),
+    'ranges': (2, 8, 100, RANGES),
+    'strings': (2, 8, 100, STRINGS),
+    'mixed': (3, 4, 100, MIXED),
+}
+
+REPEAT = 5
+MINIMUM_TIME = 0.2
+TOLERANCE = 0.1
@@ -4,3 +4,5 @@ description: this module provides the contants about file mode.
 
 READ = 'r'
 WRITE = 'w'
+READ_BINARY = 'rb'
+WRITE_BINARY = 'wb'
@@ -0,0 +1,12 @@
+"""
+description: this module provides the constants about the events of iterate_json.
+"""
+
+START_MAP = 'start_map'
+MAP_KEY = 'map_key'
+END_MAP = 'end_map'
+START_ARRAY = 'start_array'
+END_ARRAY = 'end_array'
+VALUE = 'value'
+
+CHUNK_SIZE = 65536
@@ -0,0 +1,30 @@
+"""
+description: this module provides the constants about match_schema.
+"""
+
+WALKER = 'walker'
+CODE = 'code'
+BACKEND = WALKER
+
+CACHE_SIZE = 256
+ASSERTION_CACHE_SIZE = 1024
+DEFINITION_CACHE_SIZE = 1024
+# the size of the memo of validators compiled by check_schema, None means they are not memoized.
+MEMO_SIZE = None
+# the maximum length of the strings, bytes and tuples, which are memoized, the longer values
+# are checked directly.
+MEMO_VALUE_SIZE = 256
+
+VECTORIZE_THRESHOLD = 32
+
+CHUNK_SIZE = 1000
+
+REPR_LIMIT = 1024
+
+# the time of a slice of check_schema_async in seconds, if neither slice_size nor slice_time
+# is given.
+SLICE_TIME = 0.002
+
+# the depth of data, beyond which the walker checks the nodes with an explicit stack
+# instead of recursion.
+RECURSION_DEPTH = 100
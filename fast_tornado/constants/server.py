@@ -2,6 +2,9 @@
 description: this module provides some constants about server.
 """
 
+# the directory where the parsed documents of handlers are cached, None means no cache.
+DOCUMENT_CACHE_DIRECTORY = None
+
 DOCUMENT_SCHEMA = '''
 type: dict
 properties:
@@ -13,6 +13,9 @@ from .match_schema import EnumerationException
 from .match_schema import InvalidPropertyException
 from .match_schema import DependenciesException
 from .match_schema import RegexPatternException
+from .match_schema import InvalidRegexPatternException
+from .match_schema import InvalidReferenceException
+from .match_schema import InvalidSampleException
 from .match_schema import NonstringTypeHasPatternException
 from .match_schema import ExceedMaximumException
 from .match_schema import ExceedMinimumException
@@ -22,6 +25,7 @@ from .match_schema import MultipleOfException
 from .system import CannotFindFileOrDirectoryException
 from .system import InvalidArgumentsException
 from .system import InvalidYamlException
+from .system import InvalidJsonException
 
 from .handler import CannotFindDocumentException
 from .handler import CannotFindArgumentSchemaException
@@ -2,7 +2,17 @@
 description: this module provides the exception FastTornadoBaseException.
 """
 
+import copyreg
+
 class FastTornadoBaseException(BaseException):
     """
     description: this is the base exception of fast_tornado.
     """
+
+    def __reduce__(self):
+        """
+        description: |
+            the subclasses have their own arguments in __init__, so the exception is restored
+            from its message and attributes without calling __init__, which makes it picklable.
+        """
+        return copyreg.__newobj__, (type(self),) + self.args, self.__dict__
@@ -0,0 +1,77 @@
+"""
+description: this module provides the function limit_repr.
+"""
+
+ELLIPSIS = '...'
+SEQUENCE_BRACKETS = {
+    list: ('[', ']'),
+    tuple: ('(', ')'),
+    set: ('{', '}'),
+    frozenset: ('frozenset({', '})'),
+}
+TEXT_TYPES = (str, bytes, bytearray)
+
+def __iterate_pieces(value, limit, visiting):
+    value_type = type(value)
+
+    if value_type in TEXT_TYPES:
+        # the repr of a prefix, which is longer than the limit, is enough to be truncated.
+        yield repr(value[:limit + 1]) if len(value) > limit else repr(value)
+        return
+
+    if value_type not in SEQUENCE_BRACKETS and value_type is not dict:
+        yield repr(value)
+        return
+
+    if id(value) in visiting:
+        yield '{...}' if value_type is dict else '[...]'
+        return
+
+    if not value and value_type in (set, frozenset):
+        yield value_type.__name__ + '()'
+        return
+
+    visiting.add(id(value))
+    left, right = ('{', '}') if value_type is dict else SEQUENCE_BRACKETS[value_type]
+    yield left
+    for index, item in enumerate(value.items() if value_type is dict else value):
+        if index:
+            yield ', '
+        if value_type is dict:
+            yield from __iterate_pieces(item[0], limit, visiting)
+            yield ': '
+            yield from __iterate_pieces(item[1], limit, visiting)
+        else:
+            yield from __iterate_pieces(item, limit, visiting)
+    if value_type is tuple and len(value) == 1:
+        yield ','
+    yield right
+    visiting.discard(id(value))
+
+def limit_repr(value, limit):
+    """
+    description: |
+        this function is used to get the repr of the value, which is not longer than the limit.
+        the builtin containers and strings are rendered piece by piece, and the rendering stops
+        once the limit is exceeded, so that the cost does not depend on the size of the value.
+        if the repr is truncated, it ends with '...'.
+    arguments:
+        value:
+            type: any
+            description: the value.
+        limit:
+            type: [int, None]
+            description: the maximum length of the repr, None means no limit.
+    """
+    if limit is None:
+        return repr(value)
+
+    pieces = list()
+    length = 0
+    for piece in __iterate_pieces(value, limit, set()):
+        pieces.append(piece)
+        length += len(piece)
+        if length > limit:
+            return ''.join(pieces)[:max(limit - len(ELLIPSIS), 0)] + ELLIPSIS
+
+    return ''.join(pieces)
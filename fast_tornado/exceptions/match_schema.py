@@ -1,25 +1,71 @@
 """
-description: this module provides the exceptions about match_schema.
+description: |
+    this module provides the exceptions about match_schema.
+    the exceptions only keep their fields, which are also their args, the message is rendered
+    when it is needed, and the repr of data in the message is not longer than
+    SchemaException.repr_limit.
 """
 
+from fast_tornado.constants import MATCH_SCHEMA
+
 from .base import FastTornadoBaseException
+from .limit_repr import limit_repr
 
 class SchemaException(FastTornadoBaseException):
     """
     description: this is the base exception of exceptions about match_schema.
     """
 
+    # the maximum length of the repr of values in messages, None means no limit.
+    repr_limit = MATCH_SCHEMA.REPR_LIMIT
+
+    def __str__(self):
+        # the message is rendered after the exception is raised, a field which cannot be rendered
+        # should not replace the exception with another one.
+        try:
+            return self.render()
+        except Exception: # pylint: disable = broad-except
+            pass
+
+        try:
+            return '{clazz}{arguments}'.format(
+                clazz=type(self).__name__, arguments=self.represent(self.args)
+            )
+        except Exception: # pylint: disable = broad-except
+            return type(self).__name__
+
+    def __repr__(self):
+        return '{clazz}({message})'.format(clazz=type(self).__name__, message=repr(str(self)))
+
+    def render(self):
+        """
+        description: |
+            this function is used to render the message of the exception, the subclasses render it
+            from their fields, the default message is the message given to the exception, if any.
+        """
+        return super().__str__()
+
+    def represent(self, value):
+        """
+        description: this function is used to get the repr of the value, limited by repr_limit.
+        """
+        return limit_repr(value, self.repr_limit)
+
 class TypeMismatchException(SchemaException):
     """
     description: if the type is wrong, raise this exception.
     """
     def __init__(self, data, expected_types, name):
-        super().__init__(
-            '{name} = {data}, but its type should be {expected_types}'.format(
-                name=name,
-                data=repr(data),
-                expected_types=', '.join(item.__name__ for item in expected_types)
-            )
+        super().__init__(data, expected_types, name)
+        self.data = data
+        self.expected_types = expected_types
+        self.name = name
+
+    def render(self):
+        return '{name} = {data}, but its type should be {expected_types}'.format(
+            name=self.name,
+            data=self.represent(self.data),
+            expected_types=', '.join(item.__name__ for item in self.expected_types)
         )
 
 class AssertionException(SchemaException):
@@ -27,12 +73,16 @@ class AssertionException(SchemaException):
     description: if the data cannot pass the assertion, raise this exception.
     """
     def __init__(self, data, assertion, name):
-        super().__init__(
-            '{name} = {data}, cannot pass the assertion {assertion}'.format(
-                name=name,
-                data=repr(data),
-                assertion=repr(assertion)
-            )
+        super().__init__(data, assertion, name)
+        self.data = data
+        self.assertion = assertion
+        self.name = name
+
+    def render(self):
+        return '{name} = {data}, cannot pass the assertion {assertion}'.format(
+            name=self.name,
+            data=self.represent(self.data),
+            assertion=repr(self.assertion)
         )
 
 
@@ -43,10 +93,12 @@ class InitializeLambdaExpressionException(SchemaException):
         raise this exception.
     """
     def __init__(self, expression):
-        super().__init__(
-            'cannot initialize lambda expression from {expression}'.format(
-                expression=repr(expression)
-            )
+        super().__init__(expression)
+        self.expression = expression
+
+    def render(self):
+        return 'cannot initialize lambda expression from {expression}'.format(
+            expression=self.represent(self.expression)
         )
 
 class CannotFindPropertyException(SchemaException):
@@ -54,12 +106,16 @@ class CannotFindPropertyException(SchemaException):
     description: if there is no specified property, raise this exception.
     """
     def __init__(self, data, property_name, name):
-        super().__init__(
-            'cannot find \'{property_name}\' in {name} = {data}'.format(
-                property_name=property_name,
-                name=name,
-                data=repr(data)
-            )
+        super().__init__(data, property_name, name)
+        self.data = data
+        self.property_name = property_name
+        self.name = name
+
+    def render(self):
+        return 'cannot find \'{property_name}\' in {name} = {data}'.format(
+            property_name=self.property_name,
+            name=self.name,
+            data=self.represent(self.data)
         )
 
 class EnumerationException(SchemaException):
@@ -67,12 +123,16 @@ class EnumerationException(SchemaException):
     description: if the data not in the enumeration, raise this exception.
     """
     def __init__(self, data, enumeration, name):
-        super().__init__(
-            '{name} = {data}, does not in enumeration {enumeration}'.format(
-                name=name,
-                data=repr(data),
-                enumeration=repr(enumeration)
-            )
+        super().__init__(data, enumeration, name)
+        self.data = data
+        self.enumeration = enumeration
+        self.name = name
+
+    def render(self):
+        return '{name} = {data}, does not in enumeration {enumeration}'.format(
+            name=self.name,
+            data=self.represent(self.data),
+            enumeration=self.represent(self.enumeration)
         )
 
 class InvalidPropertyException(SchemaException):
@@ -82,12 +142,16 @@ class InvalidPropertyException(SchemaException):
         and the additional_properities is False, raise this exception.
     """
     def __init__(self, data, property_names, name):
-        super().__init__(
-            'property \'{property_names}\' in {name} = {data} is not allowed'.format(
-                property_names=', '.join(property_names),
-                name=name,
-                data=repr(data)
-            )
+        super().__init__(data, property_names, name)
+        self.data = data
+        self.property_names = property_names
+        self.name = name
+
+    def render(self):
+        return 'property \'{property_names}\' in {name} = {data} is not allowed'.format(
+            property_names=', '.join(str(item) for item in self.property_names),
+            name=self.name,
+            data=self.represent(self.data)
         )
 
 class DependenciesException(SchemaException):
@@ -96,27 +160,83 @@ class DependenciesException(SchemaException):
         if dependencies of a property do not exist, raise this exception.
     """
     def __init__(self, data, property_name, name, nonexistent_dependencies):
-        super().__init__(
-            'property \'{property_name}\' depends on {nonexistent_dependencies}, ' \
+        super().__init__(data, property_name, name, nonexistent_dependencies)
+        self.data = data
+        self.property_name = property_name
+        self.name = name
+        self.nonexistent_dependencies = nonexistent_dependencies
+
+    def render(self):
+        return 'property \'{property_name}\' depends on {nonexistent_dependencies}, ' \
             'but {nonexistent_dependencies} does not in {name} = {data}'.format(
-                property_name=property_name,
-                name=name,
-                data=repr(data),
-                nonexistent_dependencies=', '.join(repr(item) for item in nonexistent_dependencies)
+                property_name=self.property_name,
+                name=self.name,
+                data=self.represent(self.data),
+                nonexistent_dependencies=', '.join(
+                    repr(item) for item in self.nonexistent_dependencies
+                )
             )
-        )
 
 class RegexPatternException(SchemaException):
     """
     description: if the string does not match the pattern, raise this exception.
     """
     def __init__(self, data, pattern, name):
-        super().__init__(
-            '{name} = {data}, does not match the regex \'{pattern}\''.format(
-                name=name,
-                data=repr(data),
-                pattern=pattern
-            )
+        super().__init__(data, pattern, name)
+        self.data = data
+        self.pattern = pattern
+        self.name = name
+
+    def render(self):
+        return '{name} = {data}, does not match the regex \'{pattern}\''.format(
+            name=self.name,
+            data=self.represent(self.data),
+            pattern=self.pattern
+        )
+
+class InvalidRegexPatternException(SchemaException):
+    """
+    description: if the pattern of schema cannot be compiled, raise this exception.
+    """
+    def __init__(self, pattern, message):
+        super().__init__(pattern, message)
+        self.pattern = pattern
+        self.message = message
+
+    def render(self):
+        return 'cannot compile the regex \'{pattern}\', {message}'.format(
+            pattern=self.pattern,
+            message=self.message
+        )
+
+class InvalidReferenceException(SchemaException):
+    """
+    description: if the reference of schema cannot be resolved, raise this exception.
+    """
+    def __init__(self, reference, reason):
+        super().__init__(reference, reason)
+        self.reference = reference
+        self.reason = reason
+
+    def render(self):
+        return 'cannot resolve the reference {reference}, {reason}'.format(
+            reference=self.represent(self.reference),
+            reason=self.reason
+        )
+
+class InvalidSampleException(SchemaException):
+    """
+    description: if the sample field of schema is invalid, raise this exception.
+    """
+    def __init__(self, sample, reason):
+        super().__init__(sample, reason)
+        self.sample = sample
+        self.reason = reason
+
+    def render(self):
+        return 'invalid sample {sample}, {reason}'.format(
+            sample=self.represent(self.sample),
+            reason=self.reason
         )
 
 class NonstringTypeHasPatternException(SchemaException):
@@ -125,10 +245,12 @@ class NonstringTypeHasPatternException(SchemaException):
         if the schema type does not contain str, but it has pattern field, raise this exception.
     """
     def __init__(self, schema):
-        super().__init__(
-            'non-string schema {schema} should not have pattern field'.format(
-                schema=schema
-            )
+        super().__init__(schema)
+        self.schema = schema
+
+    def render(self):
+        return 'non-string schema {schema} should not have pattern field'.format(
+            schema=self.represent(self.schema)
         )
 
 class ExceedMaximumException(SchemaException):
@@ -136,14 +258,18 @@ class ExceedMaximumException(SchemaException):
     description: if the data exceeds the maximum, raise this exception.
     """
     def __init__(self, data, maximum, exclusive_maximum, name):
-        operator = '<' if exclusive_maximum else '<='
-        super().__init__(
-            '{name} = {data}, which should {operator} {maximum}'.format(
-                name=name,
-                data=repr(data),
-                operator=operator,
-                maximum=maximum
-            )
+        super().__init__(data, maximum, exclusive_maximum, name)
+        self.data = data
+        self.maximum = maximum
+        self.exclusive_maximum = exclusive_maximum
+        self.name = name
+
+    def render(self):
+        return '{name} = {data}, which should {operator} {maximum}'.format(
+            name=self.name,
+            data=self.represent(self.data),
+            operator='<' if self.exclusive_maximum else '<=',
+            maximum=self.maximum
         )
 
 class ExceedMinimumException(SchemaException):
@@ -151,14 +277,18 @@ class ExceedMinimumException(SchemaException):
     description: if the data exceeds the minimum, raise this exception.
     """
     def __init__(self, data, minimum, exclusive_minimum, name):
-        operator = '>' if exclusive_minimum else '>='
-        super().__init__(
-            '{name} = {data}, which should {operator} {minimum}'.format(
-                name=name,
-                data=repr(data),
-                operator=operator,
-                minimum=minimum
-            )
+        super().__init__(data, minimum, exclusive_minimum, name)
+        self.data = data
+        self.minimum = minimum
+        self.exclusive_minimum = exclusive_minimum
+        self.name = name
+
+    def render(self):
+        return '{name} = {data}, which should {operator} {minimum}'.format(
+            name=self.name,
+            data=self.represent(self.data),
+            operator='>' if self.exclusive_minimum else '>=',
+            minimum=self.minimum
         )
 
 class LengthRangeException(SchemaException):
@@ -166,16 +296,21 @@ class LengthRangeException(SchemaException):
     description: if the length of data is wrong, raise this exception.
     """
     def __init__(self, data, minimum_length, maximum_length, name):
-        super().__init__(
-            '{name} = {data}, its length is {length}, but it should '
+        super().__init__(data, minimum_length, maximum_length, name)
+        self.data = data
+        self.minimum_length = minimum_length
+        self.maximum_length = maximum_length
+        self.name = name
+
+    def render(self):
+        return '{name} = {data}, its length is {length}, but it should ' \
             'between {minimum_length} and {maximum_length}'.format(
-                name=name,
-                data=repr(data),
-                length=len(data),
-                maximum_length=maximum_length,
-                minimum_length=minimum_length
+                name=self.name,
+                data=self.represent(self.data),
+                length=len(self.data),
+                maximum_length=self.maximum_length,
+                minimum_length=self.minimum_length
             )
-        )
 
 class MultipleOfException(SchemaException):
     """
@@ -183,10 +318,14 @@ class MultipleOfException(SchemaException):
     """
 
     def __init__(self, data, name, multiple_of):
-        super().__init__(
-            '{name} = {data}, should be multiple of {multiple_of}, but it is not'.format(
-                name=name,
-                data=repr(data),
-                multiple_of=multiple_of
-            )
+        super().__init__(data, name, multiple_of)
+        self.data = data
+        self.name = name
+        self.multiple_of = multiple_of
+
+    def render(self):
+        return '{name} = {data}, should be multiple of {multiple_of}, but it is not'.format(
+            name=self.name,
+            data=self.represent(self.data),
+            multiple_of=self.multiple_of
         )
@@ -27,3 +27,15 @@ class InvalidYamlException(FastTornadoBaseException):
     """
     description: if the yaml is invalid, raise this exception.
     """
+
+class InvalidJsonException(FastTornadoBaseException):
+    """
+    description: if the json is invalid, raise this exception.
+    """
+    def __init__(self, message, position):
+        super().__init__(
+            'invalid json at position {position}, {message}'.format(
+                position=position,
+                message=message
+            )
+        )
@@ -4,3 +4,4 @@ description: this module provides some common functions for ``fast_tornado``.
 
 from .wrap_text import wrap_text
 from .load_yaml import load_yaml
+from .iterate_json import iterate_json
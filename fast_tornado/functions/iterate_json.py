@@ -0,0 +1,257 @@
+"""
+description: this module provides the function iterate_json.
+"""
+
+import re
+import codecs
+import json.decoder
+
+from fast_tornado.constants import JSON_EVENT
+from fast_tornado.constants import ENCODE
+from fast_tornado.exceptions import InvalidJsonException
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+NUMBER = re.compile(r'(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?')
+NUMBER_LOOKAHEAD = len('e+1')
+STRING = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+LITERALS = {
+    'true': True,
+    'false': False,
+    'null': None,
+    'NaN': float('nan'),
+    'Infinity': float('inf'),
+    '-Infinity': float('-inf'),
+}
+LITERAL_INITIALS = {literal[0] for literal in LITERALS}
+MAXIMUM_LITERAL_LENGTH = max(len(literal) for literal in LITERALS)
+
+# the states of the tokenizer, which describe the expected next token.
+VALUE = 'value'
+VALUE_OR_END = 'value or end'
+KEY = 'key'
+KEY_OR_END = 'key or end'
+COLON = 'colon'
+COMMA_OR_END = 'comma or end'
+DONE = 'done'
+
+def __iterate_chunks(stream, chunk_size):
+    if isinstance(stream, (str, bytes, bytearray)):
+        yield stream
+        return
+
+    if hasattr(stream, 'read'):
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    yield from stream
+
+class Buffer:
+    """
+    description: |
+        this class holds the decoded but unconsumed text of the stream,
+        the consumed text is dropped when more text is read.
+    """
+
+    def __init__(self, chunks):
+        self.__chunks = chunks
+        self.__decoder = codecs.getincrementaldecoder(ENCODE.UTF8)()
+        self.text = ''
+        self.position = 0
+        self.offset = 0
+        self.final = False
+
+    def read(self):
+        """
+        description: |
+            this function is used to read more text, at least as much as the unconsumed text,
+            so that a long token spanning many chunks is scanned a logarithmic number of times.
+            it returns False if the stream is exhausted.
+        """
+        if self.final:
+            return False
+
+        text = self.text[self.position:]
+        self.offset += self.position
+        self.position = 0
+        pieces = [text]
+        length = 0
+
+        while True:
+            try:
+                chunk = next(self.__chunks)
+            except StopIteration:
+                pieces.append(self.__decoder.decode(b'', final=True))
+                self.final = True
+                break
+
+            piece = chunk if isinstance(chunk, str) else self.__decoder.decode(chunk)
+            pieces.append(piece)
+            length += len(piece)
+            if length >= len(text):
+                break
+
+        self.text = ''.join(pieces)
+        return True
+
+    def error(self, message):
+        """
+        description: this function is used to get InvalidJsonException at current position.
+        """
+        return InvalidJsonException(message=message, position=self.offset + self.position)
+
+    def fail(self, message):
+        """
+        description: this function is used to raise InvalidJsonException at current position.
+        """
+        raise self.error(message)
+
+def __read_string(buffer):
+    while not STRING.match(buffer.text, buffer.position + 1):
+        if not buffer.read():
+            buffer.fail('unterminated string')
+
+    try:
+        value, end = json.decoder.scanstring(buffer.text, buffer.position + 1, True)
+    except json.decoder.JSONDecodeError as exception:
+        raise buffer.error(exception.msg) from None
+
+    buffer.position = end
+    return value
+
+def __read_number(buffer):
+    while True:
+        match = NUMBER.match(buffer.text, buffer.position)
+        if match is None:
+            # a lonely minus sign at the end of the text may be followed by digits.
+            if len(buffer.text) - buffer.position < 2 and buffer.read():
+                continue
+            character = buffer.text[buffer.position]
+            buffer.fail('unexpected character {character}'.format(character=repr(character)))
+
+        # an incomplete fraction or exponent, such as '1.' or '1e+', is not matched by the regex,
+        # so the number is complete only if enough text follows it.
+        if len(buffer.text) - match.end() >= NUMBER_LOOKAHEAD or not buffer.read():
+            break
+
+    integer, fraction, exponent = match.groups()
+    buffer.position = match.end()
+    if fraction or exponent:
+        return float(integer + (fraction or '') + (exponent or ''))
+    return int(integer)
+
+def __read_literal(buffer):
+    while True:
+        rest = buffer.text[buffer.position:buffer.position + MAXIMUM_LITERAL_LENGTH]
+        for literal, value in LITERALS.items():
+            if rest.startswith(literal):
+                buffer.position += len(literal)
+                return True, value
+
+        if not any(literal.startswith(rest) for literal in LITERALS) or not buffer.read():
+            return False, None
+
+def __read_value(buffer):
+    character = buffer.text[buffer.position]
+    if character == '"':
+        return __read_string(buffer)
+
+    if character in LITERAL_INITIALS:
+        found, value = __read_literal(buffer)
+        if found:
+            return value
+
+    return __read_number(buffer)
+
+def iterate_json(stream, chunk_size=JSON_EVENT.CHUNK_SIZE):
+    """
+    description: |
+        this function is used to parse json incrementally, it yields events
+        (event, value) without building the whole document, the events are
+        start_map, map_key, end_map, start_array, end_array and value,
+        which are defined in fast_tornado.constants.JSON_EVENT.
+    arguments:
+        stream:
+            type: any
+            description: |
+                the json, which can be str, bytes, a file-like object with method read,
+                or an iterable of str or bytes chunks.
+        chunk_size:
+            type: int
+            description: the size of chunks read from a file-like object.
+    """
+    buffer = Buffer(__iterate_chunks(stream, chunk_size))
+    stack = list()
+    state = VALUE
+
+    while True:
+        buffer.position = WHITESPACE.match(buffer.text, buffer.position).end()
+        if buffer.position == len(buffer.text):
+            if buffer.read():
+                continue
+            if state != DONE:
+                buffer.fail('unexpected end of json')
+            return
+
+        character = buffer.text[buffer.position]
+
+        if state == DONE:
+            buffer.fail('extra data')
+
+        if state in (KEY, KEY_OR_END):
+            if character == '}' and state == KEY_OR_END:
+                buffer.position += 1
+                stack.pop()
+                yield JSON_EVENT.END_MAP, None
+                state = COMMA_OR_END if stack else DONE
+            elif character == '"':
+                yield JSON_EVENT.MAP_KEY, __read_string(buffer)
+                state = COLON
+            else:
+                buffer.fail('expecting property name enclosed in double quotes')
+            continue
+
+        if state == COLON:
+            if character != ':':
+                buffer.fail("expecting ':' delimiter")
+            buffer.position += 1
+            state = VALUE
+            continue
+
+        if state == COMMA_OR_END:
+            buffer.position += 1
+            if character == ',':
+                state = KEY if stack[-1] == JSON_EVENT.START_MAP else VALUE
+            elif character == '}' and stack[-1] == JSON_EVENT.START_MAP:
+                stack.pop()
+                yield JSON_EVENT.END_MAP, None
+                state = COMMA_OR_END if stack else DONE
+            elif character == ']' and stack[-1] == JSON_EVENT.START_ARRAY:
+                stack.pop()
+                yield JSON_EVENT.END_ARRAY, None
+                state = COMMA_OR_END if stack else DONE
+            else:
+                buffer.position -= 1
+                buffer.fail("expecting ',' delimiter")
+            continue
+
+        if character == ']' and state == VALUE_OR_END:
+            buffer.position += 1
+            stack.pop()
+            yield JSON_EVENT.END_ARRAY, None
+            state = COMMA_OR_END if stack else DONE
+        elif character == '{':
+            buffer.position += 1
+            stack.append(JSON_EVENT.START_MAP)
+            yield JSON_EVENT.START_MAP, None
+            state = KEY_OR_END
+        elif character == '[':
+            buffer.position += 1
+            stack.append(JSON_EVENT.START_ARRAY)
+            yield JSON_EVENT.START_ARRAY, None
+            state = VALUE_OR_END
+        else:
+            yield JSON_EVENT.VALUE, __read_value(buffer)
+            state = COMMA_OR_END if stack else DONE
@@ -1,5 +1,26 @@
 """
-description: this module provides the function check_schema.
+description: |
+    this module provides the functions check_schema, compile_schema, check_many, check_stream,
+    check_changes, coerce_and_check and check_schema_async.
 """
 
 from .check_schema import check_schema
+from .check_schema import SCHEMA_CACHE
+from .compile_schema import compile_schema
+from .check_many import check_many
+from .check_stream import check_stream
+from .check_changes import check_changes
+from .coerce_and_check import coerce_and_check
+from .check_schema_async import check_schema_async
+from .compile_assertion import ASSERTION_CACHE
+from .initialize_schema import DEFINITION_CACHE
+from .register_type import register_type
+from .register_type import resolve_type
+from .register_type import TYPE_REGISTRY
+from .schema_node import SchemaNode
+from .validator import Validator
+from .code_validator import CodeValidator
+from .lru_cache import LRUCache
+from .schema_profiler import SchemaProfiler
+from .sample_items import SAMPLE_COUNTER
+from .optimize_checks import report_optimizations
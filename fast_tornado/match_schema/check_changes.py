@@ -0,0 +1,158 @@
+"""
+description: this module provides the function check_changes.
+"""
+
+from fast_tornado.constants import MATCH_SCHEMA
+from fast_tornado.exceptions import CannotFindPropertyException
+from fast_tornado.exceptions import InvalidPropertyException
+from fast_tornado.exceptions import DependenciesException
+from fast_tornado.exceptions import LengthRangeException
+
+from .check_schema import get_validator
+from .schema_node import SchemaNode
+from .validator import Validator
+from .validator import render_name
+
+# these checks visit the children of data, they are replaced by the checks of the changed children.
+RECURSIVE_CHECKS = {'properties', 'dict_type_items', 'list_type_items'}
+
+def __build_tree(paths):
+    # the tree maps a key to the tree of its changed children, None means the whole subtree
+    # is changed.
+    tree = dict()
+    for path in paths:
+        path = list(path)
+        if not path:
+            return None
+
+        current = tree
+        for key in path[:-1]:
+            if key in current and current[key] is None:
+                break
+            current = current.setdefault(key, dict())
+        else:
+            current[path[-1]] = None
+    return tree
+
+def __check_presence(data, schema, path):
+    for property_name, property_schema in schema.properties.items():
+        if property_name not in data:
+            if property_schema.required:
+                raise CannotFindPropertyException(
+                    data=data, property_name=property_name, name=render_name(path)
+                )
+            continue
+
+        dependencies = property_schema.dependencies
+        for dependency in dependencies:
+            if dependency in data:
+                continue
+
+            raise DependenciesException(
+                data=data,
+                name=render_name(path),
+                property_name=property_name,
+                nonexistent_dependencies=sorted(set(dependencies) - data.keys())
+            )
+
+def __check_dict(validator, schema, data, tree, path):
+    if schema.items is not None:
+        # the items of a dict are checked by the enumeration of its keys, check them all.
+        validator.check_node(schema, data, path)
+        return
+
+    properties = schema.properties
+    if properties is None:
+        return
+
+    __check_presence(data, schema, path)
+    for key, subtree in tree.items():
+        if key not in data:
+            continue
+
+        if key in properties:
+            path.append(key)
+            __check_changes(validator, properties[key], data[key], subtree, path)
+            path.pop()
+        elif not schema.additional_properities:
+            raise InvalidPropertyException(
+                data=data,
+                property_names=sorted(set(data) - properties.keys()),
+                name=render_name(path)
+            )
+
+def __check_list(validator, schema, data, tree, path):
+    items_schema = schema.items
+    if items_schema is None:
+        return
+
+    if isinstance(items_schema, tuple) and not len(items_schema) == len(data):
+        raise LengthRangeException(
+            name=render_name(path),
+            data=data,
+            maximum_length=len(items_schema),
+            minimum_length=len(items_schema)
+        )
+
+    subtrees = dict()
+    for key, subtree in tree.items():
+        if isinstance(key, bool) or not isinstance(key, int):
+            # the key is not an index of the list, so the changed item is unknown, check all items.
+            validator.check_node(schema, data, path)
+            return
+
+        # the negative indices count from the end, the indices out of range are deleted items.
+        index = key + len(data) if key < 0 else key
+        if 0 <= index < len(data):
+            subtrees.setdefault(index, list()).append(subtree)
+
+    for index in sorted(subtrees):
+        item_schema = items_schema if isinstance(items_schema, SchemaNode) else items_schema[index]
+        path.append(index)
+        for subtree in subtrees[index]:
+            __check_changes(validator, item_schema, data[index], subtree, path)
+        path.pop()
+
+def __check_changes(validator, schema, data, tree, path):
+    if tree is None or not isinstance(data, (dict, list, tuple)):
+        validator.check_node(schema, data, path)
+        return
+
+    for check in schema.checks:
+        if check not in RECURSIVE_CHECKS:
+            Validator.CHECKS[check](validator, data, schema, path)
+
+    if isinstance(data, dict):
+        __check_dict(validator, schema, data, tree, path)
+    else:
+        __check_list(validator, schema, data, tree, path)
+
+def check_changes(schema, data, paths, name='data'):
+    """
+    description: |
+        this function is used to check a document, which matched the schema before it was changed,
+        only the changed subtrees and the containers on the way to them are checked.
+        the changed subtrees are checked completely, the containers on the way are checked by their
+        own constraints, such as type, assertion and length, and by required, dependencies and
+        additional_properities of their properties, but their unchanged children are not visited.
+        a path of a deleted key or index is also a changed path, if an item is inserted into or
+        removed from a list, all the items after it are changed. a negative index counts from the
+        end of the list, and a key of a list, which is not an index, changes the whole list.
+        the result is the same as check_schema if the paths cover all changes, but if there are
+        several errors, another one may be reported.
+    arguments:
+        schema:
+            type: str
+            description: the schema of data.
+        data:
+            type: any
+            description: the changed data.
+        paths:
+            type: list
+            description: the changed paths, each of them is a list of keys and indices.
+        name:
+            type: str
+            description: the name of data, which is used in the exception message.
+    """
+    validator = get_validator(schema, MATCH_SCHEMA.WALKER)
+    __check_changes(validator, validator.schema, data, __build_tree(paths), [name])
@@ -0,0 +1,89 @@
+"""
+description: this module provides the function check_many.
+"""
+
+import itertools
+import collections
+import concurrent.futures
+
+from fast_tornado.constants import MATCH_SCHEMA
+from fast_tornado.exceptions import SchemaException
+
+from .check_schema import get_validator
+
+def __check_records(validator, records, name):
+    results = list()
+    for record in records:
+        try:
+            validator.validate(record, name)
+        except SchemaException as exception:
+            results.append(exception)
+        else:
+            results.append(None)
+    return results
+
+def __check_chunk(schema, backend, records, name):
+    return __check_records(get_validator(schema, backend), records, name)
+
+def __split(records, chunk_size):
+    iterator = iter(records)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def __check_in_process(validator, records, name, chunk_size):
+    for chunk in __split(records, chunk_size):
+        yield from __check_records(validator, chunk, name)
+
+def __check_in_pool(schema, backend, records, name, workers, chunk_size):
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = collections.deque()
+        for chunk in __split(records, chunk_size):
+            futures.append(executor.submit(__check_chunk, schema, backend, chunk, name))
+            # keep a bounded number of chunks in flight, so that records are consumed lazily.
+            if len(futures) >= 2 * workers:
+                yield from futures.popleft().result()
+
+        while futures:
+            yield from futures.popleft().result()
+
+def check_many(schema, records, name='data', workers=None, chunk_size=None, backend=None):
+    """
+    description: |
+        this function is used to check a batch of records against the same schema.
+        the schema is compiled once, the records are consumed lazily from any iterable,
+        and the results are yielded in the order of the records, None if the record matches
+        the schema, otherwise the exception raised by the record.
+        if workers is greater than 1, the records are split into chunks, which are checked
+        in a process pool, each worker process compiles the schema once.
+    arguments:
+        schema:
+            type: str
+            description: the schema of every record.
+        records:
+            type: any
+            description: the iterable of records.
+        name:
+            type: str
+            description: the name of every record, which is used in the exception message.
+        workers:
+            type: [int, None]
+            description: the number of worker processes, None or 1 means checking in this process.
+        chunk_size:
+            type: [int, None]
+            description: the number of records in a chunk, the default is MATCH_SCHEMA.CHUNK_SIZE.
+        backend:
+            type: [str, None]
+            description: the backend of the validator, the default is MATCH_SCHEMA.BACKEND.
+    """
+    backend = MATCH_SCHEMA.BACKEND if backend is None else backend
+    chunk_size = MATCH_SCHEMA.CHUNK_SIZE if chunk_size is None else chunk_size
+
+    # compile the schema in this process first, so that invalid schemas are reported here.
+    validator = get_validator(schema, backend)
+
+    if workers is None or workers <= 1:
+        return __check_in_process(validator, records, name, chunk_size)
+    return __check_in_pool(schema, backend, records, name, workers, chunk_size)
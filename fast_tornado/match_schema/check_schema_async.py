@@ -0,0 +1,63 @@
+"""
+description: this module provides the function check_schema_async.
+"""
+
+import asyncio
+
+from fast_tornado.constants import MATCH_SCHEMA
+from fast_tornado.exceptions import InvalidArgumentsException
+
+from .check_schema import get_validator
+from .validator import Validator
+
+def __is_positive(value, types):
+    return not isinstance(value, bool) and isinstance(value, types) and value > 0
+
+def __check_budget(slice_size, slice_time):
+    if slice_size is not None and not __is_positive(slice_size, int):
+        raise InvalidArgumentsException(
+            function_name='check_schema_async',
+            message='the slice_size should be a positive int'
+        )
+
+    if slice_time is not None and not __is_positive(slice_time, (int, float)):
+        raise InvalidArgumentsException(
+            function_name='check_schema_async',
+            message='the slice_time should be a positive number'
+        )
+
+async def check_schema_async(schema, data, name='data', slice_size=None, slice_time=None):
+    """
+    description: |
+        this function is a coroutine, which checks whether does the data match the schema like
+        check_schema, but it yields to the event loop between slices of the validation, so that
+        a large document does not block the other requests served by the same ioloop.
+        a slice ends after slice_size nodes of data are visited, or after slice_time seconds,
+        if neither of them is given, MATCH_SCHEMA.SLICE_TIME is used.
+        the data is checked by the walker, one node per step, so it is slower than check_schema
+        in total, and the data should not be changed until the coroutine is done.
+    arguments:
+        schema:
+            type: str
+            description: the schema of data.
+        data:
+            type: any
+            description: the data.
+        name:
+            type: str
+            description: the name of data, which is used in the exception message.
+        slice_size:
+            type: [int, None]
+            description: the maximum number of nodes visited in a slice.
+        slice_time:
+            type: [float, None]
+            description: the maximum time of a slice in seconds.
+    """
+    __check_budget(slice_size, slice_time)
+    if slice_size is None and slice_time is None:
+        slice_time = MATCH_SCHEMA.SLICE_TIME
+
+    compiled = get_validator(schema, MATCH_SCHEMA.WALKER)
+    validator = Validator(compiled.schema, memo=compiled.memo, sliced=True)
+    for _ in validator.validate_in_slices(data, name, slice_size, slice_time):
+        await asyncio.sleep(0)
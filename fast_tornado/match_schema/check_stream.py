@@ -0,0 +1,337 @@
+"""
+description: this module provides the function check_stream.
+"""
+
+from fast_tornado.constants import JSON_EVENT
+from fast_tornado.constants import MATCH_SCHEMA
+from fast_tornado.functions import iterate_json
+
+from fast_tornado.exceptions import InvalidJsonException
+from fast_tornado.exceptions import TypeMismatchException
+from fast_tornado.exceptions import CannotFindPropertyException
+from fast_tornado.exceptions import InvalidPropertyException
+from fast_tornado.exceptions import DependenciesException
+from fast_tornado.exceptions import LengthRangeException
+
+from .check_schema import get_validator
+from .initialize_schema import resolve_types
+from .schema_node import SchemaNode
+from .validator import render_name
+
+# the fields, which need the whole value of a container to be checked.
+MATERIALIZED_FIELDS = ('assertion', 'enumeration', 'pattern', 'maximum', 'minimum', 'multiple_of')
+CONTAINER_TYPES = {
+    JSON_EVENT.START_MAP: dict,
+    JSON_EVENT.START_ARRAY: list,
+}
+END_EVENTS = {JSON_EVENT.END_MAP, JSON_EVENT.END_ARRAY}
+
+class DiscardedContainer:
+    """
+    description: |
+        this class stands for a container, whose items have been discarded after validation,
+        only its type and length are kept, it is used as the data of exceptions.
+    """
+
+    __slots__ = ('type', 'length')
+
+    def __init__(self, container_type, length):
+        self.type = container_type
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        return '{...}' if self.type is dict else '[...]'
+
+class StreamChecker:
+    """
+    description: |
+        this class checks the events of iterate_json against the schema.
+        the containers are checked by generators, which yield their children and receive the checked
+        children, the generators are kept in an explicit stack, so the depth of the document is not
+        limited by the recursion limit of python.
+    """
+
+    def __init__(self, validator, events, keep):
+        self.__validator = validator
+        self.__events = events
+        self.__keep = keep
+
+    def check(self, name):
+        """
+        description: this function is used to check the json document, and return it if it is kept.
+        """
+        event, value = self.__next_event()
+        path = [name]
+        frame, data = self.__check_value(self.__validator.schema, event, value, path)
+
+        stack = list() if frame is None else [frame]
+        while stack:
+            try:
+                child = stack[-1].send(data)
+            except StopIteration as stop:
+                stack.pop()
+                data = stop.value
+                continue
+
+            frame, data = self.__check_value(child[0], child[1], child[2], path)
+            if frame is not None:
+                stack.append(frame)
+
+        for _ in self.__events:
+            pass
+        return data
+
+    @staticmethod
+    def __fail_at_end():
+        # iterate_json reports a truncated document by itself, but the events must never end
+        # early silently, and StopIteration must not be raised in the generators of containers.
+        raise InvalidJsonException(message='unexpected end of json', position='the end')
+
+    def __next_event(self):
+        pair = next(self.__events, None)
+        if pair is None:
+            self.__fail_at_end()
+        return pair
+
+    def __check_value(self, schema, event, value, path):
+        # the result is a pair of the generator, which checks the container, and the checked value,
+        # the generator is None if the value has been checked.
+        if event == JSON_EVENT.VALUE:
+            self.__validator.check_node(schema, value, path)
+            return None, value
+
+        if any(getattr(schema, field) is not None for field in MATERIALIZED_FIELDS):
+            data = self.__build(event)
+            self.__validator.check_node(schema, data, path)
+            return None, data
+
+        expected_types = schema.types
+        if expected_types is None:
+            expected_types = resolve_types(schema)
+
+        if not isinstance(CONTAINER_TYPES[event](), expected_types):
+            raise TypeMismatchException(
+                data=DiscardedContainer(CONTAINER_TYPES[event], 0),
+                expected_types=expected_types,
+                name=render_name(path)
+            )
+
+        if event == JSON_EVENT.START_MAP:
+            if isinstance(schema.items, tuple):
+                data = self.__build(event)
+                self.__validator.check_node(schema, data, path)
+                return None, data
+            return self.__check_map(schema, path), None
+        return self.__check_array(schema, path), None
+
+    def __check_map(self, schema, path):
+        properties = schema.properties
+        items_schema = schema.items
+        additional_properities = list()
+        forbid_additional_properities = properties is not None and not schema.additional_properities
+
+        watched_keys = set(properties or dict())
+        for property_schema in (properties or dict()).values():
+            watched_keys.update(property_schema.dependencies)
+        present_keys = set()
+
+        data = dict() if self.__keep else None
+        length = 0
+
+        path.append(None)
+        for event, key in self.__events:
+            if event == JSON_EVENT.END_MAP:
+                break
+
+            if isinstance(items_schema, SchemaNode):
+                path[-1] = length
+                self.__validator.check_node(items_schema, key, path)
+            length += 1
+
+            if key in watched_keys:
+                present_keys.add(key)
+
+            event, value = self.__next_event()
+            path[-1] = key
+            if properties is not None and key in properties:
+                value = yield properties[key], event, value
+            else:
+                if forbid_additional_properities:
+                    additional_properities.append(key)
+                value = self.__skip(event, value)
+
+            if self.__keep:
+                data[key] = value
+        else:
+            self.__fail_at_end()
+        path.pop()
+
+        container = data if self.__keep else DiscardedContainer(dict, length)
+        self.__check_properties(properties or dict(), present_keys, container, path)
+
+        if additional_properities:
+            raise InvalidPropertyException(
+                data=container,
+                property_names=sorted(additional_properities),
+                name=render_name(path)
+            )
+
+        self.__check_length(schema, container, path)
+        return data
+
+    def __check_properties(self, properties, present_keys, container, path):
+        for property_name, property_schema in properties.items():
+            if property_name not in present_keys:
+                if property_schema.required:
+                    raise CannotFindPropertyException(
+                        data=container,
+                        property_name=property_name,
+                        name=render_name(path)
+                    )
+                continue
+
+            dependencies = property_schema.dependencies
+            if set(dependencies) <= present_keys:
+                continue
+
+            raise DependenciesException(
+                data=container,
+                name=render_name(path),
+                property_name=property_name,
+                nonexistent_dependencies=sorted(set(dependencies) - present_keys)
+            )
+
+    def __check_array(self, schema, path):
+        items_schema = schema.items
+        data = list() if self.__keep else None
+        length = 0
+
+        path.append(None)
+        for event, value in self.__events:
+            if event == JSON_EVENT.END_ARRAY:
+                break
+
+            path[-1] = length
+            if isinstance(items_schema, SchemaNode):
+                value = yield items_schema, event, value
+            elif isinstance(items_schema, tuple) and length < len(items_schema):
+                value = yield items_schema[length], event, value
+            else:
+                value = self.__skip(event, value)
+            length += 1
+
+            if self.__keep:
+                data.append(value)
+        else:
+            self.__fail_at_end()
+        path.pop()
+
+        container = data if self.__keep else DiscardedContainer(list, length)
+        if isinstance(items_schema, tuple) and length != len(items_schema):
+            raise LengthRangeException(
+                name=render_name(path),
+                data=container,
+                maximum_length=len(items_schema),
+                minimum_length=len(items_schema)
+            )
+
+        self.__check_length(schema, container, path)
+        return data
+
+    def __check_length(self, schema, container, path):
+        minimum_length = schema.minimum_length
+        maximum_length = schema.maximum_length
+
+        if minimum_length <= len(container) <= maximum_length:
+            return
+
+        raise LengthRangeException(
+            name=render_name(path),
+            data=container,
+            maximum_length=maximum_length,
+            minimum_length=minimum_length
+        )
+
+    def __skip(self, event, value):
+        if self.__keep:
+            return self.__build(event, value)
+
+        if event == JSON_EVENT.VALUE:
+            return value
+
+        depth = 1
+        for skipped_event, _ in self.__events:
+            if skipped_event in CONTAINER_TYPES:
+                depth += 1
+            elif skipped_event in END_EVENTS:
+                depth -= 1
+                if not depth:
+                    return None
+        return None
+
+    def __build(self, event, value=None):
+        if event == JSON_EVENT.VALUE:
+            return value
+
+        root = CONTAINER_TYPES[event]()
+        containers = [root]
+        keys = [None]
+        for item_event, item_value in self.__events:
+            if item_event == JSON_EVENT.MAP_KEY:
+                keys[-1] = item_value
+                continue
+
+            if item_event in END_EVENTS:
+                containers.pop()
+                keys.pop()
+                if not containers:
+                    return root
+                continue
+
+            item = CONTAINER_TYPES[item_event]() if item_event in CONTAINER_TYPES else item_value
+            if isinstance(containers[-1], dict):
+                containers[-1][keys[-1]] = item
+            else:
+                containers[-1].append(item)
+
+            if item_event in CONTAINER_TYPES:
+                containers.append(item)
+                keys.append(None)
+        return root
+
+def check_stream(schema, stream, name='data', keep=False):
+    """
+    description: |
+        this function is used to check a json document against the schema while parsing it,
+        without building the whole document first.
+        the values of containers are validated as soon as they are parsed, and discarded
+        afterwards unless keep is true, so that large documents are checked in constant memory.
+        containers, which have assertion, enumeration, pattern, maximum, minimum or multiple_of,
+        are built before they are checked.
+        errors are reported in the order of the document, and discarded containers are shown
+        as {...} or [...] in exception messages.
+        the field sample is ignored, all items are checked, since they have to be parsed anyway.
+    arguments:
+        schema:
+            type: str
+            description: the schema of data.
+        stream:
+            type: any
+            description: |
+                the json, which can be str, bytes, a file-like object with method read,
+                or an iterable of str or bytes chunks.
+        name:
+            type: str
+            description: the name of data, which is used in the exception message.
+        keep:
+            type: bool
+            description: whether to build and return the document.
+    return:
+        type: any
+        description: the document if keep is true, otherwise None.
+    """
+    validator = get_validator(schema, MATCH_SCHEMA.WALKER)
+    return StreamChecker(validator, iterate_json(stream), keep).check(name)
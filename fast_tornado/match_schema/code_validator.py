@@ -0,0 +1,502 @@
+"""
+description: this module provides the class CodeValidator.
+"""
+
+import math
+import itertools
+import collections.abc
+
+from fast_tornado.exceptions import TypeMismatchException
+from fast_tornado.exceptions import AssertionException
+from fast_tornado.exceptions import CannotFindPropertyException
+from fast_tornado.exceptions import EnumerationException
+from fast_tornado.exceptions import InvalidPropertyException
+from fast_tornado.exceptions import DependenciesException
+from fast_tornado.exceptions import RegexPatternException
+from fast_tornado.exceptions import ExceedMaximumException
+from fast_tornado.exceptions import ExceedMinimumException
+from fast_tornado.exceptions import LengthRangeException
+from fast_tornado.exceptions import MultipleOfException
+
+from .schema_node import SchemaNode
+from .validator import Validator
+from .vectorize import find_first_failure
+from .sample_items import sample_items
+from .memoize import is_memoizable
+from .memoize import get_memo_key
+
+FUNCTION_NAME = 'validate'
+INDENT = '    '
+MAXIMUM_INDENT = 64
+MAXIMUM_LOOPS = 16
+
+NAMESPACE = {
+    'math': math,
+    'Sized': collections.abc.Sized,
+    'islice': itertools.islice,
+    'find_first_failure': find_first_failure,
+    'sample_items': sample_items,
+    'get_memo_key': get_memo_key,
+    'TypeMismatchException': TypeMismatchException,
+    'AssertionException': AssertionException,
+    'CannotFindPropertyException': CannotFindPropertyException,
+    'EnumerationException': EnumerationException,
+    'InvalidPropertyException': InvalidPropertyException,
+    'DependenciesException': DependenciesException,
+    'RegexPatternException': RegexPatternException,
+    'ExceedMaximumException': ExceedMaximumException,
+    'ExceedMinimumException': ExceedMinimumException,
+    'LengthRangeException': LengthRangeException,
+    'MultipleOfException': MultipleOfException,
+}
+
+class CodeValidator(Validator):
+    """
+    description: |
+        this class turns the node tree of an initialized schema into specialised python source,
+        which contains only the checks used by the schema, and compiles it into a function.
+        each definition is generated as a separate function, which is called by all its references.
+        the name of data is only rendered when an exception is raised.
+    """
+
+    def __init__(self, schema, memo=None):
+        super().__init__(schema, memo=memo)
+        self.__lines = list()
+        self.__namespace = dict(NAMESPACE)
+        self.__counter = 0
+        self.__loops = 0
+        self.__definitions = dict()
+        self.__functions = list()
+
+        self.__emit(0, 'def {function}(data, name):'.format(function=FUNCTION_NAME))
+        self.__generate(schema, 'data', 'name', 1)
+        self.__emit(1, 'return None')
+        self.__functions.append(self.__lines)
+
+        self.__source = '\n\n'.join('\n'.join(lines) for lines in self.__functions) + '\n'
+        code = compile(self.__source, '<schema {id}>'.format(id=hex(id(schema))), 'exec')
+        exec(code, self.__namespace) # pylint: disable = exec-used
+        self.__function = self.__namespace[FUNCTION_NAME]
+
+    @property
+    def source(self):
+        """
+        description: this function is used to get the private member __source.
+        """
+        return self.__source
+
+    def validate(self, data, name='data'):
+        """
+        description: |
+            this function is used to check whether does the data match the schema.
+            if the data does not match the schema, this function will raise exception.
+        arguments:
+            data:
+                type: any
+                description: the data.
+            name:
+                type: str
+                description: the name of data, which is used in the exception message.
+        """
+        self.__function(data, name)
+
+    def __emit(self, indent, line):
+        self.__lines.append(INDENT * indent + line)
+
+    def __new_name(self, prefix):
+        self.__counter += 1
+        return '{prefix}_{counter}'.format(prefix=prefix, counter=self.__counter)
+
+    def __constant(self, value):
+        name = self.__new_name('constant')
+        self.__namespace[name] = value
+        return name
+
+    def __generate_definition(self, schema):
+        if schema.definition in self.__definitions:
+            return self.__definitions[schema.definition]
+
+        # the function is registered before its body is generated, so that recursive definitions
+        # call it.
+        function = self.__new_name('definition')
+        self.__definitions[schema.definition] = function
+
+        lines, loops = self.__lines, self.__loops
+        self.__lines, self.__loops = list(), 0
+        self.__emit(0, 'def {function}(data, name):'.format(function=function))
+        self.__generate_checks(schema, 'data', 'name', 1)
+        self.__emit(1, 'return None')
+        self.__functions.append(self.__lines)
+        self.__lines, self.__loops = lines, loops
+        return function
+
+    def __generate(self, schema, data, name, indent):
+        if schema.definition is not None:
+            function = self.__generate_definition(schema)
+            self.__emit(
+                indent,
+                '{function}({data}, {name})'.format(function=function, data=data, name=name)
+            )
+            return
+
+        self.__generate_checks(schema, data, name, indent)
+
+    def __generate_checks(self, schema, data, name, indent):
+        if schema.types is None or indent > MAXIMUM_INDENT or self.__loops >= MAXIMUM_LOOPS:
+            # the types of this node cannot be resolved yet, or the python compiler cannot nest
+            # the code any deeper, let the walker check this node.
+            walker = self.__constant(Validator(schema, memo=self.memo))
+            self.__emit(
+                indent,
+                '{walker}.validate({data}, {name})'.format(walker=walker, data=data, name=name)
+            )
+            return
+
+        if self.memo is not None and is_memoizable(schema):
+            self.__generate_memoized(schema, data, name, indent)
+            return
+
+        for check in schema.checks:
+            self.GENERATORS[check](self, schema, data, name, indent)
+
+    def __generate_memoized(self, schema, data, name, indent):
+        key = self.__new_name('key')
+        memo = self.__constant(self.memo)
+        self.__emit(
+            indent,
+            '{key} = get_memo_key({schema}, {data})'.format(
+                key=key, schema=self.__constant(schema), data=data
+            )
+        )
+        self.__emit(
+            indent,
+            'if {key} is None or not {memo}.contains({key}):'.format(key=key, memo=memo)
+        )
+        for check in schema.checks:
+            self.GENERATORS[check](self, schema, data, name, indent + 1)
+        self.__emit(indent + 1, 'if {key} is not None:'.format(key=key))
+        self.__emit(indent + 2, '{memo}.add({key})'.format(key=key, memo=memo))
+
+    def __generate_type(self, schema, data, name, indent):
+        if object in schema.types:
+            return
+
+        expected_types = self.__constant(schema.types)
+        self.__emit(
+            indent,
+            'if not isinstance({data}, {types}):'.format(data=data, types=expected_types)
+        )
+        self.__emit(
+            indent + 1,
+            'raise TypeMismatchException(data={data}, expected_types={types}, name={name})'.format(
+                data=data, types=expected_types, name=name
+            )
+        )
+
+    def __generate_assertion(self, schema, data, name, indent):
+        if schema.assertion_function is None:
+            return
+
+        function = self.__constant(schema.assertion_function)
+        assertion = self.__constant(schema.assertion)
+        self.__emit(indent, 'if not {function}({data}):'.format(function=function, data=data))
+        self.__emit(
+            indent + 1,
+            'raise AssertionException(data={data}, assertion={assertion}, name={name})'.format(
+                data=data, assertion=assertion, name=name
+            )
+        )
+
+    def __generate_properties(self, schema, data, name, indent):
+        if schema.properties is None:
+            return
+
+        for property_name, property_schema in schema.properties.items():
+            key = self.__constant(property_name)
+            self.__emit(indent, 'if {key} in {data}:'.format(key=key, data=data))
+
+            if property_schema.dependencies:
+                self.__generate_dependencies(
+                    property_schema.dependencies, key, data, name, indent + 1
+                )
+
+            value = self.__new_name('value')
+            self.__emit(
+                indent + 1,
+                '{value} = {data}[{key}]'.format(value=value, data=data, key=key)
+            )
+            suffix = repr('[{key}]'.format(key=repr(property_name)))
+            self.__generate(
+                property_schema,
+                value,
+                '{name} + {suffix}'.format(name=name, suffix=suffix),
+                indent + 1
+            )
+
+            if property_schema.required:
+                self.__emit(indent, 'else:')
+                self.__emit(
+                    indent + 1,
+                    'raise CannotFindPropertyException('
+                    'data={data}, property_name={key}, name={name})'.format(
+                        data=data, key=key, name=name
+                    )
+                )
+
+        if schema.additional_properities:
+            return
+
+        keys = self.__constant(frozenset(schema.properties))
+        additional_properities = self.__new_name('additional_properities')
+        self.__emit(
+            indent,
+            '{additional} = sorted(set({data}) - {keys})'.format(
+                additional=additional_properities, data=data, keys=keys
+            )
+        )
+        self.__emit(indent, 'if {additional}:'.format(additional=additional_properities))
+        self.__emit(
+            indent + 1,
+            'raise InvalidPropertyException('
+            'data={data}, property_names={additional}, name={name})'.format(
+                data=data, additional=additional_properities, name=name
+            )
+        )
+
+    def __generate_dependencies(self, dependencies, key, data, name, indent):
+        dependencies = self.__constant(dependencies)
+        self.__emit(
+            indent,
+            'if not all(dependency in {data} for dependency in {dependencies}):'.format(
+                data=data, dependencies=dependencies
+            )
+        )
+        self.__emit(
+            indent + 1,
+            'raise DependenciesException(data={data}, name={name}, property_name={key}, '
+            'nonexistent_dependencies=sorted(set({dependencies}) - {data}.keys()))'.format(
+                data=data, name=name, key=key, dependencies=dependencies
+            )
+        )
+
+    def __generate_dict_type_items(self, schema, data, name, indent):
+        items_schema = schema.items
+        if not isinstance(items_schema, SchemaNode):
+            return
+
+        index = self.__new_name('index')
+        item = self.__new_name('item')
+        if schema.sample is not None:
+            self.__emit(
+                indent,
+                'for {index}, {item} in sample_items({schema}, {data}):'.format(
+                    index=index, item=item, schema=self.__constant(schema), data=data
+                )
+            )
+        elif items_schema.vectorizable:
+            start = self.__new_name('start')
+            self.__emit(
+                indent,
+                '{start} = find_first_failure({schema}, {data})'.format(
+                    start=start, schema=self.__constant(items_schema), data=data
+                )
+            )
+            self.__emit(
+                indent,
+                'for {index}, {item} in enumerate(islice({data}, {start}, None), {start}):'.format(
+                    index=index, item=item, data=data, start=start
+                )
+            )
+        else:
+            self.__emit(
+                indent,
+                'for {index}, {item} in enumerate({data}):'.format(
+                    index=index, item=item, data=data
+                )
+            )
+        self.__loops += 1
+        size = len(self.__lines)
+        self.__generate(
+            items_schema,
+            item,
+            "{name} + '[' + repr({index}) + ']'".format(name=name, index=index),
+            indent + 1
+        )
+        if len(self.__lines) == size:
+            # the items have no check, such as the items of any type, but the loop needs a body.
+            self.__emit(indent + 1, 'pass')
+        self.__loops -= 1
+
+    def __generate_list_type_items(self, schema, data, name, indent):
+        items_schema = schema.items
+        if not isinstance(items_schema, tuple):
+            return
+
+        length = len(items_schema)
+        self.__emit(indent, 'if len({data}) != {length}:'.format(data=data, length=length))
+        self.__emit(
+            indent + 1,
+            'raise LengthRangeException(name={name}, data={data}, maximum_length={length}, '
+            'minimum_length={length})'.format(name=name, data=data, length=length)
+        )
+
+        if not items_schema:
+            return
+
+        items = [self.__new_name('item') for _ in items_schema]
+        self.__emit(indent, '{items}, = {data}'.format(items=', '.join(items), data=data))
+        for index, (item_schema, item) in enumerate(zip(items_schema, items)):
+            self.__generate(
+                item_schema,
+                item,
+                '{name} + {suffix}'.format(
+                    name=name, suffix=repr('[{index}]'.format(index=repr(index)))
+                ),
+                indent
+            )
+
+    def __generate_enumeration(self, schema, data, name, indent):
+        if schema.enumeration is None:
+            return
+
+        enumeration = self.__constant(schema.enumeration)
+        if schema.enumeration_members is schema.enumeration:
+            self.__emit(
+                indent,
+                'if {data} not in {enumeration}:'.format(data=data, enumeration=enumeration)
+            )
+        else:
+            members = self.__constant(schema.enumeration_members)
+            missing = self.__new_name('missing')
+            self.__emit(indent, 'try:')
+            self.__emit(
+                indent + 1,
+                '{missing} = {data} not in {members}'.format(
+                    missing=missing, data=data, members=members
+                )
+            )
+            self.__emit(indent, 'except TypeError:')
+            self.__emit(
+                indent + 1,
+                '{missing} = {data} not in {enumeration}'.format(
+                    missing=missing, data=data, enumeration=enumeration
+                )
+            )
+            self.__emit(indent, 'if {missing}:'.format(missing=missing))
+        self.__emit(
+            indent + 1,
+            'raise EnumerationException('
+            'data={data}, enumeration=list({enumeration}), name={name})'.format(
+                data=data, enumeration=enumeration, name=name
+            )
+        )
+
+    def __generate_pattern(self, schema, data, name, indent):
+        if schema.match is None:
+            return
+
+        match = self.__constant(schema.match)
+        pattern = self.__constant(schema.pattern)
+        self.__emit(indent, 'if not {match}({data}):'.format(match=match, data=data))
+        self.__emit(
+            indent + 1,
+            'raise RegexPatternException(name={name}, data={data}, pattern={pattern})'.format(
+                name=name, data=data, pattern=pattern
+            )
+        )
+
+    def __generate_maximum(self, schema, data, name, indent):
+        if schema.maximum is None:
+            return
+
+        maximum = self.__constant(schema.maximum)
+        exclusive_maximum = self.__constant(schema.exclusive_maximum)
+        operator = '<' if schema.exclusive_maximum else '<='
+        self.__emit(
+            indent,
+            'if not {data} {operator} {maximum}:'.format(
+                data=data, operator=operator, maximum=maximum
+            )
+        )
+        self.__emit(
+            indent + 1,
+            'raise ExceedMaximumException(name={name}, exclusive_maximum={exclusive}, data={data}, '
+            'maximum={maximum})'.format(
+                name=name, exclusive=exclusive_maximum, data=data, maximum=maximum
+            )
+        )
+
+    def __generate_minimum(self, schema, data, name, indent):
+        if schema.minimum is None:
+            return
+
+        minimum = self.__constant(schema.minimum)
+        exclusive_minimum = self.__constant(schema.exclusive_minimum)
+        operator = '>' if schema.exclusive_minimum else '>='
+        self.__emit(
+            indent,
+            'if not {data} {operator} {minimum}:'.format(
+                data=data, operator=operator, minimum=minimum
+            )
+        )
+        self.__emit(
+            indent + 1,
+            'raise ExceedMinimumException(name={name}, exclusive_minimum={exclusive}, data={data}, '
+            'minimum={minimum})'.format(
+                name=name, exclusive=exclusive_minimum, data=data, minimum=minimum
+            )
+        )
+
+    def __generate_range(self, schema, data, name, indent):
+        # the generated comparisons are not dispatched, so the merged bounds are still generated
+        # one by one.
+        self.__generate_maximum(schema, data, name, indent)
+        self.__generate_minimum(schema, data, name, indent)
+
+    def __generate_length(self, schema, data, name, indent):
+        if schema.minimum_length == 0 and schema.maximum_length == math.inf:
+            return
+
+        minimum_length = self.__constant(schema.minimum_length)
+        maximum_length = self.__constant(schema.maximum_length)
+        self.__emit(
+            indent,
+            'if isinstance({data}, Sized) and not {minimum} <= len({data}) <= {maximum}:'.format(
+                data=data, minimum=minimum_length, maximum=maximum_length
+            )
+        )
+        self.__emit(
+            indent + 1,
+            'raise LengthRangeException(name={name}, data={data}, maximum_length={maximum}, '
+            'minimum_length={minimum})'.format(
+                name=name, data=data, minimum=minimum_length, maximum=maximum_length
+            )
+        )
+
+    def __generate_multiple_of(self, schema, data, name, indent):
+        if schema.multiple_of is None:
+            return
+
+        multiple_of = self.__constant(schema.multiple_of)
+        self.__emit(indent, 'if {data} % {multiple_of}:'.format(data=data, multiple_of=multiple_of))
+        self.__emit(
+            indent + 1,
+            'raise MultipleOfException(name={name}, data={data}, multiple_of={multiple_of})'.format(
+                name=name, data=data, multiple_of=multiple_of
+            )
+        )
+
+    GENERATORS = {
+        'type': __generate_type,
+        'assertion': __generate_assertion,
+        'properties': __generate_properties,
+        'dict_type_items': __generate_dict_type_items,
+        'list_type_items': __generate_list_type_items,
+        'enumeration': __generate_enumeration,
+        'pattern': __generate_pattern,
+        'maximum': __generate_maximum,
+        'minimum': __generate_minimum,
+        'range': __generate_range,
+        'length': __generate_length,
+        'multiple_of': __generate_multiple_of,
+    }
@@ -0,0 +1,217 @@
+"""
+description: this module provides the function coerce_and_check.
+"""
+
+import re
+
+from fast_tornado.constants import MATCH_SCHEMA
+from fast_tornado.constants import ENCODE
+from fast_tornado.exceptions import CannotFindPropertyException
+from fast_tornado.exceptions import InvalidPropertyException
+from fast_tornado.exceptions import DependenciesException
+from fast_tornado.exceptions import LengthRangeException
+
+from .check_schema import get_validator
+from .initialize_schema import resolve_types
+from .schema_node import SchemaNode
+from .validator import Validator
+from .validator import render_name
+
+# these checks visit the children of data, the children are coerced and checked by
+# coerce_and_check instead.
+RECURSIVE_CHECKS = {'properties', 'dict_type_items', 'list_type_items'}
+SEQUENCE_TYPES = (list, tuple)
+TRUE_STRINGS = {'true', '1', 'yes', 'on'}
+FALSE_STRINGS = {'false', '0', 'no', 'off'}
+NONE_STRINGS = {'null', 'none'}
+# only plain ascii numbers are converted, int and float also accept underscores, spaces,
+# other digits of unicode, nan and inf, which are not expected from a query argument.
+INT_PATTERN = re.compile(r'[+-]?[0-9]+', re.ASCII)
+FLOAT_PATTERN = re.compile(r'[+-]?([0-9]+(\.[0-9]*)?|\.[0-9]+)([eE][+-]?[0-9]+)?', re.ASCII)
+
+def __to_int(text):
+    if not INT_PATTERN.fullmatch(text):
+        raise ValueError(text)
+    return int(text)
+
+def __to_float(text):
+    if not FLOAT_PATTERN.fullmatch(text):
+        raise ValueError(text)
+    return float(text)
+
+def __to_bool(text):
+    if text.lower() in TRUE_STRINGS:
+        return True
+    if text.lower() in FALSE_STRINGS:
+        return False
+    raise ValueError(text)
+
+def __to_none(text):
+    if text.lower() in NONE_STRINGS:
+        return None
+    raise ValueError(text)
+
+CONVERTERS = {
+    int: __to_int,
+    float: __to_float,
+    bool: __to_bool,
+    type(None): __to_none,
+}
+
+def __convert(data, expected_types):
+    if isinstance(data, bytes):
+        try:
+            data = data.decode(ENCODE.UTF8)
+        except UnicodeDecodeError:
+            # the bytes are not text, keep them, so that they are reported by the type check.
+            pass
+
+    if isinstance(data, expected_types):
+        return data
+
+    if isinstance(data, SEQUENCE_TYPES) and data:
+        # a repeated query argument is a list, the last one is used if a single value is expected,
+        # which is the same as tornado.web.RequestHandler.get_argument.
+        return __convert(data[-1], expected_types)
+
+    if not isinstance(data, str):
+        return data
+
+    for expected_type in expected_types:
+        if expected_type in SEQUENCE_TYPES:
+            # a query argument, which is given only once, is a list of one value.
+            return expected_type([data])
+
+        converter = CONVERTERS.get(expected_type)
+        if converter is None:
+            continue
+
+        try:
+            return converter(data)
+        except ValueError:
+            continue
+    return data
+
+def __coerce_properties(validator, schema, data, path):
+    properties = schema.properties
+    result = dict(data)
+
+    path.append(None)
+    for property_name, property_schema in properties.items():
+        if property_name not in data:
+            if property_schema.required:
+                path.pop()
+                raise CannotFindPropertyException(
+                    data=data, property_name=property_name, name=render_name(path)
+                )
+            continue
+
+        dependencies = property_schema.dependencies
+        for dependency in dependencies:
+            if dependency in data:
+                continue
+
+            path.pop()
+            raise DependenciesException(
+                data=data,
+                name=render_name(path),
+                property_name=property_name,
+                nonexistent_dependencies=sorted(set(dependencies) - data.keys())
+            )
+
+        path[-1] = property_name
+        result[property_name] = __coerce_and_check(
+            validator, property_schema, data[property_name], path
+        )
+    path.pop()
+
+    additional_properities = sorted(set(data) - properties.keys())
+    if not schema.additional_properities and additional_properities:
+        raise InvalidPropertyException(
+            data=data, property_names=additional_properities, name=render_name(path)
+        )
+    return result
+
+def __coerce_items(validator, schema, data, path):
+    items_schema = schema.items
+    if isinstance(items_schema, SchemaNode):
+        item_schemas = [items_schema] * len(data)
+    else:
+        if not len(items_schema) == len(data):
+            raise LengthRangeException(
+                name=render_name(path),
+                data=data,
+                maximum_length=len(items_schema),
+                minimum_length=len(items_schema)
+            )
+        item_schemas = items_schema
+
+    path.append(None)
+    result = list()
+    for index, (item_schema, item) in enumerate(zip(item_schemas, data)):
+        path[-1] = index
+        result.append(__coerce_and_check(validator, item_schema, item, path))
+    path.pop()
+    if hasattr(data, '_fields'):
+        # the namedtuples are built from their fields, not from an iterable.
+        return type(data)(*result)
+    return type(data)(result)
+
+def __coerce_and_check(validator, schema, data, path):
+    expected_types = schema.types
+    if expected_types is None:
+        expected_types = resolve_types(schema)
+
+    data = __convert(data, expected_types)
+    if 'type' in schema.checks:
+        Validator.CHECKS['type'](validator, data, schema, path)
+
+    has_properties = schema.properties is not None
+    has_items = schema.items is not None
+    if isinstance(data, dict) and has_properties and not has_items:
+        data = __coerce_properties(validator, schema, data, path)
+    elif isinstance(data, SEQUENCE_TYPES) and has_items and not has_properties:
+        data = __coerce_items(validator, schema, data, path)
+    elif has_properties or has_items:
+        # the data is not a container, which can be rebuilt, check it without coercion.
+        validator.check_node(schema, data, path)
+        return data
+
+    for check in schema.checks:
+        if check != 'type' and check not in RECURSIVE_CHECKS:
+            Validator.CHECKS[check](validator, data, schema, path)
+    return data
+
+def coerce_and_check(schema, data, name='data'):
+    """
+    description: |
+        this function is used to convert the strings in data into the types declared by the schema,
+        and check the converted data against the schema in the same traversal.
+        the strings and bytes are converted into int, float, bool or None, in the order of the
+        types of the schema, a string which cannot be converted is kept, and it is reported by the
+        type check. only plain ascii decimal numbers are converted, and the bytes which are not
+        utf-8 are kept.
+        a list, such as a repeated query argument, is converted into its last value if the schema
+        expects a single value, and a single string is converted into a list of it if the schema
+        expects a list.
+        data is not changed, the converted containers are copies, and the children of containers
+        are converted and checked before the constraints of the containers, such as assertion and
+        length. the tuples and namedtuples keep their types.
+        data is traversed recursively, so the data which is nested deeper than the recursion limit,
+        such as a long chain of a recursive $ref, raises RecursionError.
+    arguments:
+        schema:
+            type: str
+            description: the schema of data.
+        data:
+            type: any
+            description: the data, whose leaves are usually strings.
+        name:
+            type: str
+            description: the name of data, which is used in the exception message.
+    return:
+        type: any
+        description: the converted data.
+    """
+    validator = get_validator(schema, MATCH_SCHEMA.WALKER)
+    return __coerce_and_check(validator, validator.schema, data, [name])
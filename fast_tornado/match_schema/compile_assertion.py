@@ -0,0 +1,123 @@
+"""
+description: |
+    this module provides the function compile_assertion.
+    the assertion is parsed and checked against a whitelist of syntax before it is compiled,
+    so that it cannot import modules, or reach the internals of objects through dunder names,
+    the attributes of frames, generators and tracebacks, or the format methods of strings.
+    only the attributes of the plain data types can be used, so the attributes of registered or
+    dotted types, such as x.year of datetime.date, are rejected, use the methods of the plain data
+    types or the builtins on them instead.
+"""
+
+import ast
+import builtins
+
+from fast_tornado.constants import MATCH_SCHEMA
+from fast_tornado.exceptions import InitializeLambdaExpressionException
+
+from .lru_cache import LRUCache
+
+ASSERTION_CACHE = LRUCache(MATCH_SCHEMA.ASSERTION_CACHE_SIZE)
+
+# some of these nodes only exist in some versions of python.
+ALLOWED_NODES = tuple(
+    getattr(ast, name) for name in [
+        'Expression', 'Lambda', 'arguments', 'arg',
+        'BoolOp', 'BinOp', 'UnaryOp', 'Compare', 'IfExp',
+        'Call', 'keyword', 'Starred', 'Attribute', 'Subscript', 'Index', 'Slice', 'ExtSlice',
+        'Name', 'Constant', 'Num', 'Str', 'Bytes', 'NameConstant', 'Ellipsis',
+        'JoinedStr', 'FormattedValue',
+        'List', 'Tuple', 'Set', 'Dict',
+        'ListComp', 'SetComp', 'DictComp', 'GeneratorExp', 'comprehension',
+        'boolop', 'operator', 'unaryop', 'cmpop', 'expr_context',
+    ] if hasattr(ast, name)
+)
+
+CONSTANT_NODES = tuple(
+    getattr(ast, name) for name in ['Constant', 'Str', 'Bytes'] if hasattr(ast, name)
+)
+
+SAFE_BUILTINS = {
+    name: getattr(builtins, name) for name in [
+        'abs', 'all', 'any', 'bool', 'bytes', 'callable', 'chr', 'dict', 'divmod', 'enumerate',
+        'filter', 'float', 'frozenset', 'hasattr', 'int', 'isinstance', 'issubclass', 'len', 'list',
+        'map', 'max', 'min', 'ord', 'pow', 'range', 'repr', 'reversed', 'round', 'set', 'sorted',
+        'str', 'sum', 'tuple', 'zip',
+    ]
+}
+
+# the attributes, which can be used, are the public methods and properties of the plain data types,
+# except the format methods, whose replacement fields can read any attribute of their arguments.
+ALLOWED_ATTRIBUTES = frozenset(
+    name
+    for clazz in (str, bytes, int, float, bool, list, tuple, dict, set, frozenset)
+    for name in dir(clazz)
+    if not name.startswith('_')
+) - {'format', 'format_map'}
+
+def __is_dunder(name):
+    return name.startswith('__') and name.endswith('__')
+
+def __is_dunder_string(value):
+    # the dunder names are keys of namespaces, such as '__builtins__' of f_globals.
+    if isinstance(value, bytes):
+        value = value.decode('latin-1')
+    return isinstance(value, str) and len(value) > 4 and __is_dunder(value)
+
+def __get_bound_names(tree):
+    names = set(SAFE_BUILTINS)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.arg):
+            names.add(node.arg)
+        elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            names.add(node.id)
+    return names
+
+def __check_node(node, bound_names, expression):
+    if not isinstance(node, ALLOWED_NODES):
+        raise InitializeLambdaExpressionException(expression)
+
+    if isinstance(node, ast.Attribute) and node.attr not in ALLOWED_ATTRIBUTES:
+        raise InitializeLambdaExpressionException(expression)
+
+    if isinstance(node, CONSTANT_NODES):
+        value = getattr(node, 'value', getattr(node, 's', None))
+        if __is_dunder_string(value):
+            raise InitializeLambdaExpressionException(expression)
+
+    # only the arguments, the variables of comprehensions and SAFE_BUILTINS can be used.
+    if isinstance(node, ast.Name) and (__is_dunder(node.id) or node.id not in bound_names):
+        raise InitializeLambdaExpressionException(expression)
+
+def __compile(expression):
+    try:
+        tree = ast.parse(expression.strip(), mode='eval')
+    except (SyntaxError, ValueError):
+        raise InitializeLambdaExpressionException(expression) from None
+
+    if not isinstance(tree.body, ast.Lambda):
+        raise InitializeLambdaExpressionException(expression)
+
+    bound_names = __get_bound_names(tree)
+    for node in ast.walk(tree):
+        __check_node(node, bound_names, expression)
+
+    code = compile(tree, filename='<assertion>', mode='eval')
+    return eval(code, {'__builtins__': SAFE_BUILTINS}) # pylint: disable = eval-used
+
+def compile_assertion(expression):
+    """
+    description: |
+        this function is used to compile the lambda expression of assertion.
+        the compiled function is kept in ASSERTION_CACHE by the expression text, and shared by
+        all nodes and threads, which is safe since the function does not have any state.
+        besides its arguments, only the functions in SAFE_BUILTINS can be used by name.
+    arguments:
+        expression:
+            type: str
+            description: the lambda expression, such as 'lambda x: x > 0'.
+    """
+    if not isinstance(expression, str):
+        raise InitializeLambdaExpressionException(expression)
+
+    return ASSERTION_CACHE.get(expression, lambda: __compile(expression))
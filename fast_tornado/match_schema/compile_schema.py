@@ -0,0 +1,59 @@
+"""
+description: this module provides the function compile_schema.
+"""
+
+import yaml
+
+from fast_tornado.constants import MATCH_SCHEMA
+from fast_tornado.exceptions import InvalidArgumentsException
+
+from .initialize_schema import initialize_schema
+from .memoize import ValueMemo
+from .validator import Validator
+from .code_validator import CodeValidator
+
+BACKENDS = {
+    MATCH_SCHEMA.WALKER: Validator,
+    MATCH_SCHEMA.CODE: CodeValidator,
+}
+
+def compile_schema(schema, backend=None, memo_size=None):
+    """
+    description: |
+        this function is used to compile the schema into a validator.
+        the schema is loaded from yaml, its types are resolved and its assertions are compiled
+        only once, the returned validator can be used to check data repeatedly.
+        the schema is not changed, and the validator can be shared by threads.
+        if memo_size is given, the validator remembers at most memo_size values, which have passed
+        the leaf nodes with assertion or pattern, its statistics are validator.memo.statistics.
+    arguments:
+        schema:
+            type: [str, dict]
+            description: the schema of data, or the schema which has been loaded from yaml.
+        backend:
+            type: [str, None]
+            description: |
+                the backend of the validator, 'walker' walks the schema recursively,
+                'code' generates specialised python source for the schema.
+                if it is None, fast_tornado.constants.MATCH_SCHEMA.BACKEND is used.
+        memo_size:
+            type: [int, None]
+            description: the maximum size of the memo, None means the validator is not memoized.
+    return:
+        type: fast_tornado.match_schema.Validator
+        description: the validator of the schema.
+    """
+    backend = MATCH_SCHEMA.BACKEND if backend is None else backend
+    if backend not in BACKENDS:
+        raise InvalidArgumentsException(
+            function_name='compile_schema',
+            message='the backend should be one of {backends}'.format(
+                backends=', '.join(sorted(BACKENDS))
+            )
+        )
+
+    if isinstance(schema, str):
+        schema = yaml.safe_load(schema)
+
+    memo = None if memo_size is None else ValueMemo(memo_size)
+    return BACKENDS[backend](initialize_schema(schema), memo=memo)
@@ -0,0 +1,352 @@
+"""
+description: this module provides the function initialize_schema.
+"""
+
+import re
+import copy
+import math
+import types
+
+from fast_tornado.exceptions import NonstringTypeHasPatternException
+from fast_tornado.exceptions import InvalidRegexPatternException
+from fast_tornado.exceptions import InvalidReferenceException
+from fast_tornado.exceptions import InvalidSampleException
+from fast_tornado.constants import MATCH_SCHEMA
+
+from .compile_assertion import compile_assertion
+from .lru_cache import LRUCache
+from .optimize_checks import optimize_checks
+from .register_type import resolve_type
+from .schema_node import SchemaNode
+from .vectorize import is_vectorizable
+
+# the nodes of definitions, which are shared by the schemas with identical definitions.
+DEFINITION_CACHE = LRUCache(MATCH_SCHEMA.DEFINITION_CACHE_SIZE)
+REFERENCE_PREFIX = '#/definitions/'
+# the fields, which can be used with $ref, they are about the property rather than
+# the referenced schema.
+REFERENCE_FIELDS = {'$ref', 'required', 'dependencies', 'description'}
+# the root can also hold the definitions, so that the root itself can be a recursive definition.
+ROOT_REFERENCE_FIELDS = REFERENCE_FIELDS | {'definitions'}
+
+def __get_type_names(schema):
+    type_names = schema.get('type', 'any')
+    if isinstance(type_names, list):
+        return tuple(type_names)
+    return type_names
+
+def __get_types(type_names):
+    if isinstance(type_names, tuple):
+        return tuple([resolve_type(item) for item in type_names])
+    if type_names is None:
+        return (type(None),)
+    return (resolve_type(type_names),)
+
+def __get_assertion_function(schema):
+    if 'assertion' not in schema:
+        return None
+
+    return compile_assertion(schema['assertion'])
+
+def __get_match(schema):
+    if 'pattern' not in schema:
+        return None
+
+    try:
+        pattern = re.compile(schema['pattern'])
+    except (re.error, TypeError) as exception:
+        raise InvalidRegexPatternException(
+            pattern=schema['pattern'], message=str(exception)
+        ) from None
+
+    return pattern.fullmatch if schema.get('full_match', False) else pattern.match
+
+def __get_enumeration(schema):
+    if 'enumeration' not in schema:
+        return None
+
+    # the enumeration is copied, so that changing the schema does not change the node.
+    enumeration = copy.deepcopy(schema['enumeration'])
+    return tuple(enumeration) if isinstance(enumeration, list) else enumeration
+
+def __get_enumeration_members(enumeration):
+    if enumeration is None:
+        return None
+
+    try:
+        return frozenset(enumeration)
+    except TypeError:
+        # some members are unhashable, keep the enumeration and check the membership linearly.
+        return enumeration
+
+def __get_properties(schema, context):
+    if 'properties' not in schema:
+        return None
+
+    return types.MappingProxyType(
+        {
+            property_name: __initialize_node(property_schema, context)
+            for property_name, property_schema in schema['properties'].items()
+        }
+    )
+
+def __get_items(schema, context):
+    items_schema = schema.get('items')
+    if isinstance(items_schema, dict):
+        return __initialize_node(items_schema, context)
+    if isinstance(items_schema, list):
+        return tuple(__initialize_node(item_schema, context) for item_schema in items_schema)
+    return None
+
+def __get_sample(schema, items):
+    if 'sample' not in schema:
+        return None
+
+    sample = schema['sample']
+    if not isinstance(items, SchemaNode):
+        raise InvalidSampleException(
+            sample=sample, reason='it can only be used with the items of a single schema'
+        )
+    if isinstance(sample, float) and 0 < sample <= 1:
+        return sample
+    if isinstance(sample, int) and not isinstance(sample, bool) and sample > 0:
+        return sample
+    raise InvalidSampleException(
+        sample=sample, reason='it should be a float in (0, 1] or a positive int'
+    )
+
+def __check_validation(schema, resolved_types, pattern):
+    if str not in resolved_types and pattern is not None:
+        raise NonstringTypeHasPatternException(schema=schema)
+
+def resolve_types(node):
+    """
+    description: |
+        this function is used to resolve the types of the node, which could not be resolved
+        while the schema was initialized. the result is not stored in the node, but the dotted
+        types are memoized by resolve_type, and the error is raised if they still cannot be
+        resolved. the type names are copied into the node while it is built, so the schema is
+        not read again.
+    arguments:
+        node:
+            type: fast_tornado.match_schema.SchemaNode
+            description: the node of the schema.
+    """
+    resolved_types = __get_types(node.type_names)
+    __check_validation(node.schema, resolved_types, node.pattern)
+    return resolved_types
+
+def __iterate_references(schema):
+    if isinstance(schema, dict):
+        reference = schema.get('$ref')
+        if isinstance(reference, str) and reference.startswith(REFERENCE_PREFIX):
+            yield reference[len(REFERENCE_PREFIX):]
+        for value in schema.values():
+            yield from __iterate_references(value)
+    elif isinstance(schema, list):
+        for item in schema:
+            yield from __iterate_references(item)
+
+def __get_canonical_form(value):
+    # the types are kept in the form, so that the values which are equal or rendered equally,
+    # such as the keys 1 and '1', or 1 and True, do not share the same key.
+    if isinstance(value, dict):
+        items = [
+            (__get_canonical_form(key), __get_canonical_form(item)) for key, item in value.items()
+        ]
+        return dict, tuple(sorted(items, key=repr))
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(__get_canonical_form(item) for item in value)
+    return type(value), repr(value)
+
+def __get_definition_key(definitions, name):
+    # the key contains the definition and all definitions it refers to, directly or indirectly,
+    # so that the definitions with the same key are compiled into the same nodes.
+    closure = set()
+    names = [name]
+    while names:
+        current_name = names.pop()
+        if current_name in closure or current_name not in definitions:
+            continue
+        closure.add(current_name)
+        names.extend(__iterate_references(definitions[current_name]))
+
+    try:
+        closure_definitions = {item: definitions[item] for item in closure}
+        return name, __get_canonical_form(closure_definitions)
+    except RecursionError:
+        return None
+
+def __get_definition(name, reference, context):
+    if name in context['nodes']:
+        return context['nodes'][name]
+
+    definitions = context['definitions']
+    if name not in definitions:
+        raise InvalidReferenceException(reference=reference, reason='the definition does not exist')
+
+    key = __get_definition_key(definitions, name)
+    node = None if key is None else DEFINITION_CACHE.peek(key)
+    if node is not None:
+        context['nodes'][name] = node
+        return node
+
+    schema = definitions[name]
+    if '$ref' in schema:
+        if name in context['aliases']:
+            raise InvalidReferenceException(
+                reference=reference, reason='the references are circular'
+            )
+        context['aliases'].add(name)
+        node = __initialize_node(schema, context)
+    else:
+        # the node is registered before its fields are built, so that recursive references find it.
+        node = SchemaNode.__new__(SchemaNode)
+        context['nodes'][name] = node
+        SchemaNode.__init__(node, definition=name, **__get_fields(schema, context))
+
+    context['nodes'][name] = node
+    if key is not None:
+        context['built'][key] = node
+    return node
+
+def __initialize_reference(schema, context):
+    reference = schema['$ref']
+    if not isinstance(reference, str) or not reference.startswith(REFERENCE_PREFIX):
+        raise InvalidReferenceException(
+            reference=reference,
+            reason='only the references like {prefix}name are supported'.format(
+                prefix=REFERENCE_PREFIX
+            )
+        )
+
+    allowed_fields = ROOT_REFERENCE_FIELDS if schema is context['root'] else REFERENCE_FIELDS
+    invalid_fields = sorted(set(schema) - allowed_fields)
+    if invalid_fields:
+        raise InvalidReferenceException(
+            reference=reference,
+            reason='it cannot be used with {fields}'.format(fields=', '.join(invalid_fields))
+        )
+
+    node = __get_definition(reference[len(REFERENCE_PREFIX):], reference, context)
+    if 'required' not in schema and 'dependencies' not in schema:
+        return node
+
+    # the referenced node may not be built yet, so the copy is filled after the whole schema
+    # is built.
+    reference_copy = SchemaNode.__new__(SchemaNode)
+    fields = {
+        'required': schema.get('required', True),
+        'dependencies': tuple(schema.get('dependencies', list())),
+    }
+    context['copies'].append((reference_copy, node, fields))
+    return reference_copy
+
+def __get_checks(fields):
+    # the checks are ordered as the walker runs them, so the messages do not depend on the dispatch.
+    resolved_types = fields['types']
+    conditions = (
+        ('type', resolved_types is None or object not in resolved_types),
+        ('assertion', fields['assertion_function'] is not None),
+        ('properties', fields['properties'] is not None),
+        ('dict_type_items', isinstance(fields['items'], SchemaNode)),
+        ('list_type_items', isinstance(fields['items'], tuple)),
+        ('enumeration', fields['enumeration'] is not None),
+        ('pattern', fields['match'] is not None),
+        ('maximum', fields['maximum'] is not None),
+        ('minimum', fields['minimum'] is not None),
+        ('length', fields['minimum_length'] != 0 or fields['maximum_length'] != math.inf),
+        ('multiple_of', fields['multiple_of'] is not None),
+    )
+    return tuple(check for check, condition in conditions if condition)
+
+def __get_fields(schema, context):
+    match = __get_match(schema)
+    type_names = __get_type_names(schema)
+
+    try:
+        resolved_types = __get_types(type_names)
+    except (ImportError, AttributeError, ValueError):
+        resolved_types = None
+    else:
+        __check_validation(schema, resolved_types, schema.get('pattern'))
+
+    enumeration = __get_enumeration(schema)
+    fields = dict(
+        schema=schema,
+        type_names=type_names,
+        types=resolved_types,
+        assertion=schema.get('assertion'),
+        assertion_function=__get_assertion_function(schema),
+        properties=__get_properties(schema, context),
+        additional_properities=schema.get('additional_properities', True),
+        required=schema.get('required', True),
+        dependencies=tuple(schema.get('dependencies', list())),
+        items=__get_items(schema, context),
+        vectorizable=is_vectorizable(schema, resolved_types),
+        enumeration=enumeration,
+        enumeration_members=__get_enumeration_members(enumeration),
+        pattern=schema.get('pattern'),
+        match=match,
+        maximum=schema.get('maximum'),
+        exclusive_maximum=schema.get('exclusive_maximum', False),
+        minimum=schema.get('minimum'),
+        exclusive_minimum=schema.get('exclusive_minimum', False),
+        minimum_length=schema.get('minimum_length', 0),
+        maximum_length=schema.get('maximum_length', math.inf),
+        multiple_of=schema.get('multiple_of'),
+    )
+    fields['checks'], fields['optimizations'] = optimize_checks(fields, __get_checks(fields))
+    fields['sample'] = __get_sample(schema, fields['items'])
+    fields['sample_seed'] = schema.get('sample_seed', 0)
+    return fields
+
+def __initialize_node(schema, context):
+    if '$ref' in schema:
+        return __initialize_reference(schema, context)
+
+    return SchemaNode(**__get_fields(schema, context))
+
+def initialize_schema(schema):
+    """
+    description: |
+        this function is used to build the immutable node tree of the schema, the schema is not
+        changed. the patterns and assertions are compiled, the enumerations are converted into
+        frozensets, and the types are resolved, the checks which always pass are removed by
+        optimize_checks. if a dotted type cannot be resolved, the types of the node are None,
+        and they are resolved by resolve_types when the node is visited, so that types of optional
+        branches are not required to be importable.
+        the sub-schemas in the field definitions of the root can be referred by
+        {$ref: '#/definitions/name'}, each definition is built once and shared by all its
+        references, and by other schemas with identical definitions through DEFINITION_CACHE.
+        the definitions can be recursive, and the root itself can be a reference to one of them.
+    arguments:
+        schema:
+            type: dict
+            description: the schema loaded from yaml.
+    return:
+        type: fast_tornado.match_schema.SchemaNode
+        description: the root node of the schema.
+    """
+    context = {
+        'root': schema,
+        'definitions': schema.get('definitions', dict()),
+        'nodes': dict(),
+        'aliases': set(),
+        'copies': list(),
+        'built': dict(),
+    }
+    node = __initialize_node(schema, context)
+
+    for reference_copy, referenced_node, fields in context['copies']:
+        referenced_fields = {
+            field: getattr(referenced_node, field) for field in SchemaNode.__slots__
+        }
+        referenced_fields.update(fields)
+        SchemaNode.__init__(reference_copy, **referenced_fields)
+
+    # the definitions are shared only after they are completely built.
+    for key, built_node in context['built'].items():
+        DEFINITION_CACHE.get(key, lambda built_node=built_node: built_node)
+
+    return node
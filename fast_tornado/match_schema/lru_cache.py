@@ -0,0 +1,125 @@
+"""
+description: this module provides the class LRUCache.
+"""
+
+import threading
+import collections
+
+CacheStatistics = collections.namedtuple(
+    'CacheStatistics',
+    ['hits', 'misses', 'evictions', 'size', 'maximum_size']
+)
+
+class LRUCache:
+    """
+    description: |
+        this is a thread-safe and size-bounded cache, which evicts the least recently used item
+        when it is full, and counts its hits, misses and evictions.
+    """
+
+    def __init__(self, maximum_size):
+        self.__maximum_size = maximum_size
+        self.__items = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @property
+    def statistics(self):
+        """
+        description: this function is used to get the statistics of the cache.
+        """
+        with self.__lock:
+            return CacheStatistics(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                size=len(self.__items),
+                maximum_size=self.__maximum_size
+            )
+
+    def get(self, key, factory):
+        """
+        description: |
+            this function is used to get the value of the key.
+            if the key is not in the cache, the value is created by factory and stored.
+        arguments:
+            key:
+                type: any
+                description: the hashable key.
+            factory:
+                type: types.FunctionType
+                description: the function without arguments, which creates the value.
+        """
+        with self.__lock:
+            if key in self.__items:
+                self.__hits += 1
+                self.__items.move_to_end(key)
+                return self.__items[key]
+            self.__misses += 1
+
+        value = factory()
+
+        with self.__lock:
+            self.__items[key] = value
+            self.__items.move_to_end(key)
+            self.__evict()
+        return value
+
+    def peek(self, key, default=None):
+        """
+        description: |
+            this function is used to get the value of the key without creating it.
+            if the key is not in the cache, the default is returned, and it is counted as a miss.
+        arguments:
+            key:
+                type: any
+                description: the hashable key.
+            default:
+                type: any
+                description: the value returned if the key is not in the cache.
+        """
+        with self.__lock:
+            if key not in self.__items:
+                self.__misses += 1
+                return default
+
+            self.__hits += 1
+            self.__items.move_to_end(key)
+            return self.__items[key]
+
+    def resize(self, maximum_size):
+        """
+        description: this function is used to change the maximum size of the cache.
+        arguments:
+            maximum_size:
+                type: int
+                description: the maximum number of items in the cache.
+        """
+        with self.__lock:
+            self.__maximum_size = maximum_size
+            self.__evict()
+
+    def clear(self):
+        """
+        description: this function is used to remove all items and reset the statistics.
+        """
+        with self.__lock:
+            self.__items.clear()
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
+
+    def __evict(self):
+        while len(self.__items) > self.__maximum_size:
+            self.__items.popitem(last=False)
+            self.__evictions += 1
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__items)
+
+    def __contains__(self, key):
+        with self.__lock:
+            return key in self.__items
@@ -0,0 +1,138 @@
+"""
+description: |
+    this module provides the functions is_memoizable and get_memo_key, which are used by the
+    validators to remember the values, which have passed a leaf node, and the class ValueMemo.
+"""
+
+import math
+import threading
+
+from fast_tornado.constants import MATCH_SCHEMA
+
+from .lru_cache import CacheStatistics
+
+# the checks, which are expensive enough to be memoized, the nodes without them are checked
+# directly.
+MEMOIZED_CHECKS = frozenset(['assertion', 'pattern'])
+ATOMIC_TYPES = frozenset([str, bytes, int, float, bool, type(None)])
+SIZED_TYPES = frozenset([str, bytes, tuple])
+
+def is_memoizable(node):
+    """
+    description: |
+        this function is used to check whether the results of the node can be memoized,
+        that is, the node has no children, and it has assertion or pattern.
+    arguments:
+        node:
+            type: fast_tornado.match_schema.SchemaNode
+            description: the node of the schema.
+    """
+    if node.properties is not None or node.items is not None:
+        return False
+    return not MEMOIZED_CHECKS.isdisjoint(node.checks)
+
+def __get_signature(value):
+    # the sign of a float is a part of its signature, since 0.0 == -0.0, but their results
+    # may differ.
+    if type(value) is float: # pylint: disable = unidiomatic-typecheck
+        return float, math.copysign(1.0, value)
+    return type(value)
+
+def get_memo_key(node, value):
+    """
+    description: |
+        this function is used to get the key of the value in the memo, None if it cannot be
+        memoized. only the values of immutable builtin types and the tuples of them are memoized,
+        the types are parts of the key, since the equal values of different types, such as 1 and
+        True, may have different results. so are the signs of floats, since 0.0 equals -0.0.
+        the strings, bytes and tuples longer than MATCH_SCHEMA.MEMO_VALUE_SIZE are not memoized,
+        so that the memo does not keep large values alive.
+    arguments:
+        node:
+            type: fast_tornado.match_schema.SchemaNode
+            description: the node of the schema.
+        value:
+            type: any
+            description: the value to be checked.
+    """
+    value_type = type(value)
+    if value_type in SIZED_TYPES and len(value) > MATCH_SCHEMA.MEMO_VALUE_SIZE:
+        return None
+
+    if value_type in ATOMIC_TYPES:
+        return id(node), __get_signature(value), value
+
+    if value_type is tuple and all(type(item) in ATOMIC_TYPES for item in value):
+        return id(node), tuple(__get_signature(item) for item in value), value
+    return None
+
+class ValueMemo:
+    """
+    description: |
+        this class is the bounded set of the keys of values, which have passed their nodes.
+        a lookup does not take the lock, so it is as cheap as a lookup of dict, and the oldest key
+        is evicted when it is full. the counters of hits and misses are not locked either, so they
+        may lose a few counts if the memo is shared by threads.
+    """
+
+    def __init__(self, maximum_size):
+        self.__maximum_size = maximum_size
+        self.__keys = dict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @property
+    def statistics(self):
+        """
+        description: this function is used to get the statistics of the memo.
+        """
+        return CacheStatistics(
+            hits=self.__hits,
+            misses=self.__misses,
+            evictions=self.__evictions,
+            size=len(self.__keys),
+            maximum_size=self.__maximum_size
+        )
+
+    def contains(self, key):
+        """
+        description: |
+            this function is used to check whether the key is in the memo, it is counted as a hit
+            or a miss.
+        arguments:
+            key:
+                type: any
+                description: the key returned by get_memo_key.
+        """
+        if key in self.__keys:
+            self.__hits += 1
+            return True
+
+        self.__misses += 1
+        return False
+
+    def add(self, key):
+        """
+        description: this function is used to add the key into the memo.
+        arguments:
+            key:
+                type: any
+                description: the key returned by get_memo_key.
+        """
+        with self.__lock:
+            self.__keys[key] = None
+            while len(self.__keys) > self.__maximum_size:
+                del self.__keys[next(iter(self.__keys))]
+                self.__evictions += 1
+
+    def clear(self):
+        """
+        description: this function is used to remove all keys and reset the statistics.
+        """
+        with self.__lock:
+            self.__keys.clear()
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
@@ -0,0 +1,180 @@
+"""
+description: |
+    this module provides the function optimize_checks, which removes the checks that always pass
+    from the nodes while the schema is initialized, and the function report_optimizations.
+"""
+
+import math
+import collections
+import collections.abc
+
+from .memoize import ATOMIC_TYPES
+from .schema_node import SchemaNode
+from .schema_profiler import get_schema_paths
+
+Optimization = collections.namedtuple('Optimization', ['path', 'constraint', 'reason'])
+
+# the checks, which run after the enumeration, a value passes them if all members of
+# the enumeration pass them.
+IMPLIED_CHECKS = ('pattern', 'maximum', 'minimum', 'length', 'multiple_of')
+
+def __is_empty(node, optional=False):
+    # a definition or a reference, which is being built, has no fields yet, it is never empty.
+    try:
+        return not node.checks and (not optional or not node.required and not node.dependencies)
+    except AttributeError:
+        return False
+
+def __is_typed(fields, base_type):
+    types = fields['types']
+    if types is None or object in types:
+        return False
+    return all(issubclass(clazz, base_type) for clazz in types)
+
+def __remove_defaults(fields, checks):
+    schema = fields['schema']
+    if 'type' in schema and fields['types'] is not None and object in fields['types']:
+        yield 'type', 'the type any always passes'
+
+    if not fields['minimum_length'] <= 0 or not fields['maximum_length'] == math.inf:
+        return
+    if 'length' in checks or 'minimum_length' in schema or 'maximum_length' in schema:
+        if 'length' in checks:
+            checks.remove('length')
+        yield 'length', 'the length range [{minimum}, inf] always passes'.format(
+            minimum=fields['minimum_length']
+        )
+
+def __remove_multiple_of_one(fields, checks):
+    if 'multiple_of' in checks and fields['multiple_of'] == 1 and __is_typed(fields, int):
+        checks.remove('multiple_of')
+        yield 'multiple_of', 'every integer is a multiple of 1'
+
+def __passes(fields, check, member):
+    # the same comparisons as the validators, an error means the check cannot be proved to pass.
+    try:
+        if check == 'pattern':
+            return bool(fields['match'](member))
+        if check == 'maximum':
+            if fields['exclusive_maximum']:
+                return member < fields['maximum']
+            return member <= fields['maximum']
+        if check == 'minimum':
+            if fields['exclusive_minimum']:
+                return member > fields['minimum']
+            return member >= fields['minimum']
+        if check == 'length':
+            if not isinstance(member, collections.abc.Sized):
+                return True
+            return fields['minimum_length'] <= len(member) <= fields['maximum_length']
+        return not member % fields['multiple_of']
+    except Exception: # pylint: disable = broad-except
+        return False
+
+def __remove_implied_by_enumeration(fields, checks):
+    # the data, which passes the type check and the enumeration, equals a member of the enumeration,
+    # and the equal values of atomic types pass the same comparisons, patterns and length ranges.
+    if 'enumeration' not in checks or not __is_typed(fields, tuple(ATOMIC_TYPES)):
+        return
+
+    for check in IMPLIED_CHECKS:
+        if check not in checks:
+            continue
+        if all(__passes(fields, check, member) for member in fields['enumeration']):
+            checks.remove(check)
+            yield check, 'all members of the enumeration pass it'
+
+def __remove_empty_children(fields, checks):
+    # the containers are iterated only if their types are known to be sized and iterable, otherwise
+    # the iteration of the children may raise an error or consume the data.
+    properties = fields['properties']
+    if 'properties' in checks and fields['additional_properities'] and __is_typed(fields, dict):
+        if all(__is_empty(node, optional=True) for node in properties.values()):
+            checks.remove('properties')
+            yield 'properties', 'no property is required or checked'
+
+    items = fields['items']
+    if 'dict_type_items' in checks and __is_empty(items) and \
+            __is_typed(fields, collections.abc.Sized) and \
+            __is_typed(fields, collections.abc.Iterable):
+        checks.remove('dict_type_items')
+        yield 'items', 'the items are not checked'
+
+def __merge_bounds(fields, checks):
+    # pylint: disable = unused-argument
+    if 'maximum' in checks and 'minimum' in checks:
+        checks[checks.index('maximum')] = 'range'
+        checks.remove('minimum')
+        yield 'maximum, minimum', 'the bounds are merged into one range check'
+
+PASSES = (
+    __remove_defaults,
+    __remove_multiple_of_one,
+    __remove_implied_by_enumeration,
+    __remove_empty_children,
+    __merge_bounds,
+)
+
+def optimize_checks(fields, checks):
+    """
+    description: |
+        this function is used to remove the checks, which always pass, from the checks of a node,
+        and to merge the bounds into one range check, the messages of the failures are not changed.
+        the removed checks are the type any, the length range [0, inf], multiple_of 1 of integers,
+        the checks which all members of the enumeration pass, and the properties and items
+        without any check. the children are initialized before their parents, so a parent whose
+        children are removed can be removed by its own parent.
+    arguments:
+        fields:
+            type: dict
+            description: the fields of the node, except checks.
+        checks:
+            type: tuple
+            description: the names of the checks, which apply to the node.
+    return:
+        type: tuple
+        description: the optimized checks, and the pairs of removed constraint and reason.
+    """
+    checks = list(checks)
+    optimizations = list()
+    for optimization in PASSES:
+        optimizations.extend(optimization(fields, checks))
+    return tuple(checks), tuple(optimizations)
+
+def __iterate_nodes(root):
+    nodes = [root]
+    visited = set()
+    while nodes:
+        node = nodes.pop()
+        if id(node) in visited:
+            continue
+
+        visited.add(id(node))
+        yield node
+        if node.properties is not None:
+            nodes.extend(node.properties.values())
+        if isinstance(node.items, SchemaNode):
+            nodes.append(node.items)
+        elif isinstance(node.items, tuple):
+            nodes.extend(node.items)
+
+def report_optimizations(root):
+    """
+    description: |
+        this function is used to report the constraints, which were removed or merged from the nodes
+        of the schema by optimize_checks, the paths are the same as the paths of SchemaProfiler.
+    arguments:
+        root:
+            type: fast_tornado.match_schema.SchemaNode
+            description: the root node of the schema, such as compile_schema(schema).schema.
+    return:
+        type: list
+        description: the list of Optimization(path, constraint, reason), sorted by path.
+    """
+    paths = get_schema_paths(root)
+    report = [
+        Optimization(paths[id(node)], constraint, reason)
+        for node in __iterate_nodes(root)
+        for constraint, reason in node.optimizations
+    ]
+    return sorted(report, key=lambda item: item.path)
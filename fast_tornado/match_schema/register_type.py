@@ -0,0 +1,84 @@
+"""
+description: this module provides the functions register_type and resolve_type.
+"""
+
+import importlib
+
+from fast_tornado.exceptions import InvalidArgumentsException
+
+# the resolved types of the process, the dotted types are added when they are resolved
+# for the first time.
+TYPE_REGISTRY = {
+    'bool': bool,
+    'int': int,
+    'float': float,
+    'str': str,
+    'dict': dict,
+    'set': set,
+    'list': list,
+    'tuple': tuple,
+    'any': object,
+    'None': type(None),
+}
+
+def register_type(name, clazz):
+    """
+    description: |
+        this function is used to register a type, so that it can be used in schemas by its name.
+        a name cannot be registered as another type, since the schemas which have been compiled
+        still use the former one.
+    arguments:
+        name:
+            type: str
+            description: the name of the type used in schemas.
+        clazz:
+            type: type
+            description: the type.
+    """
+    if not isinstance(name, str):
+        raise InvalidArgumentsException(
+            function_name='register_type',
+            message='the name should be a str, but it is {name}'.format(name=repr(name))
+        )
+
+    if not isinstance(clazz, type):
+        raise InvalidArgumentsException(
+            function_name='register_type',
+            message='the clazz should be a type, but it is {clazz}'.format(clazz=repr(clazz))
+        )
+
+    registered = TYPE_REGISTRY.setdefault(name, clazz)
+    if registered is not clazz:
+        raise InvalidArgumentsException(
+            function_name='register_type',
+            message='the name {name} has been registered as {clazz}'.format(
+                name=repr(name),
+                clazz=registered.__name__
+            )
+        )
+
+def resolve_type(name):
+    """
+    description: |
+        this function is used to get the type by its name from TYPE_REGISTRY.
+        if the name is not registered, it is imported as a dotted path like decimal.Decimal,
+        and registered, so that it is only imported once.
+        if the imported object is not a type, it is not registered and an exception is raised.
+    arguments:
+        name:
+            type: str
+            description: the name of the type.
+    """
+    name = str(name)
+    if name in TYPE_REGISTRY:
+        return TYPE_REGISTRY[name]
+
+    package, clazz = name.rsplit('.', 1)
+    module = importlib.import_module(package)
+    resolved = getattr(module, clazz)
+    if not isinstance(resolved, type):
+        raise InvalidArgumentsException(
+            function_name='resolve_type',
+            message='{name} is not a type'.format(name=repr(name))
+        )
+    return TYPE_REGISTRY.setdefault(name, resolved)
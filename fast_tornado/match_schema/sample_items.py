@@ -0,0 +1,106 @@
+"""
+description: |
+    this module provides the function sample_items, which selects the items of a list to be checked
+    if the schema has the field sample, and the counter of checked and skipped items.
+"""
+
+import math
+import random
+import threading
+import collections
+
+SampleStatistics = collections.namedtuple('SampleStatistics', ['lists', 'checked', 'skipped'])
+
+class SampleCounter:
+    """
+    description: this class counts the sampled lists, and the checked and skipped items of them.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__lists = 0
+        self.__checked = 0
+        self.__skipped = 0
+
+    @property
+    def statistics(self):
+        """
+        description: this function is used to get the statistics of the counter.
+        """
+        with self.__lock:
+            return SampleStatistics(
+                lists=self.__lists, checked=self.__checked, skipped=self.__skipped
+            )
+
+    def record(self, checked, skipped):
+        """
+        description: this function is used to record a sampled list.
+        arguments:
+            checked:
+                type: int
+                description: the number of checked items.
+            skipped:
+                type: int
+                description: the number of skipped items.
+        """
+        with self.__lock:
+            self.__lists += 1
+            self.__checked += checked
+            self.__skipped += skipped
+
+    def clear(self):
+        """
+        description: this function is used to reset the counter.
+        """
+        with self.__lock:
+            self.__lists = 0
+            self.__checked = 0
+            self.__skipped = 0
+
+SAMPLE_COUNTER = SampleCounter()
+
+def get_sample_size(sample, length):
+    """
+    description: |
+        this function is used to get the number of items to be checked.
+        if sample is a float, it is the fraction of the items, which is rounded up,
+        otherwise it is the maximum number of the items.
+    arguments:
+        sample:
+            type: [int, float]
+            description: the field sample of the schema.
+        length:
+            type: int
+            description: the length of the list.
+    """
+    if isinstance(sample, float):
+        return min(length, math.ceil(sample * length))
+    return min(length, sample)
+
+def sample_items(schema, data):
+    """
+    description: |
+        this function is used to get the pairs of index and item of data, which should be checked.
+        the indices are selected by a random generator seeded by the field sample_seed of schema,
+        so the same indices are selected for lists with the same length, and they are in ascending
+        order, so the first failure in the sample is reported as it is reported without sampling.
+        if data is not a list or tuple, all items are checked.
+    arguments:
+        schema:
+            type: fast_tornado.match_schema.SchemaNode
+            description: the node of the list, whose field sample is not None.
+        data:
+            type: any
+            description: the data.
+    """
+    if not isinstance(data, (list, tuple)):
+        return enumerate(data)
+
+    length = len(data)
+    size = get_sample_size(schema.sample, length)
+    SAMPLE_COUNTER.record(size, length - size)
+    if size == length:
+        return enumerate(data)
+
+    indices = sorted(random.Random(schema.sample_seed).sample(range(length), size))
+    return ((index, data[index]) for index in indices)
@@ -0,0 +1,65 @@
+"""
+description: this module provides the class SchemaNode.
+"""
+
+class SchemaNode:
+    """
+    description: |
+        this class is an immutable node of the initialized schema, built by initialize_schema.
+        the fields, which do not exist in the schema, are None, except those with default values,
+        such as required, additional_properities, minimum_length and maximum_length.
+        since the nodes cannot be changed, a compiled schema can be shared by threads.
+        the node of a definition is shared by all references to it, and its field definition is
+        the name of the definition, the nodes may form cycles if the definitions are recursive.
+        the field checks is the ordered names of the checks which apply to the node, the checks
+        which always pass, such as the type check of any, are not in it, see optimize_checks, and
+        the field optimizations is the pairs of the removed constraints and the reasons.
+        the fields are copied from the schema while the node is built, the field schema is kept
+        only for repr and messages, so changing the schema after it is compiled does not change
+        validation.
+    """
+
+    __slots__ = (
+        'schema',
+        'type_names',
+        'types',
+        'assertion',
+        'assertion_function',
+        'properties',
+        'additional_properities',
+        'required',
+        'dependencies',
+        'items',
+        'vectorizable',
+        'enumeration',
+        'enumeration_members',
+        'pattern',
+        'match',
+        'maximum',
+        'exclusive_maximum',
+        'minimum',
+        'exclusive_minimum',
+        'minimum_length',
+        'maximum_length',
+        'multiple_of',
+        'definition',
+        'sample',
+        'sample_seed',
+        'checks',
+        'optimizations',
+    )
+
+    def __init__(self, **fields):
+        for field in self.__slots__:
+            object.__setattr__(self, field, fields.get(field))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{clazz} is immutable'.format(clazz=type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError('{clazz} is immutable'.format(clazz=type(self).__name__))
+
+    def __repr__(self):
+        # the slots are assigned by object.__setattr__ in __init__, which pylint cannot see.
+        schema = self.schema # pylint: disable = no-member
+        return '{clazz}({schema})'.format(clazz=type(self).__name__, schema=repr(schema))
@@ -0,0 +1,182 @@
+"""
+description: this module provides the class SchemaProfiler.
+"""
+
+import json
+import threading
+import collections
+
+from fast_tornado.exceptions import InvalidArgumentsException
+
+from .schema_node import SchemaNode
+
+ROOT = '$'
+DEFINITION_PREFIX = '#/definitions/'
+
+NodeStatistics = collections.namedtuple('NodeStatistics', ['path', 'visits', 'time', 'failures'])
+
+SORT_KEYS = {
+    'time': lambda item: (-item.time, item.path),
+    'visits': lambda item: (-item.visits, item.path),
+    'failures': lambda item: (-item.failures, item.path),
+    'path': lambda item: item.path,
+}
+
+def __iterate_children(node):
+    if node.properties is not None:
+        for property_name, property_schema in node.properties.items():
+            yield '[{key}]'.format(key=repr(property_name)), property_schema
+
+    if isinstance(node.items, SchemaNode):
+        yield '[*]', node.items
+    elif isinstance(node.items, tuple):
+        for index, item_schema in enumerate(node.items):
+            yield '[{index}]'.format(index=index), item_schema
+
+def get_schema_paths(root):
+    """
+    description: |
+        this function is used to get the schema paths of all nodes of the schema.
+        the root is $, the properties are rendered as ['name'], the items of lists are rendered
+        as [*], and the items of tuples are rendered as their indices. the nodes of definitions
+        are shared, so their paths start from #/definitions/name instead of the first reference.
+    arguments:
+        root:
+            type: fast_tornado.match_schema.SchemaNode
+            description: the root node of the schema.
+    return:
+        type: dict
+        description: the map from id of node to its path.
+    """
+    paths = dict()
+    nodes = collections.deque([(ROOT, root)])
+    while nodes:
+        path, node = nodes.popleft()
+        if node.definition is not None:
+            path = DEFINITION_PREFIX + node.definition
+        if id(node) in paths:
+            continue
+
+        paths[id(node)] = path
+        for suffix, child in __iterate_children(node):
+            nodes.append((path + suffix, child))
+    return paths
+
+class SchemaProfiler:
+    """
+    description: |
+        this class records the number of visits, the cumulative time and the number of failures
+        of every schema path while data is checked with it, see check_schema.
+        the time of a node contains the time of its children, and a failure of a node is counted
+        by all its ancestors, since the exception passes through them.
+        the items of long lists, which are checked by a vectorized scan, are not visited one by one,
+        their time is counted by the list.
+        the profiler can be shared by threads.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__records = dict()
+        self.__paths = dict()
+
+    def get_path(self, root, node):
+        """
+        description: this function is used to get the schema path of the node, see get_schema_paths.
+        arguments:
+            root:
+                type: fast_tornado.match_schema.SchemaNode
+                description: the root node of the schema.
+            node:
+                type: fast_tornado.match_schema.SchemaNode
+                description: the node of the schema.
+        """
+        entry = self.__paths.get(id(root))
+        if entry is None or entry[0] is not root:
+            # the root is kept in the entry, so that its id is not reused by another schema.
+            entry = (root, get_schema_paths(root))
+            with self.__lock:
+                self.__paths[id(root)] = entry
+        return entry[1][id(node)]
+
+    def record(self, path, elapsed_time, failed):
+        """
+        description: this function is used to record a visit of the schema path.
+        arguments:
+            path:
+                type: str
+                description: the schema path.
+            elapsed_time:
+                type: float
+                description: the seconds spent by the visit.
+            failed:
+                type: bool
+                description: whether does the visit raise an exception.
+        """
+        with self.__lock:
+            visits, total_time, failures = self.__records.get(path, (0, 0.0, 0))
+            self.__records[path] = (visits + 1, total_time + elapsed_time, failures + int(failed))
+
+    def statistics(self, sort_by='time'):
+        """
+        description: this function is used to get the statistics of all schema paths.
+        arguments:
+            sort_by:
+                type: str
+                description: one of time, visits, failures and path, the first three are descending.
+        return:
+            type: list
+            description: the list of NodeStatistics.
+        """
+        if sort_by not in SORT_KEYS:
+            raise InvalidArgumentsException(
+                function_name='statistics',
+                message='sort_by should be one of {keys}'.format(keys=', '.join(sorted(SORT_KEYS)))
+            )
+
+        with self.__lock:
+            items = [NodeStatistics(path, *record) for path, record in self.__records.items()]
+        return sorted(items, key=SORT_KEYS[sort_by])
+
+    def render_table(self, sort_by='time', limit=None):
+        """
+        description: this function is used to render the statistics as a text table.
+        arguments:
+            sort_by:
+                type: str
+                description: see statistics.
+            limit:
+                type: [int, None]
+                description: the maximum number of rows, None means all rows.
+        """
+        items = self.statistics(sort_by)[:limit]
+        rows = [('path', 'visits', 'time (ms)', 'failures')]
+        rows.extend(
+            (item.path, str(item.visits), '{:.3f}'.format(item.time * 1000), str(item.failures))
+            for item in items
+        )
+
+        width = max(len(row[0]) for row in rows)
+        return '\n'.join(
+            '{path:<{width}}  {visits:>10}  {time:>12}  {failures:>10}'.format(
+                path=path, width=width, visits=visits, time=total_time, failures=failures
+            )
+            for path, visits, total_time, failures in rows
+        )
+
+    def dump_json(self, sort_by='time'):
+        """
+        description: this function is used to dump the statistics as json, the time is in seconds.
+        arguments:
+            sort_by:
+                type: str
+                description: see statistics.
+        """
+        return json.dumps([item._asdict() for item in self.statistics(sort_by)])
+
+    def clear(self):
+        """
+        description: this function is used to remove all records.
+        """
+        with self.__lock:
+            self.__records.clear()
+            self.__paths.clear()
@@ -0,0 +1,489 @@
+"""
+description: this module provides the class Validator.
+"""
+
+import math
+import time
+import itertools
+import operator
+
+from fast_tornado.exceptions import TypeMismatchException
+from fast_tornado.exceptions import AssertionException
+from fast_tornado.exceptions import CannotFindPropertyException
+from fast_tornado.exceptions import EnumerationException
+from fast_tornado.exceptions import InvalidPropertyException
+from fast_tornado.exceptions import DependenciesException
+from fast_tornado.exceptions import RegexPatternException
+from fast_tornado.exceptions import ExceedMaximumException
+from fast_tornado.exceptions import ExceedMinimumException
+from fast_tornado.exceptions import LengthRangeException
+from fast_tornado.exceptions import MultipleOfException
+from fast_tornado.constants import MATCH_SCHEMA
+
+from .initialize_schema import resolve_types
+from .schema_node import SchemaNode
+from .vectorize import find_first_failure
+from .sample_items import sample_items
+from .memoize import is_memoizable
+from .memoize import get_memo_key
+
+# the number of steps between two readings of the clock, if the slices of validate_in_slices
+# are timed.
+TIME_CHECK_INTERVAL = 64
+
+def render_name(path):
+    """
+    description: |
+        this function is used to render the name of data from its path,
+        the first element of the path is the name of the root, the others are keys or indices.
+    arguments:
+        path:
+            type: list
+            description: the path of data.
+    """
+    return path[0] + ''.join('[{key}]'.format(key=repr(key)) for key in path[1:])
+
+class Validator:
+    """
+    description: |
+        this class holds the root node of an initialized schema, the method validate only runs
+        the checks, the schema is not parsed or initialized again.
+        the nodes deeper than MATCH_SCHEMA.RECURSION_DEPTH are visited with an explicit stack
+        instead of recursion, so the depth of data is not limited by the recursion limit of python.
+        if a profiler is given, every visit of a node is recorded by it, see SchemaProfiler.
+        if a memo is given, the values which pass a leaf node with assertion or pattern
+        are remembered by it, so that they are not checked by the node again, see get_memo_key.
+        the memo is not used while profiling.
+        if sliced is true, the leaves are visited one by one like the other nodes, so that
+        validate_in_slices can suspend the validation between any two elements of data.
+    """
+
+    def __init__(self, schema, profiler=None, memo=None, sliced=False):
+        self.__schema = schema
+        self.__profiler = profiler
+        self.__memo = memo
+        # the leaves are checked by their parents directly, unless they are profiled, memoized
+        # or sliced.
+        self.__inline = profiler is None and memo is None and not sliced
+        self.__visit = self.__check_schema if profiler is None else self.__profile_schema
+
+    @property
+    def schema(self):
+        """
+        description: this function is used to get the private member __schema.
+        """
+        return self.__schema
+
+    @property
+    def memo(self):
+        """
+        description: this function is used to get the memo of the validator, or None.
+        """
+        return self.__memo
+
+    def validate(self, data, name='data'):
+        """
+        description: |
+            this function is used to check whether does the data match the schema.
+            if the data does not match the schema, this function will raise exception.
+        arguments:
+            data:
+                type: any
+                description: the data.
+            name:
+                type: str
+                description: the name of data, which is used in the exception message.
+        """
+        self.__visit(self.__schema, data, [name])
+
+    def validate_in_slices(self, data, name='data', slice_size=None, slice_time=None):
+        """
+        description: |
+            this function is used to check the data like validate, but it is a generator, which
+            yields None whenever a slice of the validation is done, and the caller can do other
+            work before resuming it. the nodes are visited with an explicit stack, one node per
+            step. a slice ends after slice_size steps or after slice_time seconds, whichever comes
+            first, the clock is read every TIME_CHECK_INTERVAL steps, so a timed slice may be
+            a little longer.
+            the data should not be changed until the generator is exhausted.
+        arguments:
+            data:
+                type: any
+                description: the data.
+            name:
+                type: str
+                description: the name of data, which is used in the exception message.
+            slice_size:
+                type: [int, None]
+                description: the maximum number of nodes visited in a slice, None means no limit.
+            slice_time:
+                type: [float, None]
+                description: the maximum time of a slice in seconds, None means no limit.
+        """
+        interval = slice_size
+        if slice_time is not None:
+            interval = TIME_CHECK_INTERVAL
+            if slice_size is not None:
+                interval = min(slice_size, TIME_CHECK_INTERVAL)
+
+        steps = 0
+        start_time = time.perf_counter()
+        for _ in self.__iterate_steps(self.__schema, data, [name], interval or math.inf):
+            steps += interval
+            if slice_size is not None and steps >= slice_size or \
+                    slice_time is not None and time.perf_counter() - start_time >= slice_time:
+                yield None
+                steps = 0
+                start_time = time.perf_counter()
+
+    def check_node(self, schema, data, path):
+        """
+        description: |
+            this function is used to check the data against a node of the schema.
+            if the data does not match the node, this function will raise exception.
+        arguments:
+            schema:
+                type: fast_tornado.match_schema.SchemaNode
+                description: the node of the schema.
+            data:
+                type: any
+                description: the data.
+            path:
+                type: list
+                description: the path of data, see render_name.
+        """
+        self.__visit(schema, data, path)
+
+    def __check_type(self, data, schema, path):
+        expected_types = schema.types
+        if expected_types is None:
+            expected_types = resolve_types(schema)
+
+        if not isinstance(data, expected_types):
+            raise TypeMismatchException(
+                data=data, expected_types=expected_types, name=render_name(path)
+            )
+
+    def __check_assertion(self, data, schema, path):
+        if schema.assertion_function is None:
+            return
+
+        if schema.assertion_function(data):
+            return
+
+        raise AssertionException(data=data, assertion=schema.assertion, name=render_name(path))
+
+    def __check_properties(self, data, schema, path):
+        if schema.properties is None:
+            return
+
+        path.append(None)
+        for property_name, property_schema in schema.properties.items():
+            if property_name not in data and property_schema.required:
+                path.pop()
+                raise CannotFindPropertyException(
+                    data=data,
+                    property_name=property_name,
+                    name=render_name(path)
+                )
+
+            if property_name not in data:
+                continue
+
+            dependencies = property_schema.dependencies
+            for dependency in dependencies:
+                if dependency in data:
+                    continue
+
+                path.pop()
+                raise DependenciesException(
+                    data=data,
+                    name=render_name(path),
+                    property_name=property_name,
+                    nonexistent_dependencies=sorted(set(dependencies) - data.keys())
+                )
+
+            path[-1] = property_name
+            is_leaf = property_schema.properties is None and property_schema.items is None
+            if is_leaf and self.__inline:
+                for check in property_schema.checks:
+                    self.CHECKS[check](self, data[property_name], property_schema, path)
+            else:
+                yield property_schema, data[property_name]
+        path.pop()
+
+        additional_properities = sorted(set(data) - schema.properties.keys())
+        if not schema.additional_properities and additional_properities:
+            raise InvalidPropertyException(
+                data=data,
+                property_names=additional_properities,
+                name=render_name(path)
+            )
+
+    def __check_dict_type_items(self, data, schema, path):
+        items_schema = schema.items
+        if not isinstance(items_schema, SchemaNode):
+            return
+
+        items = enumerate(data)
+        if schema.sample is not None:
+            items = sample_items(schema, data)
+        elif items_schema.vectorizable:
+            start = find_first_failure(items_schema, data)
+            items = enumerate(itertools.islice(data, start, None), start)
+
+        path.append(None)
+        if items_schema.properties is None and items_schema.items is None and self.__inline:
+            # the items have no children, check them here instead of yielding every item.
+            checks = [self.CHECKS[check] for check in items_schema.checks]
+            for index, item in items:
+                path[-1] = index
+                for check in checks:
+                    check(self, item, items_schema, path)
+        else:
+            for index, item in items:
+                path[-1] = index
+                yield items_schema, item
+        path.pop()
+
+    def __check_list_type_items(self, data, schema, path):
+        items_schema = schema.items
+        if not isinstance(items_schema, tuple):
+            return
+
+        if not len(items_schema) == len(data):
+            raise LengthRangeException(
+                name=render_name(path),
+                data=data,
+                maximum_length=len(items_schema),
+                minimum_length=len(items_schema)
+            )
+
+        path.append(None)
+        for index, (item_schema, item) in enumerate(zip(items_schema, data)):
+            path[-1] = index
+            yield item_schema, item
+        path.pop()
+
+    def __check_enumeration(self, data, schema, path):
+        if schema.enumeration is None:
+            return
+
+        try:
+            if data in schema.enumeration_members:
+                return
+        except TypeError:
+            # the data is unhashable, it cannot be found in the frozenset, search the list instead.
+            if data in schema.enumeration:
+                return
+
+        raise EnumerationException(
+            data=data,
+            enumeration=list(schema.enumeration),
+            name=render_name(path)
+        )
+
+    def __check_pattern(self, data, schema, path):
+        if schema.match is None:
+            return
+
+        if schema.match(data):
+            return
+
+        raise RegexPatternException(
+            name=render_name(path),
+            data=data,
+            pattern=schema.pattern
+        )
+
+    def __check_maximum(self, data, schema, path):
+        if schema.maximum is None:
+            return
+
+        maximum = schema.maximum
+
+        exclusive_maximum = schema.exclusive_maximum
+        check = operator.lt if exclusive_maximum else operator.le
+
+        if not check(data, maximum):
+            raise ExceedMaximumException(
+                name=render_name(path),
+                exclusive_maximum=exclusive_maximum,
+                data=data,
+                maximum=maximum
+            )
+
+    def __check_minimum(self, data, schema, path):
+        if schema.minimum is None:
+            return
+
+        minimum = schema.minimum
+
+        exclusive_minimum = schema.exclusive_minimum
+        check = operator.gt if exclusive_minimum else operator.ge
+
+        if not check(data, minimum):
+            raise ExceedMinimumException(
+                name=render_name(path),
+                exclusive_minimum=exclusive_minimum,
+                data=data,
+                minimum=minimum
+            )
+
+    def __check_range(self, data, schema, path):
+        # the merged bounds of optimize_checks, the failures are reported by the checks of
+        # the bounds.
+        if data < schema.maximum if schema.exclusive_maximum else data <= schema.maximum:
+            if data > schema.minimum if schema.exclusive_minimum else data >= schema.minimum:
+                return
+
+        self.__check_maximum(data, schema, path)
+        self.__check_minimum(data, schema, path)
+
+    def __check_length(self, data, schema, path):
+        try:
+            length = len(data)
+        except TypeError:
+            # the data has no length, such as a number, the length range does not apply to it.
+            return
+
+        minimum_length = schema.minimum_length
+        maximum_length = schema.maximum_length
+
+        if minimum_length <= length <= maximum_length:
+            return
+
+        raise LengthRangeException(
+            name=render_name(path),
+            data=data,
+            maximum_length=maximum_length,
+            minimum_length=minimum_length
+        )
+
+    def __check_multiple_of(self, data, schema, path):
+        if schema.multiple_of is None:
+            return
+
+        multiple_of = schema.multiple_of
+        if not data % multiple_of:
+            return
+
+        raise MultipleOfException(
+            name=render_name(path),
+            data=data,
+            multiple_of=multiple_of
+        )
+
+    # the checks of properties and items are generators, which yield the pairs of child node
+    # and child data, the children without children are checked by them directly.
+    CHECKS = {
+        'type': __check_type,
+        'assertion': __check_assertion,
+        'properties': __check_properties,
+        'dict_type_items': __check_dict_type_items,
+        'list_type_items': __check_list_type_items,
+        'enumeration': __check_enumeration,
+        'pattern': __check_pattern,
+        'maximum': __check_maximum,
+        'minimum': __check_minimum,
+        'range': __check_range,
+        'length': __check_length,
+        'multiple_of': __check_multiple_of,
+    }
+
+    def __iterate_schema(self, schema, data, path):
+        # only the checks which apply to the node are run, they are selected while the schema
+        # is initialized.
+        for check in schema.checks:
+            children = self.CHECKS[check](self, data, schema, path)
+            if children is not None:
+                yield from children
+
+    def __check_memoized(self, schema, data, path):
+        key = get_memo_key(schema, data)
+        if key is not None and self.__memo.contains(key):
+            return
+
+        for check in schema.checks:
+            self.CHECKS[check](self, data, schema, path)
+
+        if key is not None:
+            self.__memo.add(key)
+
+    def __run_checks(self, stack, schema, data, path, start):
+        # the checks of the node are run from start, until a recursive check suspends the node.
+        if start == 0 and self.__memo is not None and is_memoizable(schema):
+            self.__check_memoized(schema, data, path)
+            return
+
+        checks = schema.checks
+        for index in range(start, len(checks)):
+            children = self.CHECKS[checks[index]](self, data, schema, path)
+            if children is not None:
+                stack.append((children, schema, data, index + 1))
+                return
+
+    def __iterate_steps(self, schema, data, path, interval):
+        # the stack holds the suspended recursive checks of the ancestors, a child is checked
+        # completely before its parent is resumed, so the checks run in the same order as recursion.
+        # None is yielded after every interval steps, an infinite interval never suspends
+        # the checks.
+        stack = list()
+        self.__run_checks(stack, schema, data, path, 0)
+        steps = interval
+        while stack:
+            steps -= 1
+            if not steps:
+                yield None
+                steps = interval
+            children, parent_schema, parent_data, index = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                self.__run_checks(stack, parent_schema, parent_data, path, index)
+            else:
+                self.__run_checks(stack, child[0], child[1], path, 0)
+
+    def __check_schema_iteratively(self, schema, data, path):
+        for _ in self.__iterate_steps(schema, data, path, math.inf):
+            pass
+
+    def __check_schema(self, schema, data, path):
+        # the shallow nodes are checked by recursion, which is faster, and the deep nodes are
+        # checked with an explicit stack, so that the depth of data is not limited by the recursion
+        # limit.
+        if len(path) > MATCH_SCHEMA.RECURSION_DEPTH:
+            self.__check_schema_iteratively(schema, data, path)
+            return
+
+        if self.__memo is not None and is_memoizable(schema):
+            self.__check_memoized(schema, data, path)
+            return
+
+        for check in schema.checks:
+            children = self.CHECKS[check](self, data, schema, path)
+            if children is not None:
+                for child_schema, child_data in children:
+                    self.__check_schema(child_schema, child_data, path)
+
+    def __start_profile(self, schema, data, path):
+        schema_path = self.__profiler.get_path(self.__schema, schema)
+        return self.__iterate_schema(schema, data, path), schema_path, time.perf_counter()
+
+    def __profile_schema(self, schema, data, path):
+        stack = [self.__start_profile(schema, data, path)]
+        try:
+            while stack:
+                child = next(stack[-1][0], None)
+                if child is None:
+                    _, schema_path, start_time = stack.pop()
+                    self.__profiler.record(schema_path, time.perf_counter() - start_time, False)
+                    continue
+
+                stack.append(self.__start_profile(child[0], child[1], path))
+        finally:
+            # the stack is not empty only if an exception is raised, which fails all the nodes
+            # in it.
+            end_time = time.perf_counter()
+            for _, schema_path, start_time in stack:
+                self.__profiler.record(schema_path, end_time - start_time, True)
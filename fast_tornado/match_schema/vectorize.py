@@ -0,0 +1,142 @@
+"""
+description: |
+    this module provides the vectorized fast path for lists of numbers.
+    numpy is optional, if it is not installed, the fast path is never taken.
+"""
+
+import numbers
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from fast_tornado.constants import MATCH_SCHEMA
+
+VECTORIZABLE_FIELDS = {
+    'type',
+    'minimum',
+    'maximum',
+    'exclusive_minimum',
+    'exclusive_maximum',
+    'multiple_of',
+    'required',
+    'description',
+}
+NUMERIC_TYPES = {int, float}
+BOUND_FIELDS = ('minimum', 'maximum', 'multiple_of')
+
+# integers whose absolute value is less than this can be converted to float64 exactly.
+EXACT_FLOAT_INTEGER = 2 ** 53
+INT64_RANGE = (-2 ** 63, 2 ** 63)
+
+def is_vectorizable(schema, resolved_types):
+    """
+    description: |
+        this function is used to check whether the items schema can be checked by array operations,
+        that is, it only contains numeric types and numeric bounds.
+    arguments:
+        schema:
+            type: dict
+            description: the schema of the items.
+        resolved_types:
+            type: [tuple, None]
+            description: the resolved types of the schema, None if they cannot be resolved.
+    """
+    if resolved_types is None or not set(resolved_types) <= NUMERIC_TYPES:
+        return False
+
+    if not set(schema) <= VECTORIZABLE_FIELDS:
+        return False
+
+    for field in BOUND_FIELDS:
+        if field not in schema:
+            continue
+        if isinstance(schema[field], bool) or not isinstance(schema[field], (int, float)):
+            return False
+
+    return schema.get('multiple_of', 1) != 0
+
+def __is_exact(array, node):
+    bounds = [getattr(node, field) for field in BOUND_FIELDS if getattr(node, field) is not None]
+
+    if array.dtype.kind == 'i':
+        minimum, maximum = INT64_RANGE
+        if any(isinstance(bound, int) and not minimum <= bound < maximum for bound in bounds):
+            return False
+        if any(isinstance(bound, float) for bound in bounds):
+            return -EXACT_FLOAT_INTEGER < array.min() and array.max() < EXACT_FLOAT_INTEGER
+        return True
+
+    return all(isinstance(bound, float) or abs(bound) < EXACT_FLOAT_INTEGER for bound in bounds)
+
+def __get_passed(array, node):
+    passed = numpy.ones(array.shape, dtype=bool)
+
+    if node.maximum is not None:
+        if node.exclusive_maximum:
+            passed &= array < node.maximum
+        else:
+            passed &= array <= node.maximum
+
+    if node.minimum is not None:
+        if node.exclusive_minimum:
+            passed &= array > node.minimum
+        else:
+            passed &= array >= node.minimum
+
+    if node.multiple_of is not None:
+        passed &= array % node.multiple_of == 0
+
+    return passed
+
+def find_first_failure(node, data):
+    """
+    description: |
+        this function is used to find the index of the first item, which may not match the
+        items schema. all items before the returned index are known to match the schema, so the
+        caller only needs to check the items from the returned index on, one by one.
+        if the fast path is not applicable, 0 is returned.
+    arguments:
+        node:
+            type: fast_tornado.match_schema.SchemaNode
+            description: the node of the items, which is vectorizable.
+        data:
+            type: any
+            description: the list or tuple of items.
+    """
+    if numpy is None or type(data) not in (list, tuple):
+        return 0
+    if len(data) < MATCH_SCHEMA.VECTORIZE_THRESHOLD:
+        return 0
+
+    classes = set(map(type, data))
+    if not all(issubclass(clazz, node.types) for clazz in classes):
+        return 0
+
+    try:
+        array = numpy.array(data)
+    except (OverflowError, TypeError, ValueError):
+        return 0
+
+    if array.dtype.kind == 'b':
+        array = array.astype(numpy.int64)
+
+    if array.ndim != 1 or array.dtype.kind not in 'if':
+        return 0
+
+    if array.dtype.kind == 'f' and any(issubclass(clazz, numbers.Integral) for clazz in classes):
+        # integers have been converted to float64, they must have been converted exactly.
+        magnitudes = numpy.abs(array[numpy.isfinite(array)])
+        if magnitudes.size and magnitudes.max() >= EXACT_FLOAT_INTEGER:
+            return 0
+
+    if not __is_exact(array, node):
+        return 0
+
+    with numpy.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        passed = __get_passed(array, node)
+
+    if passed.all():
+        return len(data)
+    return int(numpy.argmin(passed))
@@ -3,3 +3,4 @@ description: this module provides functions or classes about server.
 """
 
 from .handler import  generate_request_handler
+from .resolve_types import resolve_types
@@ -0,0 +1,86 @@
+"""
+description: |
+    this module provides the function get_cached_document.
+    the documents are stored by pickle, so the cache directory must only be writable by trusted
+    users.
+"""
+
+import os
+import sys
+import pickle
+import hashlib
+import tempfile
+
+from fast_tornado import VERSION
+from fast_tornado.constants import ENCODE
+from fast_tornado.constants import FILE_MODE
+
+SUFFIX = '.pickle'
+
+def get_cache_key(docstring):
+    """
+    description: |
+        this function is used to get the cache key of the docstring,
+        the version of fast_tornado is a part of the key, since the parsing of documents may change,
+        and so is the version of python, since the files are pickled with its highest protocol.
+    arguments:
+        docstring:
+            type: str
+            description: the docstring of the function.
+    """
+    python_version = '{0}.{1}'.format(*sys.version_info[:2])
+    content = '\0'.join([VERSION, python_version, docstring])
+    return hashlib.sha256(content.encode(ENCODE.UTF8)).hexdigest()
+
+def __load(file_path):
+    try:
+        with open(file_path, FILE_MODE.READ_BINARY) as file:
+            return True, pickle.load(file)
+    except Exception: # pylint: disable = broad-except
+        # any file, which cannot be loaded, such as a partially written file or a file pickled
+        # by a newer python, is parsed again.
+        return False, None
+
+def __dump(directory, file_path, document):
+    # the document is written into a temporary file first, and then renamed,
+    # so that other processes never load a partially written file.
+    try:
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=SUFFIX)
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(descriptor, FILE_MODE.WRITE_BINARY) as file:
+            pickle.dump(document, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, file_path)
+    except OSError:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+def get_cached_document(directory, docstring, factory):
+    """
+    description: |
+        this function is used to get the parsed document of the docstring from the cache directory.
+        if the document is not cached, or the cached file cannot be loaded, the document is parsed
+        by factory and stored. if the directory is not writable, the document is not cached.
+    arguments:
+        directory:
+            type: str
+            description: the cache directory.
+        docstring:
+            type: str
+            description: the docstring of the function.
+        factory:
+            type: types.FunctionType
+            description: the function without arguments, which parses and checks the document.
+    """
+    file_path = os.path.join(directory, get_cache_key(docstring) + SUFFIX)
+
+    found, document = __load(file_path)
+    if found:
+        return document
+
+    document = factory()
+    __dump(directory, file_path, document)
+    return document
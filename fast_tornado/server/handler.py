@@ -16,6 +16,9 @@ from fast_tornado.exceptions import CannotFindArgumentSchemaException
 from fast_tornado.exceptions import UnknownArgumentSchemaException
 
 from fast_tornado.constants import DOCUMENT_SCHEMA
+from fast_tornado.constants import SERVER
+
+from .document_cache import get_cached_document
 
 def check_arguments_field(function, document):
     """
@@ -38,15 +41,13 @@ def check_arguments_field(function, document):
             function=function
         )
 
-def get_document(function):
+def parse_document(function):
     """
     description: |
-        this function is used to get document of the function.
+        this function is used to parse the document of the function, and check it with
+        DOCUMENT_SCHEMA.
         if there are something wrong with the document, raise exception.
     """
-    if function.__doc__ is None:
-        raise CannotFindDocumentException(function)
-
     document = load_yaml(content=function.__doc__)
 
     check_schema(
@@ -55,6 +56,28 @@ def get_document(function):
         name='{name}.__doc__'.format(name='.'.join([function.__module__, function.__name__]))
     )
 
+    return document
+
+def get_document(function):
+    """
+    description: |
+        this function is used to get document of the function.
+        if there are something wrong with the document, raise exception.
+        if SERVER.DOCUMENT_CACHE_DIRECTORY is set, the parsed document is loaded from the cache
+        directory, so that the docstring is only parsed once across restarts.
+    """
+    if function.__doc__ is None:
+        raise CannotFindDocumentException(function)
+
+    if SERVER.DOCUMENT_CACHE_DIRECTORY is None:
+        document = parse_document(function)
+    else:
+        document = get_cached_document(
+            directory=SERVER.DOCUMENT_CACHE_DIRECTORY,
+            docstring=function.__doc__,
+            factory=lambda: parse_document(function)
+        )
+
     check_arguments_field(
         function=function,
         document=document
@@ -79,6 +102,8 @@ def generate_request_handler(function):
     document = get_document(function)
 
     class RequestHandler(tornado.web.RequestHandler):
+        __document__ = document
+
         def get(self, *args, **kwargs):
             arguments = __parse_argument(document=document, handler=self, args=args, kwargs=kwargs)
             self.write('')
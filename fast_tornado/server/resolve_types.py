@@ -0,0 +1,36 @@
+"""
+description: this module provides the function resolve_types.
+"""
+
+from fast_tornado.match_schema import resolve_type
+
+def __get_type_names(document):
+    for argument in document.get('arguments', list()):
+        yield argument['type']
+
+    if 'type' in document.get('return', dict()):
+        yield document['return']['type']
+
+def resolve_types(handlers):
+    """
+    description: |
+        this function is used to resolve all types used by the documents of request handlers,
+        it should be called before the server starts listening, so that the dotted types are
+        imported once at startup, and the types which cannot be imported are reported at startup.
+    arguments:
+        handlers:
+            type: list
+            description: |
+                the request handlers generated by generate_request_handler,
+                or the rules of tornado.web.Application like (api_path, handler).
+    """
+    for handler in handlers:
+        if isinstance(handler, (tuple, list)):
+            handler = handler[1]
+
+        document = getattr(handler, '__document__', None)
+        if document is None:
+            continue
+
+        for type_name in __get_type_names(document):
+            resolve_type(type_name)
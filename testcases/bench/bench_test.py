@@ -0,0 +1,104 @@
+"""
+description: this module contains the testcases about the benchmark of match_schema.
+"""
+
+import json
+import pytest
+
+from fast_tornado.bench import generate_payload
+from fast_tornado.bench import run_benchmark
+from fast_tornado.bench import compare_results
+from fast_tornado.bench.__main__ import main
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.constants import BENCH
+from fast_tornado.constants import MATCH_SCHEMA
+
+from fast_tornado.exceptions import SchemaException
+
+CASES = dict(BENCH.CASES)
+
+@pytest.fixture(name='fast', autouse=True)
+def __fast(monkeypatch):
+    monkeypatch.setattr(BENCH, 'MINIMUM_TIME', 0.001)
+    monkeypatch.setattr(
+        BENCH, 'CASES', {'small': (2, 3, 4, BENCH.MIXED), 'tiny': (1, 2, 0, BENCH.TYPES)}
+    )
+
+@pytest.mark.parametrize('name', sorted(CASES))
+@pytest.mark.parametrize('backend', [MATCH_SCHEMA.WALKER, MATCH_SCHEMA.CODE])
+def test_payloads_are_valid(name, backend):
+    schema, data = generate_payload(*CASES[name])
+    compile_schema(schema, backend).validate(data)
+
+@pytest.mark.parametrize(
+    'depth, width, length, constraint',
+    [
+        [1, 3, 0, BENCH.TYPES],
+        [2, 2, 0, BENCH.RANGES],
+        [3, 2, 5, BENCH.STRINGS],
+        [2, 3, 2, BENCH.MIXED],
+    ]
+)
+def test_payload_shape(depth, width, length, constraint):
+    schema, data = generate_payload(depth, width, length, constraint)
+    if length:
+        assert schema['type'] == 'list'
+        assert len(data) == length
+        assert data[0] == data[-1] and data[0] is not data[-1]
+        schema, data = schema['items'], data[0]
+
+    for _ in range(depth):
+        assert len(data) == width
+        schema = schema['properties']['property_0']
+        data = data['property_0']
+    assert not isinstance(data, dict)
+
+def test_payload_fails_on_wrong_leaf():
+    schema, data = generate_payload(1, 3, 0, BENCH.MIXED)
+    data['property_1'] = -1
+    with pytest.raises(SchemaException):
+        compile_schema(schema).validate(data)
+
+def test_run_benchmark():
+    results = run_benchmark(repeat=1)
+    assert sorted(results) == ['small', 'tiny']
+    for result in results.values():
+        assert result['ops_per_second'] > 0
+        assert result['peak_memory'] >= 0
+
+@pytest.mark.parametrize(
+    'current, regressed',
+    [
+        [100.0, False],
+        [91.0, False],
+        [89.0, True],
+        [200.0, False],
+    ]
+)
+def test_compare_results(current, regressed):
+    baseline = {'a': {'ops_per_second': 100.0}, 'b': {'ops_per_second': 1.0}}
+    results = {'a': {'ops_per_second': current}, 'c': {'ops_per_second': 1.0}}
+    comparisons = compare_results(baseline, results, tolerance=0.1)
+
+    assert len(comparisons) == 1
+    assert comparisons[0].name == 'a'
+    assert comparisons[0].ratio == pytest.approx(current / 100.0)
+    assert comparisons[0].regressed is regressed
+
+def test_main(tmpdir, capsys):
+    baseline_path = str(tmpdir.join('baseline.json'))
+    assert main(['--case', 'tiny', '--repeat', '1', '--save', baseline_path]) == 0
+    assert 'tiny' in capsys.readouterr().out
+
+    with open(baseline_path) as file:
+        document = json.load(file)
+    assert sorted(document['results']) == ['tiny']
+
+    document['results']['tiny']['ops_per_second'] *= 1000
+    with open(baseline_path, 'w') as file:
+        json.dump(document, file)
+
+    arguments = ['--case', 'tiny', '--repeat', '1', '--baseline', baseline_path]
+    arguments += ['--backend', 'code']
+    assert main(arguments) == 1
+    assert 'regressed' in capsys.readouterr().out
@@ -0,0 +1,130 @@
+"""
+description: this module contains the testcases about the lazy messages of schema exceptions.
+"""
+
+import pickle
+import collections
+import pytest
+
+from fast_tornado.match_schema import check_schema
+from fast_tornado.exceptions import SchemaException
+from fast_tornado.exceptions import TypeMismatchException
+from fast_tornado.exceptions import LengthRangeException
+from fast_tornado.exceptions import InvalidPropertyException
+from fast_tornado.exceptions.limit_repr import limit_repr
+
+class Counter:
+    """
+    description: this class counts the calls of __repr__.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __repr__(self):
+        self.count += 1
+        return 'Counter()'
+
+def get_recursive_list():
+    value = [1]
+    value.append(value)
+    return value
+
+@pytest.mark.parametrize(
+    'value', [
+        1,
+        1.5,
+        None,
+        'abc',
+        b'abc',
+        [],
+        (),
+        (1,),
+        set(),
+        {1, 2},
+        frozenset(),
+        frozenset({1}),
+        {'a': [1, (2,), {'b': None}]},
+        collections.OrderedDict(a=1),
+        get_recursive_list(),
+        ['x' * 100] * 10,
+    ]
+)
+def test_limit_repr_without_truncation(value):
+    assert limit_repr(value, 10000) == repr(value)
+    assert limit_repr(value, None) == repr(value)
+
+@pytest.mark.parametrize(
+    'value', [
+        'x' * 10000,
+        list(range(10000)),
+        {index: [index] for index in range(10000)},
+        [['x' * 100] * 100] * 100,
+    ]
+)
+@pytest.mark.parametrize('limit', [0, 3, 10, 100])
+def test_limit_repr_with_truncation(value, limit):
+    text = limit_repr(value, limit)
+    assert len(text) <= max(limit, 3)
+    assert text.endswith('...')
+    assert repr(value).startswith(text[:-3])
+
+def test_message_is_rendered_lazily():
+    data = Counter()
+    exception = TypeMismatchException(data=data, expected_types=(int,), name='data')
+    assert data.count == 0
+
+    assert str(exception) == 'data = Counter(), but its type should be int'
+    assert data.count == 1
+
+def test_fields():
+    with pytest.raises(LengthRangeException) as execution_infomation:
+        check_schema('type: list\nmaximum_length: 1', [1, 2])
+
+    exception = execution_infomation.value
+    assert exception.name == 'data'
+    assert exception.data == [1, 2]
+    assert exception.minimum_length == 0
+    assert exception.maximum_length == 1
+    assert repr(exception) == \
+        "LengthRangeException('data = [1, 2], its length is 2, but it should between 0 and 1')"
+
+def test_repr_limit(monkeypatch):
+    data = list(range(100000))
+    with pytest.raises(SchemaException) as execution_infomation:
+        check_schema('type: dict', data)
+
+    assert len(str(execution_infomation.value)) < SchemaException.repr_limit + 100
+
+    monkeypatch.setattr(SchemaException, 'repr_limit', 10)
+    assert str(execution_infomation.value) == 'data = [0, 1, ..., but its type should be dict'
+
+    monkeypatch.setattr(SchemaException, 'repr_limit', None)
+    assert str(execution_infomation.value) == \
+        'data = {data}, but its type should be dict'.format(data=repr(data))
+
+def test_exception_is_picklable():
+    exception = TypeMismatchException(data=[1, 2], expected_types=(str,), name='data')
+    restored = pickle.loads(pickle.dumps(exception))
+
+    assert isinstance(restored, TypeMismatchException)
+    assert restored.data == [1, 2]
+    assert str(restored) == str(exception)
+
+def test_args():
+    exception = TypeMismatchException(data=[1, 2], expected_types=(str,), name='data')
+    assert exception.args == ([1, 2], (str,), 'data')
+    assert str(type(exception)(*exception.args)) == str(exception)
+
+    assert str(SchemaException('message')) == 'message'
+    assert SchemaException('message').args == ('message',)
+    assert repr(SchemaException('message')) == "SchemaException('message')"
+    assert str(SchemaException()) == ''
+
+def test_render_error_is_not_raised():
+    exception = InvalidPropertyException(data={1: 'a'}, property_names=[1], name='data')
+    assert str(exception) == "property '1' in data = {1: 'a'} is not allowed"
+
+    exception = LengthRangeException(data=1, minimum_length=0, maximum_length=0, name='data')
+    assert str(exception) == 'LengthRangeException(1, 0, 0, {name})'.format(name=repr('data'))
+    assert repr(exception) == 'LengthRangeException({message})'.format(message=repr(str(exception)))
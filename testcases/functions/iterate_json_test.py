@@ -0,0 +1,108 @@
+"""
+description: this module contains the testcases about iterate_json.
+"""
+
+import io
+import json
+import random
+import pytest
+
+from fast_tornado.functions import iterate_json
+from fast_tornado.constants import JSON_EVENT
+from fast_tornado.exceptions import InvalidJsonException
+
+def build(events):
+    containers = [list()]
+    keys = [None]
+    for event, value in events:
+        if event == JSON_EVENT.MAP_KEY:
+            keys[-1] = value
+            continue
+
+        if event in (JSON_EVENT.END_MAP, JSON_EVENT.END_ARRAY):
+            containers.pop()
+            keys.pop()
+            continue
+
+        item = {
+            JSON_EVENT.START_MAP: dict,
+            JSON_EVENT.START_ARRAY: list,
+        }.get(event, lambda: value)()
+        if isinstance(containers[-1], dict):
+            containers[-1][keys[-1]] = item
+        else:
+            containers[-1].append(item)
+
+        if event in (JSON_EVENT.START_MAP, JSON_EVENT.START_ARRAY):
+            containers.append(item)
+            keys.append(None)
+    return containers[0][0]
+
+def generate_document(random_generator, depth=0):
+    choice = random_generator.randrange(8 if depth < 4 else 6)
+    if choice == 0:
+        return random_generator.randint(-10 ** 20, 10 ** 20)
+    if choice == 1:
+        return random_generator.uniform(-1e10, 1e10)
+    if choice == 2:
+        length = random_generator.randrange(5)
+        return ''.join(random_generator.choice('ab"\\\né中\U0001f600') for _ in range(length))
+    if choice == 3:
+        return random_generator.choice([True, False, None])
+    if choice in (4, 5):
+        return random_generator.randrange(100)
+    if choice == 6:
+        length = random_generator.randrange(4)
+        return [generate_document(random_generator, depth + 1) for _ in range(length)]
+    return {
+        str(random_generator.randrange(100)): generate_document(random_generator, depth + 1)
+        for _ in range(random_generator.randrange(4))
+    }
+
+def split(text, size):
+    return [text[index:index + size] for index in range(0, len(text), size)]
+
+def test_events():
+    assert list(iterate_json('{"a": [1, 2.5, "x"], "b": null}')) == [
+        (JSON_EVENT.START_MAP, None),
+        (JSON_EVENT.MAP_KEY, 'a'),
+        (JSON_EVENT.START_ARRAY, None),
+        (JSON_EVENT.VALUE, 1),
+        (JSON_EVENT.VALUE, 2.5),
+        (JSON_EVENT.VALUE, 'x'),
+        (JSON_EVENT.END_ARRAY, None),
+        (JSON_EVENT.MAP_KEY, 'b'),
+        (JSON_EVENT.VALUE, None),
+        (JSON_EVENT.END_MAP, None),
+    ]
+
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 4096])
+def test_chunked_stream(size):
+    random_generator = random.Random(size)
+    for _ in range(100):
+        document = generate_document(random_generator)
+        text = json.dumps(document, ensure_ascii=random_generator.random() < 0.5)
+
+        expected = json.loads(text)
+        assert build(iterate_json(split(text, size))) == expected
+        assert build(iterate_json(split(text.encode('utf-8'), size))) == expected
+        assert build(iterate_json(io.BytesIO(text.encode('utf-8')), chunk_size=size)) == expected
+
+@pytest.mark.parametrize(
+    'text, message',
+    [
+        ['', 'invalid json at position 0, unexpected end of json'],
+        ['[1, 2', 'invalid json at position 5, unexpected end of json'],
+        ['[1 2]', "invalid json at position 3, expecting ',' delimiter"],
+        ['{"a" 1}', "invalid json at position 5, expecting ':' delimiter"],
+        ['{1: 1}', 'invalid json at position 1, expecting property name enclosed in double quotes'],
+        ['[1, 2]]', 'invalid json at position 6, extra data'],
+        ['"abc', 'invalid json at position 0, unterminated string'],
+        ['[tru]', "invalid json at position 1, unexpected character 't'"],
+    ]
+)
+def test_invalid_json(text, message):
+    with pytest.raises(InvalidJsonException) as execution_infomation:
+        list(iterate_json(split(text, 1)))
+
+    assert str(execution_infomation.value) == message
@@ -0,0 +1,84 @@
+import os
+import pytest
+
+from fast_tornado.server import generate_request_handler
+from fast_tornado.server import handler as handler_module
+from fast_tornado.server import document_cache
+from fast_tornado.constants import SERVER
+from fast_tornado.exceptions import SchemaException
+
+def function(x):
+    """
+    description: this is description.
+    api_path: /test
+    methods: [get]
+    arguments:
+        - name: x
+          type: int
+          from: query
+    return:
+        type: int
+        description: this is return.
+    """
+    return x
+
+def function_with_invalid_document(x):
+    """
+    description: this is description.
+    api_path: /test
+    methods: [gets]
+    """
+    return x
+
+@pytest.fixture(name='cache_directory')
+def __cache_directory(tmp_path, monkeypatch):
+    directory = str(tmp_path / 'cache')
+    monkeypatch.setattr(SERVER, 'DOCUMENT_CACHE_DIRECTORY', directory)
+    yield directory
+
+def forbid_parsing(monkeypatch):
+    def load_yaml(*args, **kwargs):
+        raise AssertionError('the document should be loaded from the cache')
+
+    monkeypatch.setattr(handler_module, 'load_yaml', load_yaml)
+
+def test_document_is_cached(cache_directory, monkeypatch):
+    document = generate_request_handler(function).__document__
+    key = document_cache.get_cache_key(function.__doc__)
+    assert os.listdir(cache_directory) == [key + '.pickle']
+
+    forbid_parsing(monkeypatch)
+    assert generate_request_handler(function).__document__ == document
+
+def test_version_is_a_part_of_key(monkeypatch):
+    key = document_cache.get_cache_key(function.__doc__)
+    monkeypatch.setattr(document_cache, 'VERSION', 'v99.0.0')
+    assert document_cache.get_cache_key(function.__doc__) != key
+
+def test_python_version_is_a_part_of_key(monkeypatch):
+    key = document_cache.get_cache_key(function.__doc__)
+    monkeypatch.setattr(document_cache.sys, 'version_info', (99, 0, 0))
+    assert document_cache.get_cache_key(function.__doc__) != key
+
+@pytest.mark.parametrize('content', [b'', b'broken', b'\x80\x63', b'\x80\x02}q\x00'])
+def test_broken_cache_file(cache_directory, content):
+    document = generate_request_handler(function).__document__
+    file_path = os.path.join(cache_directory, os.listdir(cache_directory)[0])
+    with open(file_path, 'wb') as file:
+        file.write(content)
+
+    assert generate_request_handler(function).__document__ == document
+    assert generate_request_handler(function).__document__ == document
+
+def test_invalid_document_is_not_cached(cache_directory):
+    with pytest.raises(SchemaException):
+        generate_request_handler(function_with_invalid_document)
+
+    assert not os.path.exists(cache_directory) or not os.listdir(cache_directory)
+
+def test_unwritable_cache_directory(tmp_path, monkeypatch):
+    file_path = tmp_path / 'file'
+    file_path.write_text('')
+    monkeypatch.setattr(SERVER, 'DOCUMENT_CACHE_DIRECTORY', str(file_path / 'cache'))
+
+    assert generate_request_handler(function).__document__['api_path'] == '/test'
@@ -0,0 +1,50 @@
+import pytest
+
+from fast_tornado.server import generate_request_handler
+from fast_tornado.server import resolve_types
+from fast_tornado.match_schema import TYPE_REGISTRY
+
+def function(x):
+    """
+    description: this is description.
+    api_path: /test
+    methods: [get]
+    arguments:
+        - name: x
+          type: fractions.Fraction
+          from: query
+    return:
+        type: decimal.Decimal
+        description: this is return.
+    """
+    return x
+
+def function_with_unknown_type(x):
+    """
+    description: this is description.
+    api_path: /test
+    methods: [get]
+    arguments:
+        - name: x
+          type: nonexistent_module.Type
+          from: query
+    return:
+        type: int
+    """
+    return x
+
+@pytest.mark.parametrize('rule', [False, True])
+def test_resolve_types(rule):
+    TYPE_REGISTRY.pop('fractions.Fraction', None)
+    TYPE_REGISTRY.pop('decimal.Decimal', None)
+
+    handler = generate_request_handler(function)
+    resolve_types([('/test', handler) if rule else handler, object])
+
+    assert 'fractions.Fraction' in TYPE_REGISTRY
+    assert 'decimal.Decimal' in TYPE_REGISTRY
+
+def test_resolve_unknown_types():
+    handler = generate_request_handler(function_with_unknown_type)
+    with pytest.raises(ImportError):
+        resolve_types([handler])
@@ -0,0 +1,173 @@
+"""
+description: this module contains the testcases about check_changes.
+"""
+
+import copy
+import pytest
+
+from fast_tornado.match_schema import check_schema
+from fast_tornado.match_schema import check_changes
+
+from fast_tornado.exceptions import SchemaException
+
+SCHEMA = '''
+type: dict
+additional_properities: false
+properties:
+    name:
+        type: str
+    age:
+        type: int
+        required: false
+        dependencies: [name]
+    tags:
+        type: list
+        maximum_length: 3
+        items:
+            type: str
+            enumeration: [a, b, c]
+    point:
+        type: list
+        required: false
+        items:
+            - type: int
+            - type: float
+    profile:
+        type: dict
+        required: false
+        assertion: 'lambda x: len(x) < 3'
+        properties:
+            email:
+                type: str
+                pattern: '[a-z]+@[a-z]+'
+            phone:
+                type: str
+                required: false
+    extra:
+        type: dict
+        required: false
+'''
+
+DOCUMENT = {
+    'name': 'zq',
+    'age': 18,
+    'tags': ['a', 'b'],
+    'point': [1, 2.0],
+    'profile': {'email': 'zq@x'},
+    'extra': {'anything': [1, 2]},
+}
+
+def check(function, *args):
+    try:
+        function(*args)
+    except SchemaException as exception:
+        return str(exception)
+    return None
+
+def apply_patch(document, path, value):
+    *parents, key = path
+    target = document
+    for parent in parents:
+        target = target[parent]
+
+    if value is DELETE:
+        del target[key]
+    elif isinstance(target, list) and key == len(target):
+        target.append(value)
+    else:
+        target[key] = value
+
+DELETE = object()
+
+@pytest.mark.parametrize(
+    'path, value',
+    [
+        [['name'], 'x'],
+        [['name'], 1],
+        [['name'], DELETE],
+        [['age'], 'x'],
+        [['age'], DELETE],
+        [['tags', 0], 'c'],
+        [['tags', 1], 'd'],
+        [['tags', 2], 'a'],
+        [['tags', 2], 1],
+        [['tags'], ['a', 'a', 'a', 'a']],
+        [['point', 1], 3],
+        [['point', 1], DELETE],
+        [['profile', 'email'], 'x'],
+        [['profile', 'email'], DELETE],
+        [['profile', 'phone'], '123'],
+        [['profile', 'phone'], 123],
+        [['profile', 'other'], 1],
+        [['profile'], {'email': 'a@b', 'phone': '1', 'x': 1}],
+        [['extra', 'anything', 0], 'x'],
+        [['unknown'], 1],
+        [['profile'], []],
+        [['profile', 'email'], ['a@b']],
+    ]
+)
+def test_same_result_as_check_schema(path, value):
+    document = copy.deepcopy(DOCUMENT)
+    apply_patch(document, path, value)
+    assert check(check_changes, SCHEMA, document, [path]) == check(check_schema, SCHEMA, document)
+
+def test_dependencies_of_other_properties():
+    document = copy.deepcopy(DOCUMENT)
+    del document['name']
+    message = check(check_changes, SCHEMA, document, [['name']])
+    assert message == check(check_schema, SCHEMA, document)
+
+def test_unchanged_subtrees_are_not_visited():
+    document = copy.deepcopy(DOCUMENT)
+    document['tags'][0] = 'invalid'
+    document['profile']['email'] = 'zq@y'
+
+    assert check(check_changes, SCHEMA, document, [['profile', 'email']]) is None
+    assert check(check_changes, SCHEMA, document, [['tags', 1]]) is None
+    assert check(check_changes, SCHEMA, document, [['tags']]) is not None
+    assert check(check_changes, SCHEMA, document, [[]]) is not None
+
+@pytest.mark.parametrize(
+    'paths',
+    [
+        [['tags', 0], ['tags']],
+        [['tags'], ['tags', 0]],
+        [['tags', 5], ['tags', 0]],
+        [['tags', 'x'], ['tags', 0]],
+    ]
+)
+def test_overlapped_paths(paths):
+    document = copy.deepcopy(DOCUMENT)
+    document['tags'][0] = 'invalid'
+    assert check(check_changes, SCHEMA, document, paths) == \
+        "data['tags'][0] = 'invalid', does not in enumeration ['a', 'b', 'c']"
+
+INVALID_TAG = "data['tags'][1] = 'invalid', does not in enumeration ['a', 'b', 'c']"
+
+@pytest.mark.parametrize(
+    'paths, message',
+    [
+        [[['tags', -1]], INVALID_TAG],
+        [[['tags', -2]], None],
+        [[['tags', -3]], None],
+        [[['tags', -1], ['tags', 1]], INVALID_TAG],
+        [[['tags', 'x']], INVALID_TAG],
+        [[['tags', True]], INVALID_TAG],
+        [[['tags', 1.0]], INVALID_TAG],
+    ]
+)
+def test_indices_of_lists(paths, message):
+    document = copy.deepcopy(DOCUMENT)
+    document['tags'][1] = 'invalid'
+    assert check(check_changes, SCHEMA, document, paths) == message
+
+def test_no_changes():
+    document = copy.deepcopy(DOCUMENT)
+    document['tags'][0] = 'invalid'
+    check_changes(SCHEMA, document, [])
+
+def test_name():
+    document = copy.deepcopy(DOCUMENT)
+    document['age'] = 'x'
+    assert check(check_changes, SCHEMA, document, [['age']], 'body') == \
+        "body['age'] = 'x', but its type should be int"
@@ -0,0 +1,80 @@
+"""
+description: this module contains the testcases about check_many.
+"""
+
+import pickle
+import pytest
+
+from fast_tornado.match_schema import check_many
+
+from fast_tornado.exceptions import TypeMismatchException
+from fast_tornado.exceptions import CannotFindPropertyException
+from fast_tornado.exceptions import InitializeLambdaExpressionException
+
+SCHEMA = '''
+type: dict
+properties:
+    x:
+        type: int
+'''
+
+def generate_records(count):
+    for index in range(count):
+        if index % 7 == 3:
+            yield {'x': str(index)}
+        elif index % 11 == 5:
+            yield {}
+        else:
+            yield {'x': index}
+
+def assert_results(results, count):
+    results = list(results)
+    assert len(results) == count
+
+    for index, result in enumerate(results):
+        if index % 7 == 3:
+            assert isinstance(result, TypeMismatchException)
+            assert str(result) == \
+                "record['x'] = {index}, but its type should be int".format(index=repr(str(index)))
+        elif index % 11 == 5:
+            assert isinstance(result, CannotFindPropertyException)
+            assert str(result) == "cannot find 'x' in record = {}"
+        else:
+            assert result is None
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1000])
+def test_check_many_in_process(chunk_size):
+    results = check_many(SCHEMA, generate_records(100), name='record', chunk_size=chunk_size)
+    assert_results(results, 100)
+
+@pytest.mark.parametrize('chunk_size', [3, 50])
+def test_check_many_in_process_pool(chunk_size):
+    results = check_many(
+        SCHEMA, generate_records(200), name='record', workers=2, chunk_size=chunk_size
+    )
+    assert_results(results, 200)
+
+def test_check_many_is_lazy():
+    consumed = list()
+
+    def records():
+        for index in range(10):
+            consumed.append(index)
+            yield {'x': index}
+
+    results = check_many(SCHEMA, records(), chunk_size=2)
+    assert not consumed
+
+    next(results)
+    assert consumed == [0, 1]
+
+def test_check_many_with_invalid_schema():
+    with pytest.raises(InitializeLambdaExpressionException):
+        check_many('assertion: x', [1, 2, 3])
+
+def test_schema_exception_is_picklable():
+    exception = TypeMismatchException(data=1, expected_types=(str,), name='data')
+    restored = pickle.loads(pickle.dumps(exception))
+
+    assert isinstance(restored, TypeMismatchException)
+    assert str(restored) == str(exception)
@@ -0,0 +1,137 @@
+"""
+description: this module contains the testcases about check_schema_async.
+"""
+
+import asyncio
+import pytest
+
+from fast_tornado.match_schema import check_schema
+from fast_tornado.match_schema import check_schema_async
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.match_schema import Validator
+
+from fast_tornado.exceptions import SchemaException
+from fast_tornado.exceptions import InvalidArgumentsException
+
+SCHEMA = '''
+type: list
+items:
+    type: dict
+    properties:
+        x:
+            type: int
+            minimum: 0
+        y:
+            type: list
+            required: false
+            items:
+                type: str
+                pattern: '[a-z]+'
+'''
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+def check(function, *args, **kwargs):
+    try:
+        result = function(*args, **kwargs)
+        if asyncio.iscoroutine(result):
+            run(result)
+    except SchemaException as exception:
+        return str(exception)
+    return None
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        [],
+        [{'x': 1}],
+        [{'x': index, 'y': ['a', 'b']} for index in range(100)],
+        [{'x': 1}, {'x': -1}],
+        [{'x': 1, 'y': ['a', 'B']}],
+        [{'x': 1}, {}],
+        [{'x': 1}, 1],
+        {'x': 1},
+    ]
+)
+@pytest.mark.parametrize(
+    'slice_size, slice_time',
+    [[None, None], [1, None], [7, None], [None, 0.001], [3, 0.001]]
+)
+def test_same_result_as_check_schema(data, slice_size, slice_time):
+    message = check(check_schema_async, SCHEMA, data, 'body', slice_size, slice_time)
+    assert message == check(check_schema, SCHEMA, data, 'body')
+
+def test_deep_data():
+    schema = '''
+    type: dict
+    definitions:
+        node:
+            type: list
+            items:
+                $ref: '#/definitions/node'
+    properties:
+        root:
+            $ref: '#/definitions/node'
+    '''
+    data = list()
+    for _ in range(5000):
+        data = [data]
+    run(check_schema_async(schema, {'root': data}, slice_size=100))
+
+    data[0][0] = 1
+    message = check(check_schema_async, schema, {'root': data}, slice_size=100)
+    assert message is not None and message.endswith('= 1, but its type should be list')
+
+def test_yield_to_event_loop():
+    ticks = list()
+
+    async def tick():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def validate():
+        task = asyncio.ensure_future(tick())
+        await asyncio.sleep(0)
+        ticks.clear()
+        await check_schema_async(SCHEMA, [{'x': index} for index in range(1000)], slice_size=100)
+        task.cancel()
+
+    run(validate())
+    assert len(ticks) >= 20
+
+@pytest.mark.parametrize(
+    'slice_size, slices',
+    [
+        [None, 0],
+        [1, 3001],
+        [10, 300],
+        [3000, 1],
+        [5000, 0],
+    ]
+)
+def test_validate_in_slices(slice_size, slices):
+    validator = Validator(compile_schema(SCHEMA).schema, sliced=True)
+    data = [{'x': index, 'y': ['a']} for index in range(500)]
+    assert len(list(validator.validate_in_slices(data, slice_size=slice_size))) == slices
+
+@pytest.mark.parametrize(
+    'slice_size, slice_time',
+    [
+        [0, None],
+        [-1, None],
+        [1.5, None],
+        [True, None],
+        [None, 0],
+        [None, -0.1],
+        [None, '1'],
+    ]
+)
+def test_invalid_budget(slice_size, slice_time):
+    with pytest.raises(InvalidArgumentsException):
+        run(check_schema_async(SCHEMA, [], slice_size=slice_size, slice_time=slice_time))
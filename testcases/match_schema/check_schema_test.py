@@ -6,6 +6,7 @@ import collections
 import pytest
 
 from fast_tornado.match_schema import check_schema
+from fast_tornado.constants import MATCH_SCHEMA
 
 from fast_tornado.exceptions import TypeMismatchException
 from fast_tornado.exceptions import AssertionException
@@ -16,11 +17,25 @@ from fast_tornado.exceptions import InvalidPropertyException
 from fast_tornado.exceptions import DependenciesException
 from fast_tornado.exceptions import RegexPatternException
 from fast_tornado.exceptions import NonstringTypeHasPatternException
+from fast_tornado.exceptions import InvalidRegexPatternException
 from fast_tornado.exceptions import ExceedMaximumException
 from fast_tornado.exceptions import ExceedMinimumException
 from fast_tornado.exceptions import LengthRangeException
 from fast_tornado.exceptions import MultipleOfException
 
+@pytest.fixture(
+    scope='function',
+    name='backend',
+    autouse=True,
+    params=[MATCH_SCHEMA.WALKER, MATCH_SCHEMA.CODE]
+)
+def __backend(request, monkeypatch):
+    """
+    description: run every testcase of this module against every backend of compile_schema.
+    """
+    monkeypatch.setattr(MATCH_SCHEMA, 'BACKEND', request.param)
+    yield request.param
+
 @pytest.mark.parametrize(
     'schema, data, exception', [
         [
@@ -551,6 +566,74 @@ def test_enumeration_with_exception(schema, data, exception_message):
 def test_enumeration_without_exception(schema, data):
     check_schema(schema, data)
 
+@pytest.mark.parametrize(
+    'schema, data, passed', [
+        [
+            '''
+            type: any
+            enumeration: [1, 2]
+            ''',
+            True,
+            True
+        ],
+        [
+            '''
+            type: any
+            enumeration: [1, 2]
+            ''',
+            2.0,
+            True
+        ],
+        [
+            '''
+            type: any
+            enumeration: [0, 2]
+            ''',
+            True,
+            False
+        ],
+        [
+            '''
+            type: any
+            enumeration: [1, 2]
+            ''',
+            [1],
+            False
+        ],
+        [
+            '''
+            type: any
+            enumeration: [1, [1, 2], {a: 1}]
+            ''',
+            [1, 2],
+            True
+        ],
+        [
+            '''
+            type: any
+            enumeration: [1, [1, 2], {a: 1}]
+            ''',
+            {'a': 1},
+            True
+        ],
+        [
+            '''
+            type: any
+            enumeration: [1, [1, 2], {a: 1}]
+            ''',
+            [2, 1],
+            False
+        ]
+    ]
+)
+def test_enumeration_membership(schema, data, passed):
+    if passed:
+        check_schema(schema, data)
+        return
+
+    with pytest.raises(EnumerationException):
+        check_schema(schema, data)
+
 @pytest.mark.parametrize(
     'schema, data', [
         [
@@ -842,6 +925,88 @@ def test_non_string_type_with_pattern(schema):
     assert 'non-string schema' in str(execution_information.value)
     assert 'should not have pattern field' in str(execution_information.value)
 
+@pytest.mark.parametrize(
+    'schema, data, passed', [
+        [
+            '''
+            type: str
+            pattern: \\d+
+            ''',
+            '123abc',
+            True
+        ],
+        [
+            '''
+            type: str
+            pattern: \\d+
+            full_match: false
+            ''',
+            '123abc',
+            True
+        ],
+        [
+            '''
+            type: str
+            pattern: \\d+
+            full_match: true
+            ''',
+            '123abc',
+            False
+        ],
+        [
+            '''
+            type: str
+            pattern: \\d+
+            full_match: true
+            ''',
+            '123',
+            True
+        ],
+        [
+            '''
+            type: str
+            pattern: a|ab
+            full_match: true
+            ''',
+            'ab',
+            True
+        ]
+    ]
+)
+def test_pattern_full_match(schema, data, passed):
+    if passed:
+        check_schema(schema, data)
+        return
+
+    with pytest.raises(RegexPatternException):
+        check_schema(schema, data)
+
+@pytest.mark.parametrize(
+    'schema', [
+        '''
+        type: str
+        pattern: "[a-z"
+        ''',
+        '''
+        type: dict
+        properties:
+            a:
+                type: str
+                required: false
+                pattern: "(a"
+        ''',
+        '''
+        type: nonexistent_module.Type
+        pattern: "*"
+        '''
+    ]
+)
+def test_invalid_pattern(schema):
+    with pytest.raises(InvalidRegexPatternException) as execution_information:
+        check_schema(schema, {})
+
+    assert str(execution_information.value).startswith('cannot compile the regex')
+
 @pytest.mark.parametrize(
     'schema, data', [
         [
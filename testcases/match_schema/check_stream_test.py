@@ -0,0 +1,227 @@
+"""
+description: this module contains the testcases about check_stream.
+"""
+
+import json
+import importlib
+import tracemalloc
+import pytest
+
+from fast_tornado.match_schema import check_schema
+from fast_tornado.match_schema import check_stream
+from fast_tornado.constants import JSON_EVENT
+
+from fast_tornado.exceptions import SchemaException
+from fast_tornado.exceptions import TypeMismatchException
+from fast_tornado.exceptions import CannotFindPropertyException
+from fast_tornado.exceptions import InvalidPropertyException
+from fast_tornado.exceptions import DependenciesException
+from fast_tornado.exceptions import LengthRangeException
+from fast_tornado.exceptions import InvalidJsonException
+
+SCHEMA = '''
+type: dict
+additional_properities: false
+properties:
+    name:
+        type: str
+        pattern: '[a-z]+'
+    age:
+        type: int
+        minimum: 0
+        required: false
+        dependencies:
+            - name
+    tags:
+        type: list
+        maximum_length: 3
+        items:
+            type: str
+            enumeration: [a, b, c]
+    point:
+        type: list
+        required: false
+        items:
+            - type: int
+            - type: float
+    extra:
+        type: dict
+        required: false
+        assertion: 'lambda x: len(x) < 2'
+'''
+
+def check(schema, data):
+    try:
+        check_schema(schema, data)
+    except SchemaException as exception:
+        return str(exception)
+    return None
+
+def check_text(schema, text, **kwargs):
+    try:
+        check_stream(schema, text, **kwargs)
+    except SchemaException as exception:
+        return str(exception)
+    return None
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        {'name': 'zq', 'tags': []},
+        {'name': 'zq', 'age': 1, 'tags': ['a', 'b'], 'point': [1, 2.0], 'extra': {}},
+        {'name': 'zq', 'age': -1, 'tags': []},
+        {'name': 1, 'tags': []},
+        {'name': 'ZQ', 'tags': []},
+        {'name': 'zq', 'tags': ['d']},
+        {'name': 'zq', 'tags': [1]},
+        {'name': 'zq', 'tags': [], 'point': [1, 2]},
+        {'name': 'zq', 'tags': [], 'extra': {'a': 1, 'b': 2}},
+        {'name': 'zq', 'tags': [], 'extra': []},
+    ]
+)
+def test_same_messages_as_check_schema(data):
+    assert check_text(SCHEMA, json.dumps(data)) == check(SCHEMA, data)
+    assert check_text(SCHEMA, json.dumps(data), keep=True) == check(SCHEMA, data)
+
+@pytest.mark.parametrize(
+    'text, exception_type, message',
+    [
+        [
+            '[]',
+            TypeMismatchException,
+            'data = [...], but its type should be dict'
+        ],
+        [
+            '{"tags": []}',
+            CannotFindPropertyException,
+            "cannot find 'name' in data = {...}"
+        ],
+        [
+            '{"name": "zq", "tags": [], "x": 1}',
+            InvalidPropertyException,
+            "property 'x' in data = {...} is not allowed"
+        ],
+        [
+            '{"age": 1, "tags": []}',
+            CannotFindPropertyException,
+            "cannot find 'name' in data = {...}"
+        ],
+        [
+            '{"name": "zq", "tags": ["a", "a", "a", "a"]}',
+            LengthRangeException,
+            "data['tags'] = [...], its length is 4, but it should between 0 and 3"
+        ],
+        [
+            '{"name": "zq", "tags": [], "point": [1, 2.0, 3]}',
+            LengthRangeException,
+            "data['point'] = [...], its length is 3, but it should between 2 and 2"
+        ],
+    ]
+)
+def test_discarded_containers(text, exception_type, message):
+    with pytest.raises(exception_type) as execution_infomation:
+        check_stream(SCHEMA, text)
+
+    assert str(execution_infomation.value) == message
+
+def test_errors_in_document_order():
+    text = '{"name": 1, "tags": [1]}'
+    assert check_text(SCHEMA, text) == "data['name'] = 1, but its type should be str"
+
+    text = '{"tags": [1], "name": 1}'
+    assert check_text(SCHEMA, text) == "data['tags'][0] = 1, but its type should be str"
+
+def test_dependencies():
+    schema = '''
+    type: dict
+    properties:
+        a:
+            required: false
+            dependencies: [b]
+    '''
+    with pytest.raises(DependenciesException):
+        check_stream(schema, '{"a": 1}')
+    check_stream(schema, '{"a": 1, "b": 2}')
+
+def test_keep():
+    data = {'name': 'zq', 'age': 1, 'tags': ['a'], 'point': [1, 2.0], 'extra': {'x': [{}]}}
+    assert check_stream(SCHEMA, json.dumps(data), keep=True) == data
+    assert check_stream(SCHEMA, json.dumps(data)) is None
+
+def test_chunks():
+    data = {'name': 'zq', 'tags': ['a', 'b', 'c'], 'point': [-1, 2.5e3]}
+    text = json.dumps(data)
+    chunks = [text[index:index + 1].encode('utf-8') for index in range(len(text))]
+    assert check_stream(SCHEMA, iter(chunks), keep=True) == data
+
+def test_invalid_json():
+    with pytest.raises(InvalidJsonException):
+        check_stream(SCHEMA, '{"name": "zq", "tags": [}')
+
+@pytest.mark.parametrize(
+    'events',
+    [
+        [],
+        [(JSON_EVENT.START_MAP, None)],
+        [(JSON_EVENT.START_MAP, None), (JSON_EVENT.MAP_KEY, 'name')],
+        [
+            (JSON_EVENT.START_MAP, None),
+            (JSON_EVENT.MAP_KEY, 'tags'),
+            (JSON_EVENT.START_ARRAY, None),
+        ],
+    ]
+)
+def test_truncated_events(monkeypatch, events):
+    # the module is shadowed by the function check_stream in the package.
+    module = importlib.import_module('fast_tornado.match_schema.check_stream')
+    monkeypatch.setattr(module, 'iterate_json', lambda stream: iter(events))
+    with pytest.raises(InvalidJsonException) as execution_infomation:
+        check_stream(SCHEMA, '')
+    assert str(execution_infomation.value) == \
+        'invalid json at position the end, unexpected end of json'
+
+def test_constant_memory():
+    schema = '''
+    type: list
+    items:
+        type: dict
+        properties:
+            id:
+                type: int
+            name:
+                type: str
+    '''
+
+    def generate_chunks(count):
+        yield '['
+        for index in range(count):
+            separator = ',' if index < count - 1 else ''
+            yield '{{"id": {index}, "name": "{name}"}}{separator}'.format(
+                index=index, name='x' * 100, separator=separator
+            )
+        yield ']'
+
+    tracemalloc.start()
+    try:
+        check_stream(schema, generate_chunks(20000))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 1024 * 1024
+
+def test_deep_document():
+    schema = '''
+    $ref: '#/definitions/node'
+    definitions:
+        node:
+            type: list
+            items:
+                $ref: '#/definitions/node'
+    '''
+    depth = 5000
+    check_stream(schema, '[' * depth + ']' * depth)
+    assert check_stream(schema, '[' * depth + ']' * depth, keep=True) is not None
+
+    with pytest.raises(TypeMismatchException):
+        check_stream(schema, '[' * depth + '1' + ']' * depth)
@@ -0,0 +1,113 @@
+"""
+description: this module contains the testcases about the code backend of compile_schema.
+"""
+
+import pytest
+
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.match_schema import CodeValidator
+from fast_tornado.constants import MATCH_SCHEMA
+
+from fast_tornado.exceptions import InvalidArgumentsException
+from fast_tornado.exceptions import TypeMismatchException
+from fast_tornado.exceptions import CannotFindPropertyException
+
+def test_compile_schema_with_code_backend():
+    validator = compile_schema('type: int', backend=MATCH_SCHEMA.CODE)
+    assert isinstance(validator, CodeValidator)
+
+def test_compile_schema_with_unknown_backend():
+    with pytest.raises(InvalidArgumentsException) as execution_information:
+        compile_schema('type: int', backend='unknown')
+
+    assert str(execution_information.value) == \
+        'the arguments of function compile_schema is invalid, ' \
+        'the backend should be one of code, walker'
+
+@pytest.mark.parametrize(
+    'schema, included, excluded', [
+        [
+            'type: int',
+            ['isinstance'],
+            ['enumeration', 'RegexPatternException', 'len(', '%']
+        ],
+        [
+            'type: any',
+            [],
+            ['isinstance']
+        ],
+        [
+            '''
+            type: str
+            pattern: \\d+
+            ''',
+            ['isinstance', 'RegexPatternException'],
+            ['EnumerationException', 'LengthRangeException']
+        ],
+        [
+            '''
+            type: list
+            items:
+                type: int
+                maximum: 10
+            ''',
+            ['for ', 'ExceedMaximumException'],
+            ['ExceedMinimumException', 'LengthRangeException']
+        ]
+    ]
+)
+def test_source_only_contains_used_checks(schema, included, excluded):
+    source = compile_schema(schema, backend=MATCH_SCHEMA.CODE).source
+    for text in included:
+        assert text in source
+    for text in excluded:
+        assert text not in source
+
+def test_validate_large_list_of_dicts():
+    validator = compile_schema(
+        '''
+        type: list
+        items:
+            type: dict
+            properties:
+                x:
+                    type: int
+                    minimum: 0
+                y:
+                    type: str
+                    required: false
+        ''',
+        backend=MATCH_SCHEMA.CODE
+    )
+
+    data = [{'x': index, 'y': str(index)} for index in range(10000)]
+    validator.validate(data)
+
+    data[9999]['x'] = '9999'
+    with pytest.raises(TypeMismatchException) as execution_information:
+        validator.validate(data)
+    assert str(execution_information.value) == \
+        "data[9999]['x'] = '9999', but its type should be int"
+
+    del data[5000]['x']
+    with pytest.raises(CannotFindPropertyException) as execution_information:
+        validator.validate(data)
+    assert str(execution_information.value) == "cannot find 'x' in data[5000] = {'y': '5000'}"
+
+def test_deeply_nested_schema_falls_back_to_walker():
+    depth = 40
+    schema = ''.join(
+        '{indent}type: list\n{indent}items:\n'.format(indent='    ' * level)
+        for level in range(depth)
+    )
+    schema += '{indent}type: int\n'.format(indent='    ' * depth)
+    validator = compile_schema(schema, backend=MATCH_SCHEMA.CODE)
+
+    data = 1.0
+    for _ in range(depth):
+        data = [data]
+
+    with pytest.raises(TypeMismatchException) as execution_information:
+        validator.validate(data)
+    assert str(execution_information.value) == \
+        'data{suffix} = 1.0, but its type should be int'.format(suffix='[0]' * depth)
@@ -0,0 +1,201 @@
+"""
+description: this module contains the testcases about coerce_and_check.
+"""
+
+import copy
+import collections
+import pytest
+
+from fast_tornado.match_schema import coerce_and_check
+from fast_tornado.match_schema import check_schema
+
+from fast_tornado.exceptions import SchemaException
+from fast_tornado.exceptions import TypeMismatchException
+from fast_tornado.exceptions import ExceedMinimumException
+from fast_tornado.exceptions import EnumerationException
+from fast_tornado.exceptions import CannotFindPropertyException
+from fast_tornado.exceptions import InvalidPropertyException
+from fast_tornado.exceptions import LengthRangeException
+from fast_tornado.exceptions import AssertionException
+
+SCHEMA = '''
+type: dict
+additional_properities: false
+properties:
+    page:
+        type: int
+        minimum: 1
+    size:
+        type: [int, None]
+        required: false
+    ratio:
+        type: float
+        required: false
+    verbose:
+        type: bool
+        required: false
+    name:
+        type: str
+        required: false
+    ids:
+        type: list
+        required: false
+        maximum_length: 3
+        items:
+            type: int
+            enumeration: [1, 2, 3]
+    point:
+        type: list
+        required: false
+        items:
+            - type: int
+            - type: float
+    filters:
+        type: dict
+        required: false
+        assertion: 'lambda x: x.get("level", 0) < 10'
+        properties:
+            level:
+                type: int
+'''
+
+@pytest.mark.parametrize(
+    'data, expected',
+    [
+        [{'page': '1'}, {'page': 1}],
+        [{'page': b'2'}, {'page': 2}],
+        [{'page': ['1', '3']}, {'page': 3}],
+        [{'page': 1, 'size': 'null'}, {'page': 1, 'size': None}],
+        [{'page': 1, 'size': '10'}, {'page': 1, 'size': 10}],
+        [{'page': '1', 'ratio': '0.5'}, {'page': 1, 'ratio': 0.5}],
+        [{'page': '1', 'verbose': 'true'}, {'page': 1, 'verbose': True}],
+        [{'page': '1', 'verbose': 'OFF'}, {'page': 1, 'verbose': False}],
+        [{'page': '1', 'name': '123'}, {'page': 1, 'name': '123'}],
+        [{'page': '1', 'ids': ['1', '2']}, {'page': 1, 'ids': [1, 2]}],
+        [{'page': '1', 'ids': '3'}, {'page': 1, 'ids': [3]}],
+        [{'page': '1', 'point': ['1', '2']}, {'page': 1, 'point': [1, 2.0]}],
+        [{'page': '1', 'filters': {'level': '3'}}, {'page': 1, 'filters': {'level': 3}}],
+        [{'page': 1, 'ratio': 0.5}, {'page': 1, 'ratio': 0.5}],
+        [{'page': '+2', 'ratio': '-.5e1'}, {'page': 2, 'ratio': -5.0}],
+        [{'page': '1', 'ratio': '3'}, {'page': 1, 'ratio': 3.0}],
+    ]
+)
+def test_coerce(data, expected):
+    original = copy.deepcopy(data)
+    result = coerce_and_check(SCHEMA, data)
+
+    assert result == expected
+    assert [type(item) for item in result.values()] == [type(item) for item in expected.values()]
+    assert data == original
+    check_schema(SCHEMA, result)
+
+@pytest.mark.parametrize(
+    'data, exception_type, message',
+    [
+        [{'page': 'x'}, TypeMismatchException, "data['page'] = 'x', but its type should be int"],
+        [
+            {'page': '1.5'},
+            TypeMismatchException,
+            "data['page'] = '1.5', but its type should be int"
+        ],
+        [
+            {'page': '1_000'},
+            TypeMismatchException,
+            "data['page'] = '1_000', but its type should be int"
+        ],
+        [
+            {'page': ' 7 '},
+            TypeMismatchException,
+            "data['page'] = ' 7 ', but its type should be int"
+        ],
+        [
+            {'page': '\u0661'},
+            TypeMismatchException,
+            "data['page'] = '\u0661', but its type should be int"
+        ],
+        [
+            {'page': b'\xff'},
+            TypeMismatchException,
+            "data['page'] = b'\\xff', but its type should be int"
+        ],
+        [
+            {'page': '1', 'ratio': 'nan'},
+            TypeMismatchException,
+            "data['ratio'] = 'nan', but its type should be float"
+        ],
+        [
+            {'page': '1', 'ratio': '-inf'},
+            TypeMismatchException,
+            "data['ratio'] = '-inf', but its type should be float"
+        ],
+        [
+            {'page': '1', 'ratio': '1e'},
+            TypeMismatchException,
+            "data['ratio'] = '1e', but its type should be float"
+        ],
+        [{'page': '0'}, ExceedMinimumException, "data['page'] = 0, which should >= 1"],
+        [
+            {'page': '1', 'verbose': 'maybe'},
+            TypeMismatchException,
+            "data['verbose'] = 'maybe', but its type should be bool"
+        ],
+        [
+            {'page': '1', 'ids': ['1', '5']},
+            EnumerationException,
+            "data['ids'][1] = 5, does not in enumeration [1, 2, 3]"
+        ],
+        [
+            {'page': '1', 'ids': ['1', '1', '1', '1']},
+            LengthRangeException,
+            "data['ids'] = [1, 1, 1, 1], its length is 4, but it should between 0 and 3"
+        ],
+        [
+            {'page': '1', 'point': ['1']},
+            LengthRangeException,
+            "data['point'] = ['1'], its length is 1, but it should between 2 and 2"
+        ],
+        [{}, CannotFindPropertyException, "cannot find 'page' in data = {}"],
+        [
+            {'page': '1', 'x': '1'},
+            InvalidPropertyException,
+            "property 'x' in data = {'page': '1', 'x': '1'} is not allowed"
+        ],
+        [
+            {'page': '1', 'filters': {'level': '30'}},
+            AssertionException,
+            "data['filters'] = {'level': 30}, "
+            "cannot pass the assertion 'lambda x: x.get(\"level\", 0) < 10'"
+        ],
+        [
+            {'page': '1', 'filters': 'x'},
+            TypeMismatchException,
+            "data['filters'] = 'x', but its type should be dict"
+        ],
+    ]
+)
+def test_errors(data, exception_type, message):
+    with pytest.raises(exception_type) as execution_infomation:
+        coerce_and_check(SCHEMA, data)
+
+    assert str(execution_infomation.value) == message
+
+def test_bool_type():
+    check_schema('type: bool', True)
+    with pytest.raises(SchemaException):
+        check_schema('type: bool', 1)
+
+def test_any_and_name():
+    assert coerce_and_check('type: any', '1') == '1'
+    assert coerce_and_check('{type: [bool, int]}', '1', name='flag') is True
+    assert coerce_and_check('{type: [int, bool]}', '1', name='flag') == 1
+    with pytest.raises(TypeMismatchException) as execution_infomation:
+        coerce_and_check('type: int', 'x', name='page')
+    assert str(execution_infomation.value) == "page = 'x', but its type should be int"
+
+def test_namedtuple():
+    point = collections.namedtuple('Point', ['x', 'y'])
+    schema = 'type: tuple\nitems: [{type: int}, {type: int}]'
+    result = coerce_and_check(schema, point('1', '2'))
+    assert result == point(1, 2)
+    assert type(result) is point # pylint: disable = unidiomatic-typecheck
+    assert coerce_and_check(schema, ('1', '2')) == (1, 2)
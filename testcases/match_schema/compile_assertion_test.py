@@ -0,0 +1,97 @@
+"""
+description: this module contains the testcases about compile_assertion.
+"""
+
+import threading
+import pytest
+
+from fast_tornado.match_schema import check_schema
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.match_schema import ASSERTION_CACHE
+from fast_tornado.match_schema.compile_assertion import compile_assertion
+
+from fast_tornado.exceptions import AssertionException
+from fast_tornado.exceptions import InitializeLambdaExpressionException
+
+@pytest.mark.parametrize(
+    'expression, data, result', [
+        ['lambda x: x > 0', 1, True],
+        ['lambda x: len(x) == 2 and all(isinstance(item, int) for item in x)', [1, 2], True],
+        ['lambda x: x.startswith("a")', 'abc', True],
+        ['lambda x: {key: value for key, value in x.items()} == x', {'a': 1}, True],
+        ['lambda x: sorted(x)[0] if x else None', [], None],
+        ['  lambda x: x[1:] == "bc"', 'abc', True],
+        ['lambda x: x.get("a", 0).real', {'a': 2}, 2],
+        ['lambda x: x.lower().split("_") == ["a", "b"]', 'A_B', True],
+        ['lambda x: not x.startswith("__")', '__init__', False],
+        ['lambda x: x != "snake__case"', 'snake_case', True],
+        ['lambda x: x.endswith(b"__")', b'a__', True],
+    ]
+)
+def test_compile_assertion(expression, data, result):
+    assert compile_assertion(expression)(data) == result
+
+@pytest.mark.parametrize(
+    'expression', [
+        'lambda x: __import__("os")',
+        'lambda x: x.__class__',
+        'lambda x: x.__class__.__bases__[0].__subclasses__()',
+        'lambda x: [item.__dict__ for item in x]',
+        'lambda x: open("file")',
+        'lambda x: eval("1")',
+        'lambda x: getattr(x, "__class__")',
+        'lambda x: (yield x)',
+        "lambda x: [l.append(g) or list(g) for l in [[]] for g in "
+        "[(l[0].gi_frame.f_back.f_back.f_back.f_globals['__builtins__'] for _ in [1])]]",
+        'lambda x: [g.gi_frame for g in [(item for item in x)]]',
+        'lambda x: x.gi_code',
+        'lambda x: x.cr_frame',
+        'lambda x: x.ag_frame',
+        'lambda x: x.f_globals',
+        'lambda x: x.tb_frame',
+        "lambda x: '{0.__class__}'.format(x)",
+        "lambda x: '{0.real}'.format_map(x)",
+        "lambda x: x['__builtins__']",
+        "lambda x: x[b'__class__']",
+        "lambda x: x.get('__globals__')",
+        'lambda x: x.mro()',
+        'x > 0',
+        'lambda x: ',
+        None,
+        ['lambda x: x'],
+    ]
+)
+def test_unsafe_assertion(expression):
+    with pytest.raises(InitializeLambdaExpressionException) as execution_infomation:
+        compile_assertion(expression)(None)
+
+    assert str(execution_infomation.value) == \
+        'cannot initialize lambda expression from {expression}'.format(expression=repr(expression))
+
+def test_assertion_is_compiled_once():
+    expression = 'lambda x: x % 7 != 3'
+    misses = ASSERTION_CACHE.statistics.misses
+
+    schema = 'type: list\nitems:\n    assertion: "{0}"'.format(expression)
+    validators = [compile_schema(schema) for _ in range(3)]
+    assert ASSERTION_CACHE.statistics.misses == misses + 1
+    assert compile_assertion(expression) is validators[0].schema.items.assertion_function
+
+    errors = list()
+
+    def validate(validator):
+        try:
+            validator.validate(list(range(3)))
+        except AssertionException as exception:
+            errors.append(exception)
+
+    threads = [threading.Thread(target=validate, args=(validator,)) for validator in validators * 4]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+
+    with pytest.raises(AssertionException):
+        check_schema('type: list\nitems:\n    assertion: "{0}"'.format(expression), list(range(4)))
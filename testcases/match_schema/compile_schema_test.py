@@ -0,0 +1,109 @@
+"""
+description: this module contains the testcases about compile_schema.
+"""
+
+import pytest
+import yaml
+
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.match_schema import Validator
+
+from fast_tornado.exceptions import TypeMismatchException
+from fast_tornado.exceptions import InitializeLambdaExpressionException
+from fast_tornado.exceptions import NonstringTypeHasPatternException
+
+SCHEMA = '''
+type: list
+items:
+    type: dict
+    properties:
+        x:
+            type: int
+            assertion: "lambda x: x > 0"
+        y:
+            type: collections.OrderedDict
+            required: false
+'''
+
+def test_compile_schema_returns_validator():
+    assert isinstance(compile_schema(SCHEMA), Validator)
+
+def test_validate_does_not_load_schema_again(monkeypatch):
+    validator = compile_schema(SCHEMA)
+
+    def safe_load(*args, **kwargs):
+        raise AssertionError('the schema should not be loaded again')
+
+    monkeypatch.setattr(yaml, 'safe_load', safe_load)
+    for _ in range(3):
+        validator.validate([{'x': 1}, {'x': 2}])
+
+def test_validate_does_not_initialize_schema_again():
+    validator = compile_schema(SCHEMA)
+    assertion = validator.schema.items.properties['x'].assertion_function
+
+    validator.validate([{'x': 1}])
+    validator.validate([{'x': 2}])
+
+    assert validator.schema.items.properties['x'].assertion_function is assertion
+
+@pytest.mark.parametrize(
+    'data, exception_message', [
+        [
+            [{'x': 1}, {'x': 1.0}],
+            'items[1][\'x\'] = 1.0, but its type should be int'
+        ],
+        [
+            [{'x': 1}, {'x': 1, 'y': {}}],
+            'items[1][\'y\'] = {}, but its type should be OrderedDict'
+        ]
+    ]
+)
+def test_validate_with_exception(data, exception_message):
+    validator = compile_schema(SCHEMA)
+    with pytest.raises(TypeMismatchException) as execution_information:
+        validator.validate(data, name='items')
+
+    assert str(execution_information.value) == exception_message
+
+@pytest.mark.parametrize(
+    'schema, exception_type', [
+        [
+            '''
+            type: dict
+            properties:
+                x:
+                    type: int
+                    assertion: x > 3
+            ''',
+            InitializeLambdaExpressionException
+        ],
+        [
+            '''
+            type: list
+            items:
+                type: int
+                pattern: \\d+
+            ''',
+            NonstringTypeHasPatternException
+        ]
+    ]
+)
+def test_compile_schema_with_exception(schema, exception_type):
+    with pytest.raises(exception_type):
+        compile_schema(schema)
+
+def test_unresolvable_type_is_reported_when_visited():
+    validator = compile_schema(
+        '''
+        type: dict
+        properties:
+            x:
+                type: nonexistent_module.Type
+                required: false
+        '''
+    )
+
+    validator.validate({})
+    with pytest.raises(ImportError):
+        validator.validate({'x': 1})
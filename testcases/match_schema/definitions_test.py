@@ -0,0 +1,200 @@
+"""
+description: this module contains the testcases about definitions and references.
+"""
+
+import json
+import yaml
+import pytest
+
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.match_schema import check_stream
+from fast_tornado.match_schema.initialize_schema import initialize_schema
+from fast_tornado.constants import MATCH_SCHEMA
+
+from fast_tornado.exceptions import SchemaException
+from fast_tornado.exceptions import InvalidReferenceException
+from fast_tornado.exceptions import CannotFindPropertyException
+
+TREE = '''
+type: dict
+definitions:
+    node:
+        type: dict
+        properties:
+            value:
+                type: int
+            children:
+                type: list
+                required: false
+                items:
+                    $ref: '#/definitions/node'
+properties:
+    root:
+        $ref: '#/definitions/node'
+    backup:
+        $ref: '#/definitions/node'
+        required: false
+'''
+
+BACKENDS = [MATCH_SCHEMA.WALKER, MATCH_SCHEMA.CODE]
+
+def check(validator, data):
+    try:
+        validator.validate(data, 'data')
+    except SchemaException as exception:
+        return str(exception)
+    return None
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize(
+    'data, message',
+    [
+        [{'root': {'value': 1}}, None],
+        [{'root': {'value': 1, 'children': [{'value': 2, 'children': [{'value': 3}]}]}}, None],
+        [{'root': {'value': 1}, 'backup': {'value': 2}}, None],
+        [
+            {'root': {'value': 1, 'children': [{'value': 'x'}]}},
+            "data['root']['children'][0]['value'] = 'x', but its type should be int"
+        ],
+        [
+            {'root': {'value': 1, 'children': [{'value': 2}, {'value': 3, 'children': [{}]}]}},
+            "cannot find 'value' in data['root']['children'][1]['children'][0] = {}"
+        ],
+        [
+            {'root': {'value': 1}, 'backup': {'value': None}},
+            "data['backup']['value'] = None, but its type should be int"
+        ],
+        [{}, "cannot find 'root' in data = {}"],
+    ]
+)
+def test_recursive_definition(backend, data, message):
+    validator = compile_schema(TREE, backend)
+    assert check(validator, data) == message
+
+def test_shared_nodes():
+    node = initialize_schema(yaml.safe_load(TREE))
+    root = node.properties['root']
+    backup = node.properties['backup']
+
+    assert root.definition == 'node'
+    assert root.properties['children'].items is root
+    assert backup is not root
+    assert backup.required is False
+    assert backup.properties is root.properties
+
+    other = initialize_schema(yaml.safe_load(TREE))
+    assert other.properties['root'] is root
+
+def test_different_definitions_are_not_shared():
+    schema = yaml.safe_load(TREE)
+    node = initialize_schema(schema)
+
+    schema['definitions']['node']['properties']['value']['type'] = 'str'
+    other = initialize_schema(schema)
+    assert other.properties['root'] is not node.properties['root']
+    assert other.properties['root'].properties['value'].types == (str,)
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_keys_of_different_types_are_not_shared(backend):
+    messages = list()
+    for key in [1, '1', True]:
+        schema = {
+            '$ref': '#/definitions/node',
+            'definitions': {'node': {'type': 'dict', 'properties': {key: {'type': 'int'}}}}
+        }
+        validator = compile_schema(yaml.safe_dump(schema), backend)
+        assert check(validator, {key: 5}) is None
+        messages.append(check(validator, {key: 'x'}))
+
+    assert messages == [
+        "data[1] = 'x', but its type should be int",
+        "data['1'] = 'x', but its type should be int",
+        "data[True] = 'x', but its type should be int",
+    ]
+
+def test_alias():
+    schema = '''
+    type: dict
+    definitions:
+        name:
+            type: str
+        alias:
+            $ref: '#/definitions/name'
+    properties:
+        a:
+            $ref: '#/definitions/alias'
+    '''
+    for backend in BACKENDS:
+        validator = compile_schema(schema, backend)
+        assert check(validator, {'a': 'x'}) is None
+        assert check(validator, {'a': 1}) == "data['a'] = 1, but its type should be str"
+
+def test_reference_as_root():
+    schema = '''
+    $ref: '#/definitions/node'
+    definitions:
+        node:
+            type: dict
+            properties:
+                value:
+                    type: int
+                children:
+                    type: list
+                    required: false
+                    items:
+                        $ref: '#/definitions/node'
+    '''
+    for backend in BACKENDS:
+        validator = compile_schema(schema, backend)
+        assert check(validator, {'value': 1, 'children': [{'value': 2, 'children': []}]}) is None
+        assert check(validator, {'value': 1, 'children': [{'value': 'x'}]}) == \
+            "data['children'][0]['value'] = 'x', but its type should be int"
+
+    with pytest.raises(InvalidReferenceException):
+        compile_schema({'properties': {'a': {'$ref': '#/definitions/b', 'definitions': {'b': {}}}}})
+
+@pytest.mark.parametrize(
+    'schema, message',
+    [
+        [
+            {'properties': {'a': {'$ref': '#/definitions/b'}}},
+            "cannot resolve the reference '#/definitions/b', the definition does not exist"
+        ],
+        [
+            {'properties': {'a': {'$ref': 'other.yaml#/b'}}},
+            "cannot resolve the reference 'other.yaml#/b', "
+            "only the references like #/definitions/name are supported"
+        ],
+        [
+            {
+                'definitions': {'b': {}},
+                'properties': {'a': {'$ref': '#/definitions/b', 'type': 'int'}}
+            },
+            "cannot resolve the reference '#/definitions/b', it cannot be used with type"
+        ],
+        [
+            {
+                'definitions': {'b': {'$ref': '#/definitions/c'}, 'c': {'$ref': '#/definitions/b'}},
+                'properties': {'a': {'$ref': '#/definitions/b'}}
+            },
+            "cannot resolve the reference '#/definitions/b', the references are circular"
+        ],
+    ]
+)
+def test_invalid_reference(schema, message):
+    with pytest.raises(InvalidReferenceException) as execution_infomation:
+        compile_schema(schema)
+
+    assert str(execution_infomation.value) == message
+
+def test_code_backend_generates_one_function_per_definition():
+    validator = compile_schema(TREE, MATCH_SCHEMA.CODE)
+    assert validator.source.count('def ') == 2
+
+def test_check_stream():
+    data = {'root': {'value': 1, 'children': [{'value': 2, 'children': [{'value': 3}]}]}}
+    assert check_stream(TREE, json.dumps(data), keep=True) == data
+
+    data['root']['children'][0]['children'][0].pop('value')
+    with pytest.raises(CannotFindPropertyException):
+        check_stream(TREE, json.dumps(data))
@@ -0,0 +1,77 @@
+"""
+description: this module contains the testcases about LRUCache and the schema cache of check_schema.
+"""
+
+import threading
+import yaml
+
+from fast_tornado.match_schema import LRUCache
+from fast_tornado.match_schema import SCHEMA_CACHE
+from fast_tornado.match_schema import check_schema
+
+def test_hits_misses_and_evictions():
+    cache = LRUCache(maximum_size=2)
+
+    assert cache.get('a', lambda: 1) == 1
+    assert cache.get('b', lambda: 2) == 2
+    assert cache.get('a', lambda: 3) == 1
+    assert cache.get('c', lambda: 4) == 4
+
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+
+    statistics = cache.statistics
+    assert statistics.hits == 1
+    assert statistics.misses == 3
+    assert statistics.evictions == 1
+    assert statistics.size == 2
+    assert statistics.maximum_size == 2
+
+def test_resize_and_clear():
+    cache = LRUCache(maximum_size=3)
+    for key in range(3):
+        cache.get(key, lambda: None)
+
+    cache.resize(1)
+    assert len(cache) == 1
+    assert 2 in cache
+    assert cache.statistics.evictions == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.statistics == (0, 0, 0, 0, 1)
+
+def test_concurrent_access():
+    cache = LRUCache(maximum_size=8)
+
+    def worker():
+        for key in range(100):
+            cache.get(key % 16, lambda: key)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    statistics = cache.statistics
+    assert statistics.hits + statistics.misses == 800
+    assert statistics.size <= 8
+
+def test_check_schema_loads_schema_once(monkeypatch):
+    SCHEMA_CACHE.clear()
+    loads = list()
+    safe_load = yaml.safe_load
+
+    def counting_safe_load(*args, **kwargs):
+        loads.append(args)
+        return safe_load(*args, **kwargs)
+
+    monkeypatch.setattr(yaml, 'safe_load', counting_safe_load)
+    for data in range(10):
+        check_schema('type: int', data)
+
+    assert len(loads) == 1
+    assert SCHEMA_CACHE.statistics.hits == 9
+    assert SCHEMA_CACHE.statistics.misses == 1
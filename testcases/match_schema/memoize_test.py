@@ -0,0 +1,183 @@
+"""
+description: this module contains the testcases about the memo of validators.
+"""
+
+import pytest
+
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.match_schema import check_schema
+from fast_tornado.match_schema import SCHEMA_CACHE
+from fast_tornado.match_schema.memoize import get_memo_key
+from fast_tornado.match_schema.memoize import is_memoizable
+from fast_tornado.match_schema.memoize import ValueMemo
+from fast_tornado.constants import MATCH_SCHEMA
+
+from fast_tornado.exceptions import SchemaException
+from fast_tornado.exceptions import RegexPatternException
+from fast_tornado.exceptions import AssertionException
+
+SCHEMA = '''
+type: list
+items:
+    type: dict
+    properties:
+        status:
+            type: int
+            enumeration: [200, 404, 500]
+        tag:
+            type: str
+            pattern: '[a-z]+'
+            full_match: true
+        point:
+            type: tuple
+            required: false
+            assertion: 'lambda x: len(x) == 2'
+        count:
+            type: int
+            required: false
+'''
+
+@pytest.fixture(name='backend', params=[MATCH_SCHEMA.WALKER, MATCH_SCHEMA.CODE])
+def __backend(request):
+    yield request.param
+
+def test_is_memoizable():
+    root = compile_schema(SCHEMA).schema
+    properties = root.items.properties
+
+    assert not is_memoizable(root)
+    assert not is_memoizable(root.items)
+    assert not is_memoizable(properties['status'])
+    assert is_memoizable(properties['tag'])
+    assert is_memoizable(properties['point'])
+    assert not is_memoizable(properties['count'])
+
+@pytest.mark.parametrize(
+    'value, memoizable',
+    [
+        ['a', True],
+        [b'a', True],
+        [1, True],
+        [1.5, True],
+        [None, True],
+        [(1, 'a'), True],
+        [(1, [2]), False],
+        [[1], False],
+        [{'a': 1}, False],
+    ]
+)
+def test_get_memo_key(value, memoizable):
+    assert (get_memo_key(object(), value) is not None) is memoizable
+
+def test_types_are_parts_of_key():
+    node = object()
+    assert get_memo_key(node, 1) != get_memo_key(node, True)
+    assert get_memo_key(node, 1) != get_memo_key(node, 1.0)
+    assert get_memo_key(node, (1,)) != get_memo_key(node, (True,))
+    assert get_memo_key(node, 1) != get_memo_key(object(), 1)
+
+def test_signs_of_floats_are_parts_of_key():
+    node = object()
+    assert get_memo_key(node, 0.0) != get_memo_key(node, -0.0)
+    assert get_memo_key(node, (0.0, 1)) != get_memo_key(node, (-0.0, 1))
+    assert get_memo_key(node, 1.5) == get_memo_key(node, 1.5)
+
+def test_signed_zero_is_checked(backend):
+    validator = compile_schema(
+        "{type: float, assertion: 'lambda x: str(x) == \"0.0\"'}", backend, memo_size=100
+    )
+    validator.validate(0.0)
+    with pytest.raises(AssertionException):
+        validator.validate(-0.0)
+
+@pytest.mark.parametrize(
+    'value, memoizable',
+    [
+        ['a' * MATCH_SCHEMA.MEMO_VALUE_SIZE, True],
+        ['a' * (MATCH_SCHEMA.MEMO_VALUE_SIZE + 1), False],
+        [b'a' * (MATCH_SCHEMA.MEMO_VALUE_SIZE + 1), False],
+        [(1,) * (MATCH_SCHEMA.MEMO_VALUE_SIZE + 1), False],
+    ]
+)
+def test_large_values_are_not_memoized(value, memoizable):
+    assert (get_memo_key(object(), value) is not None) is memoizable
+
+def test_repeated_values_hit(backend):
+    validator = compile_schema(SCHEMA, backend, memo_size=100)
+    data = [{'status': 200, 'tag': 'ok', 'point': (1, 2)} for _ in range(1000)]
+    validator.validate(data)
+
+    statistics = validator.memo.statistics
+    assert statistics.misses == 2
+    assert statistics.hits == 2 * 999
+    assert statistics.size == 2
+
+    validator.memo.clear()
+    validator.validate(data[:1])
+    assert validator.memo.statistics.misses == 2
+
+def test_failures_are_not_memoized(backend):
+    validator = compile_schema(SCHEMA, backend, memo_size=100)
+    for _ in range(2):
+        with pytest.raises(RegexPatternException):
+            validator.validate([{'status': 200, 'tag': 'OK'}])
+    assert validator.memo.statistics.size == 0
+
+    with pytest.raises(AssertionException):
+        validator.validate([{'status': 200, 'tag': 'ok', 'point': (1, 2, 3)}])
+    assert validator.memo.statistics.size == 1
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        [{'status': 200, 'tag': 'ok'}, {'status': True, 'tag': 'ok'}],
+        [{'status': 200, 'tag': 'ok'}, {'status': 200.0, 'tag': 'ok'}],
+        [{'status': 200, 'tag': 'ok'}, {'status': 200, 'tag': 'OK'}],
+        [
+            {'status': 200, 'tag': 'ok', 'point': (1, 2)},
+            {'status': 200, 'tag': 'ok', 'point': [1, 2]}
+        ],
+    ]
+)
+def test_same_messages(backend, data):
+    def check(validator):
+        try:
+            validator.validate(data)
+        except SchemaException as exception:
+            return str(exception)
+        return None
+
+    memoized = compile_schema(SCHEMA, backend, memo_size=100)
+    assert check(memoized) == check(compile_schema(SCHEMA, backend))
+
+def test_bounded(backend):
+    validator = compile_schema(SCHEMA, backend, memo_size=10)
+    validator.validate([{'status': 200, 'tag': 'a' * (index + 1)} for index in range(100)])
+    assert validator.memo.statistics.size == 10
+    assert validator.memo.statistics.evictions == 90
+
+def test_value_memo():
+    memo = ValueMemo(2)
+    assert not memo.contains('a')
+    memo.add('a')
+    memo.add('b')
+    memo.add('a')
+    assert memo.contains('a')
+    memo.add('c')
+    assert not memo.contains('a')
+    assert memo.statistics == (1, 2, 1, 2, 2)
+
+    memo.clear()
+    assert memo.statistics == (0, 0, 0, 0, 2)
+
+def test_not_memoized_by_default(backend):
+    assert compile_schema(SCHEMA, backend).memo is None
+
+def test_check_schema(monkeypatch):
+    monkeypatch.setattr(MATCH_SCHEMA, 'MEMO_SIZE', 10)
+    schema = SCHEMA + '\n'
+    try:
+        check_schema(schema, [{'status': 200, 'tag': 'ok'}] * 10)
+        assert SCHEMA_CACHE.get((schema, MATCH_SCHEMA.BACKEND), None).memo.statistics.hits == 9
+    finally:
+        SCHEMA_CACHE.clear()
@@ -0,0 +1,192 @@
+"""
+description: this module contains the testcases about the optimization of checks.
+"""
+
+import pytest
+
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.match_schema import report_optimizations
+from fast_tornado.constants import MATCH_SCHEMA
+
+from fast_tornado.exceptions import SchemaException
+
+@pytest.fixture(name='backend', params=[MATCH_SCHEMA.WALKER, MATCH_SCHEMA.CODE])
+def __backend(request):
+    yield request.param
+
+@pytest.mark.parametrize(
+    'schema, checks, report',
+    [
+        [{'type': 'int'}, ('type',), []],
+        [{'type': 'any'}, (), [('$', 'type', 'the type any always passes')]],
+        [
+            {'type': 'str', 'minimum_length': 0},
+            ('type',),
+            [('$', 'length', 'the length range [0, inf] always passes')]
+        ],
+        [
+            {'type': 'str', 'minimum_length': -1},
+            ('type',),
+            [('$', 'length', 'the length range [-1, inf] always passes')]
+        ],
+        [{'type': 'str', 'minimum_length': 1}, ('type', 'length'), []],
+        [
+            {'type': 'int', 'multiple_of': 1},
+            ('type',),
+            [('$', 'multiple_of', 'every integer is a multiple of 1')]
+        ],
+        [{'type': 'float', 'multiple_of': 1}, ('type', 'multiple_of'), []],
+        [
+            {'type': 'any', 'multiple_of': 1},
+            ('multiple_of',),
+            [('$', 'type', 'the type any always passes')]
+        ],
+        [
+            {'type': 'str', 'enumeration': ['ab', 'cd'], 'pattern': '[a-z]+', 'maximum_length': 2},
+            ('type', 'enumeration'),
+            [
+                ('$', 'pattern', 'all members of the enumeration pass it'),
+                ('$', 'length', 'all members of the enumeration pass it'),
+            ]
+        ],
+        [
+            {'type': 'str', 'enumeration': ['ab', 'CD'], 'pattern': '[a-z]+'},
+            ('type', 'enumeration', 'pattern'),
+            []
+        ],
+        [
+            {'type': 'int', 'enumeration': [2, 4], 'minimum': 1, 'maximum': 4, 'multiple_of': 2},
+            ('type', 'enumeration'),
+            [
+                ('$', 'maximum', 'all members of the enumeration pass it'),
+                ('$', 'minimum', 'all members of the enumeration pass it'),
+                ('$', 'multiple_of', 'all members of the enumeration pass it'),
+            ]
+        ],
+        [
+            {'type': 'int', 'enumeration': [2, 4], 'maximum': 4, 'exclusive_maximum': True},
+            ('type', 'enumeration', 'maximum'),
+            []
+        ],
+        [
+            {'type': 'any', 'enumeration': [1], 'maximum': 1},
+            ('enumeration', 'maximum'),
+            [('$', 'type', 'the type any always passes')]
+        ],
+        [
+            {'type': ['int', 'str'], 'enumeration': [1, 'a'], 'maximum': 1},
+            ('type', 'enumeration', 'maximum'),
+            []
+        ],
+        [
+            {
+                'type': 'dict',
+                'additional_properities': True,
+                'properties': {'a': {'type': 'any', 'required': False}}
+            },
+            ('type',),
+            [
+                ('$', 'properties', 'no property is required or checked'),
+                ("$['a']", 'type', 'the type any always passes'),
+            ]
+        ],
+        [
+            {'type': 'dict', 'properties': {'a': {'required': False, 'dependencies': ['b']}}},
+            ('type', 'properties'),
+            []
+        ],
+        [{'type': 'dict', 'properties': {'a': {}}}, ('type', 'properties'), []],
+        [
+            {'type': 'dict', 'additional_properities': False, 'properties': {}},
+            ('type', 'properties'),
+            []
+        ],
+        [{'properties': {}}, ('properties',), []],
+        [{'type': 'list', 'items': {}}, ('type',), [('$', 'items', 'the items are not checked')]],
+        [{'type': 'list', 'items': {'type': 'int'}}, ('type', 'dict_type_items'), []],
+        [{'items': {}}, ('dict_type_items',), []],
+        [
+            {'type': 'list', 'items': {'type': 'list', 'items': {'type': 'any'}}},
+            ('type', 'dict_type_items'),
+            [
+                ('$[*]', 'items', 'the items are not checked'),
+                ('$[*][*]', 'type', 'the type any always passes'),
+            ]
+        ],
+        [
+            {'type': 'int', 'minimum': 0, 'maximum': 10, 'multiple_of': 3},
+            ('type', 'range', 'multiple_of'),
+            [('$', 'maximum, minimum', 'the bounds are merged into one range check')]
+        ],
+    ]
+)
+def test_optimize_checks(schema, checks, report):
+    root = compile_schema(schema).schema
+    assert root.checks == checks
+    assert report_optimizations(root) == report
+
+@pytest.mark.parametrize(
+    'schema, data, message',
+    [
+        ['{type: int, minimum: 0, maximum: 10}', 5, None],
+        ['{type: int, minimum: 0, maximum: 10}', 0, None],
+        ['{type: int, minimum: 0, maximum: 10}', 11, 'data = 11, which should <= 10'],
+        ['{type: int, minimum: 0, maximum: 10}', -1, 'data = -1, which should >= 0'],
+        [
+            '{type: int, minimum: 0, maximum: 10, exclusive_maximum: true}',
+            10,
+            'data = 10, which should < 10'
+        ],
+        [
+            '{type: int, minimum: 0, maximum: 10, exclusive_minimum: true}',
+            0,
+            'data = 0, which should > 0'
+        ],
+        ['{type: int, minimum: 10, maximum: 0}', 5, 'data = 5, which should <= 0'],
+        [
+            '{type: str, enumeration: [ab], pattern: "[a-z]+"}',
+            'cd',
+            "data = 'cd', does not in enumeration ['ab']"
+        ],
+        ['{type: int, enumeration: [1, 2], maximum: 2}', True, None],
+        [
+            '{type: int, enumeration: [1, 2], maximum: 2}',
+            3,
+            'data = 3, does not in enumeration [1, 2]'
+        ],
+        ['{type: int, multiple_of: 1}', 1.5, 'data = 1.5, but its type should be int'],
+        ['{type: list, items: {}}', [1, 'a', None], None],
+        ['{type: list, items: {}}', 'ab', 'data = \'ab\', but its type should be list'],
+        ['{items: {type: any}}', [1, 'a'], None],
+    ]
+)
+def test_messages(backend, schema, data, message):
+    validator = compile_schema(schema, backend)
+    try:
+        validator.validate(data)
+    except SchemaException as exception:
+        assert str(exception) == message
+    else:
+        assert message is None
+
+def test_recursive_definitions(backend):
+    validator = compile_schema(
+        '''
+        type: dict
+        definitions:
+            node:
+                type: dict
+                properties:
+                    child:
+                        $ref: '#/definitions/node'
+                        required: false
+        properties:
+            root:
+                $ref: '#/definitions/node'
+        ''',
+        backend
+    )
+    validator.validate({'root': {'child': {'child': {}}}})
+    with pytest.raises(SchemaException):
+        validator.validate({'root': {'child': {'child': 1}}})
+    assert report_optimizations(validator.schema) == []
@@ -0,0 +1,81 @@
+"""
+description: this module contains the testcases about register_type and resolve_type.
+"""
+
+import fractions
+import pytest
+
+from fast_tornado.match_schema import check_schema
+from fast_tornado.match_schema import register_type
+from fast_tornado.match_schema import resolve_type
+from fast_tornado.match_schema import TYPE_REGISTRY
+
+from fast_tornado.exceptions import TypeMismatchException
+from fast_tornado.exceptions import InvalidArgumentsException
+
+class Point:
+    """
+    description: this is a type registered in the testcases.
+    """
+
+def test_register_type():
+    register_type('Point', Point)
+    register_type('Point', Point)
+
+    check_schema('type: Point', Point())
+    with pytest.raises(TypeMismatchException) as execution_infomation:
+        check_schema('type: [Point, None]', 1)
+
+    assert str(execution_infomation.value) == 'data = 1, but its type should be Point, NoneType'
+
+def test_register_type_twice():
+    with pytest.raises(InvalidArgumentsException) as execution_infomation:
+        register_type('int', float)
+
+    assert str(execution_infomation.value) == \
+        "the arguments of function register_type is invalid, " \
+        "the name 'int' has been registered as int"
+
+@pytest.mark.parametrize(
+    'name, clazz', [
+        [1, Point],
+        ['Point', 1],
+        ['Point', Point()],
+    ]
+)
+def test_register_invalid_type(name, clazz):
+    with pytest.raises(InvalidArgumentsException):
+        register_type(name, clazz)
+
+    assert name not in TYPE_REGISTRY or TYPE_REGISTRY[name] is Point
+
+def test_resolve_non_type():
+    with pytest.raises(InvalidArgumentsException) as execution_infomation:
+        resolve_type('os.getcwd')
+
+    assert str(execution_infomation.value) == \
+        "the arguments of function resolve_type is invalid, 'os.getcwd' is not a type"
+    assert 'os.getcwd' not in TYPE_REGISTRY
+
+def test_resolve_dotted_type_once(monkeypatch):
+    TYPE_REGISTRY.pop('fractions.Fraction', None)
+    assert resolve_type('fractions.Fraction') is fractions.Fraction
+
+    def import_module(name):
+        raise AssertionError('{name} should not be imported again'.format(name=name))
+
+    monkeypatch.setattr('importlib.import_module', import_module)
+    assert resolve_type('fractions.Fraction') is fractions.Fraction
+
+@pytest.mark.parametrize(
+    'name, exception_type', [
+        ['nonexistent_module.Type', ImportError],
+        ['decimal.Nonexistent', AttributeError],
+        ['Nonexistent', ValueError],
+    ]
+)
+def test_resolve_nonexistent_type(name, exception_type):
+    with pytest.raises(exception_type):
+        resolve_type(name)
+
+    assert name not in TYPE_REGISTRY
@@ -0,0 +1,121 @@
+"""
+description: this module contains the testcases about the field sample of schemas.
+"""
+
+import pytest
+
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.match_schema import check_stream
+from fast_tornado.match_schema import SAMPLE_COUNTER
+from fast_tornado.match_schema.sample_items import get_sample_size
+from fast_tornado.constants import MATCH_SCHEMA
+
+from fast_tornado.exceptions import SchemaException
+from fast_tornado.exceptions import InvalidSampleException
+
+@pytest.fixture(name='backend', params=[MATCH_SCHEMA.WALKER, MATCH_SCHEMA.CODE])
+def __backend(request):
+    SAMPLE_COUNTER.clear()
+    yield request.param
+    SAMPLE_COUNTER.clear()
+
+def get_schema(sample, seed=0):
+    return {
+        'type': 'list',
+        'sample': sample,
+        'sample_seed': seed,
+        'items': {'type': 'dict', 'properties': {'x': {'type': 'int'}}},
+    }
+
+@pytest.mark.parametrize(
+    'sample, length, size',
+    [
+        [0.1, 100, 10],
+        [0.1, 5, 1],
+        [1.0, 7, 7],
+        [10, 100, 10],
+        [10, 3, 3],
+        [0.5, 0, 0],
+    ]
+)
+def test_sample_size(sample, length, size):
+    assert get_sample_size(sample, length) == size
+
+@pytest.mark.parametrize('sample', [0.1, 10])
+def test_counter(backend, sample):
+    validator = compile_schema(get_schema(sample), backend)
+    validator.validate([{'x': index} for index in range(100)])
+    validator.validate([{'x': index} for index in range(5)])
+
+    statistics = SAMPLE_COUNTER.statistics
+    assert statistics.lists == 2
+    assert statistics.checked == 10 + (1 if sample == 0.1 else 5)
+    assert statistics.skipped == 90 + (4 if sample == 0.1 else 0)
+
+def test_deterministic(backend):
+    data = [{'x': index} for index in range(1000)]
+    for index in range(0, 1000, 2):
+        data[index] = {'x': str(index)}
+
+    messages = set()
+    for _ in range(3):
+        with pytest.raises(SchemaException) as execution_infomation:
+            compile_schema(get_schema(100, seed=7), backend).validate(data)
+        messages.add(str(execution_infomation.value))
+    assert len(messages) == 1
+
+def test_skipped_items_are_not_checked(backend):
+    data = [{'x': index} for index in range(1000)]
+    data[500] = {'x': 'wrong'}
+
+    failures = 0
+    for seed in range(20):
+        try:
+            compile_schema(get_schema(10, seed=seed), backend).validate(data)
+        except SchemaException as exception:
+            assert str(exception) == "data[500]['x'] = 'wrong', but its type should be int"
+            failures += 1
+    assert failures < 20
+
+    with pytest.raises(SchemaException):
+        compile_schema(get_schema(1.0), backend).validate(data)
+
+def test_non_list_data(backend):
+    schema = get_schema(1)
+    schema['type'] = 'any'
+    with pytest.raises(SchemaException):
+        compile_schema(schema, backend).validate({'a': 1})
+    assert SAMPLE_COUNTER.statistics.lists == 0
+
+@pytest.mark.parametrize(
+    'schema, message',
+    [
+        [get_schema(0.0), 'invalid sample 0.0, it should be a float in (0, 1] or a positive int'],
+        [get_schema(1.5), 'invalid sample 1.5, it should be a float in (0, 1] or a positive int'],
+        [get_schema(0), 'invalid sample 0, it should be a float in (0, 1] or a positive int'],
+        [get_schema(True), 'invalid sample True, it should be a float in (0, 1] or a positive int'],
+        [get_schema('10'), "invalid sample '10', it should be a float in (0, 1] or a positive int"],
+        [
+            {'type': 'list', 'sample': 1},
+            'invalid sample 1, it can only be used with the items of a single schema'
+        ],
+        [
+            {'type': 'list', 'sample': 1, 'items': [{}]},
+            'invalid sample 1, it can only be used with the items of a single schema'
+        ],
+    ]
+)
+def test_invalid_sample(schema, message):
+    with pytest.raises(InvalidSampleException) as execution_infomation:
+        compile_schema(schema)
+    assert str(execution_infomation.value) == message
+
+def test_check_stream_checks_all_items():
+    schema = '''
+    type: list
+    sample: 1
+    items:
+        type: int
+    '''
+    with pytest.raises(SchemaException):
+        check_stream(schema, '[1, 2, 3, "x"]')
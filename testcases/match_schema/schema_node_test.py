@@ -0,0 +1,160 @@
+"""
+description: this module contains the testcases about the immutable node tree of compiled schemas.
+"""
+
+import copy
+import concurrent.futures
+import yaml
+import pytest
+
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.match_schema import SchemaNode
+from fast_tornado.match_schema import TYPE_REGISTRY
+from fast_tornado.constants import MATCH_SCHEMA
+
+from fast_tornado.exceptions import SchemaException
+from fast_tornado.exceptions import TypeMismatchException
+
+SCHEMA = '''
+type: dict
+properties:
+    x:
+        type: int
+        assertion: 'lambda x: x % 3 != 2'
+    y:
+        type: str
+        pattern: '[a-z]+'
+        full_match: true
+        required: false
+    z:
+        type: [nonexistent_module.Deferred, None]
+        required: false
+    w:
+        type: list
+        required: false
+        items:
+            - type: int
+              enumeration: [1, 2, 3]
+            - type: float
+'''
+
+@pytest.fixture(name='backend', params=[MATCH_SCHEMA.WALKER, MATCH_SCHEMA.CODE])
+def __backend(request):
+    yield request.param
+
+def test_schema_is_not_changed(backend):
+    schema = yaml.safe_load(SCHEMA)
+    original = copy.deepcopy(schema)
+
+    validator = compile_schema(schema, backend=backend)
+    validator.validate({'x': 1, 'y': 'abc', 'w': [1, 1.0]})
+    assert schema == original
+
+    compile_schema(schema, backend=backend).validate({'x': 3})
+    assert schema == original
+
+def test_changing_schema_does_not_change_validator(backend):
+    TYPE_REGISTRY.pop('nonexistent_module.Deferred', None)
+    schema = yaml.safe_load(SCHEMA)
+    validator = compile_schema(schema, backend=backend)
+
+    schema['properties']['z']['type'] = 'int'
+    schema['properties']['w']['items'][0]['enumeration'].append(4)
+    schema['properties']['w']['items'][0]['type'] = 'str'
+
+    # the deferred types are resolved from the type names copied into the node, not from the schema.
+    with pytest.raises(ImportError):
+        validator.validate({'x': 1, 'z': None})
+    with pytest.raises(SchemaException) as execution_infomation:
+        validator.validate({'x': 1, 'w': [4, 1.0]})
+    assert str(execution_infomation.value) == "data['w'][0] = 4, does not in enumeration [1, 2, 3]"
+
+def test_node_is_immutable():
+    node = compile_schema(SCHEMA).schema
+    assert isinstance(node, SchemaNode)
+    assert node.types == (dict,)
+    assert isinstance(node.properties['w'].items, tuple)
+
+    with pytest.raises(AttributeError):
+        node.types = (list,)
+
+    with pytest.raises(AttributeError):
+        del node.types
+
+    with pytest.raises(AttributeError):
+        node.extra = 1
+
+    with pytest.raises(TypeError):
+        node.properties['x'] = node
+
+def test_deferred_types_are_not_stored(backend):
+    TYPE_REGISTRY.pop('nonexistent_module.Deferred', None)
+    validator = compile_schema(SCHEMA, backend=backend)
+    node = validator.schema.properties['z']
+    assert node.types is None
+
+    with pytest.raises(ImportError):
+        validator.validate({'x': 1, 'z': None})
+
+    TYPE_REGISTRY['nonexistent_module.Deferred'] = int
+    try:
+        validator.validate({'x': 1, 'z': 1})
+        with pytest.raises(TypeMismatchException):
+            validator.validate({'x': 1, 'z': 'a'})
+    finally:
+        TYPE_REGISTRY.pop('nonexistent_module.Deferred')
+
+    assert node.types is None
+
+def test_validate_concurrently(backend):
+    validator = compile_schema(SCHEMA, backend=backend)
+    records = [{'x': index, 'y': 'abc' if index % 7 else 'ABC'} for index in range(2000)]
+
+    def validate(record):
+        try:
+            validator.validate(record, name='record')
+        except SchemaException as exception:
+            return str(exception)
+        return None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(validate, records))
+
+    assert results == [validate(record) for record in records]
+    assert sum(result is not None for result in results) == sum(
+        1 for record in records if record['x'] % 3 == 2 or record['x'] % 7 == 0
+    )
+
+@pytest.mark.parametrize(
+    'schema, checks',
+    [
+        [{'type': 'int'}, ('type',)],
+        [{}, ()],
+        [{'type': 'any', 'enumeration': [1, 2]}, ('enumeration',)],
+        [{'type': ['int', 'any']}, ()],
+        [{'type': 'nonexistent_module.Deferred'}, ('type',)],
+        [{'type': 'str', 'maximum_length': 3, 'pattern': 'a'}, ('type', 'pattern', 'length')],
+        [{'type': 'list', 'items': {'type': 'int'}}, ('type', 'dict_type_items')],
+        [{'type': 'list', 'items': [{}]}, ('type', 'list_type_items')],
+        [
+            {
+                'type': 'int',
+                'assertion': 'lambda x: x',
+                'minimum': 0,
+                'maximum': 1,
+                'multiple_of': 2
+            },
+            ('type', 'assertion', 'range', 'multiple_of')
+        ],
+        [{'type': 'dict', 'properties': {'a': {}}}, ('type', 'properties')],
+    ]
+)
+def test_checks(schema, checks):
+    assert compile_schema(schema).schema.checks == checks
+
+def test_length_of_unsized_data(backend):
+    validator = compile_schema({'type': ['int', 'str'], 'maximum_length': 2}, backend=backend)
+    validator.validate(123)
+    validator.validate('ab')
+    with pytest.raises(SchemaException):
+        validator.validate('abc')
@@ -0,0 +1,115 @@
+"""
+description: this module contains the testcases about SchemaProfiler.
+"""
+
+import json
+import pytest
+
+from fast_tornado.match_schema import check_schema
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.match_schema import SchemaProfiler
+from fast_tornado.match_schema.schema_profiler import get_schema_paths
+
+from fast_tornado.exceptions import TypeMismatchException
+from fast_tornado.exceptions import InvalidArgumentsException
+
+SCHEMA = '''
+type: dict
+definitions:
+    node:
+        type: dict
+        properties:
+            value:
+                type: int
+            children:
+                type: list
+                required: false
+                items:
+                    $ref: '#/definitions/node'
+properties:
+    name:
+        type: str
+    tags:
+        type: list
+        items:
+            type: str
+    point:
+        type: list
+        required: false
+        items:
+            - type: int
+            - type: float
+    tree:
+        $ref: '#/definitions/node'
+        required: false
+'''
+
+def test_schema_paths():
+    root = compile_schema(SCHEMA).schema
+    paths = set(get_schema_paths(root).values())
+    assert paths == set([
+        '$',
+        "$['name']",
+        "$['tags']",
+        "$['tags'][*]",
+        "$['point']",
+        "$['point'][0]",
+        "$['point'][1]",
+        '#/definitions/node',
+        "#/definitions/node['value']",
+        "#/definitions/node['children']",
+    ])
+    # the reference with its own required field is a copy, but it has the path of the definition.
+    assert get_schema_paths(root)[id(root.properties['tree'])] == '#/definitions/node'
+
+def test_statistics():
+    profiler = SchemaProfiler()
+    data = {
+        'name': 'zq',
+        'tags': ['a', 'b', 'c'],
+        'point': [1, 2.0],
+        'tree': {'value': 1, 'children': [{'value': 2}, {'value': 3}]}
+    }
+    check_schema(SCHEMA, data, profiler=profiler)
+    check_schema(SCHEMA, data, profiler=profiler)
+
+    with pytest.raises(TypeMismatchException):
+        check_schema(SCHEMA, {'name': 'zq', 'tags': ['a', 1]}, profiler=profiler)
+
+    statistics = {item.path: item for item in profiler.statistics()}
+    assert statistics['$'].visits == 3
+    assert statistics['$'].failures == 1
+    assert statistics["$['tags'][*]"].visits == 8
+    assert statistics["$['tags'][*]"].failures == 1
+    assert statistics["$['point'][1]"].visits == 2
+    assert statistics['#/definitions/node'].visits == 6
+    assert statistics["#/definitions/node['value']"].failures == 0
+    assert statistics['$'].time >= statistics["$['tags']"].time >= statistics["$['tags'][*]"].time
+
+def test_sorted_output():
+    profiler = SchemaProfiler()
+    check_schema(SCHEMA, {'name': 'zq', 'tags': ['a'] * 10}, profiler=profiler)
+
+    paths = [item.path for item in profiler.statistics('visits')]
+    assert paths[0] == "$['tags'][*]"
+    assert [item.path for item in profiler.statistics('path')] == sorted(paths)
+    assert profiler.statistics('time')[0].path == '$'
+
+    table = profiler.render_table(limit=2).splitlines()
+    assert len(table) == 3
+    assert table[0].split() == ['path', 'visits', 'time', '(ms)', 'failures']
+    assert table[1].split()[0] == '$'
+
+    dumped = json.loads(profiler.dump_json(sort_by='visits'))
+    assert dumped[0]['path'] == "$['tags'][*]"
+    assert dumped[0]['visits'] == 10
+    assert set(dumped[0]) == {'path', 'visits', 'time', 'failures'}
+
+    with pytest.raises(InvalidArgumentsException):
+        profiler.statistics('name')
+
+    profiler.clear()
+    assert profiler.statistics() == []
+
+def test_without_profiler():
+    check_schema(SCHEMA, {'name': 'zq', 'tags': []})
@@ -0,0 +1,164 @@
+"""
+description: this module contains the testcases about the walker backend of compile_schema.
+"""
+
+import pytest
+
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.match_schema import SchemaProfiler
+from fast_tornado.match_schema import Validator
+from fast_tornado.match_schema import validator as validator_module
+from fast_tornado.match_schema.validator import render_name
+from fast_tornado.constants import MATCH_SCHEMA
+
+from fast_tornado.exceptions import SchemaException
+from fast_tornado.exceptions import TypeMismatchException
+
+SCHEMA = '''
+type: dict
+properties:
+    x:
+        type: list
+        items:
+            type: dict
+            properties:
+                y:
+                    type: list
+                    items:
+                        - type: int
+                        - type: str
+'''
+
+@pytest.mark.parametrize(
+    'path, name', [
+        [['data'], 'data'],
+        [['data', 'x'], "data['x']"],
+        [['data', 'x', 0, 'y', 1], "data['x'][0]['y'][1]"],
+        [['data', 1, '1', None], "data[1]['1'][None]"],
+    ]
+)
+def test_render_name(path, name):
+    assert render_name(path) == name
+
+def test_name_is_not_rendered_without_exception(monkeypatch):
+    validator = compile_schema(SCHEMA, backend=MATCH_SCHEMA.WALKER)
+
+    def fail(path):
+        raise AssertionError('the name should not be rendered')
+
+    monkeypatch.setattr(validator_module, 'render_name', fail)
+    validator.validate({'x': [{'y': [1, 'a']}] * 100})
+
+def test_name_is_rendered_with_exception():
+    validator = compile_schema(SCHEMA, backend=MATCH_SCHEMA.WALKER)
+
+    with pytest.raises(TypeMismatchException) as execution_information:
+        validator.validate({'x': [{'y': [1, 'a']}, {'y': [1, 2]}]})
+    assert str(execution_information.value) == \
+        "data['x'][1]['y'][1] = 2, but its type should be str"
+
+    with pytest.raises(TypeMismatchException) as execution_information:
+        validator.validate({'x': [{'y': [1.0, 'a']}]}, name='body')
+    assert str(execution_information.value) == \
+        "body['x'][0]['y'][0] = 1.0, but its type should be int"
+
+ORDER_SCHEMA = '''
+type: dict
+additional_properities: false
+assertion: 'lambda x: len(x) < 5'
+properties:
+    a:
+        type: list
+        maximum_length: 2
+        items:
+            type: dict
+            properties:
+                b:
+                    type: int
+                c:
+                    type: list
+                    required: false
+                    dependencies: [b]
+                    items:
+                        - type: int
+                        - type: str
+    d:
+        type: str
+        required: false
+        pattern: '[a-z]+'
+'''
+
+TREE_SCHEMA = '''
+type: dict
+definitions:
+    node:
+        type: dict
+        properties:
+            value:
+                type: int
+            child:
+                $ref: '#/definitions/node'
+                required: false
+properties:
+    root:
+        $ref: '#/definitions/node'
+'''
+
+def get_message(validator, data):
+    try:
+        validator.validate(data)
+    except SchemaException as exception:
+        return '{clazz}: {message}'.format(clazz=type(exception).__name__, message=str(exception))
+    return None
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        {'a': []},
+        {'a': [{'b': 1, 'c': [1, 'x']}], 'd': 'x'},
+        {'a': [{'b': 1, 'c': [1, 2]}], 'd': 1},
+        {'a': [{'c': [1, 'x']}]},
+        {'a': [{'b': 'x', 'c': [1]}]},
+        {'a': [{'b': 1}, {'b': 2}, {'b': 3}]},
+        {'a': [{'b': 1, 'c': [1, 'x']}, {'b': 'y'}], 'd': 'A'},
+        {'a': [{'b': 1}], 'd': 'x', 'e': 1},
+        {'a': [{'b': 1, 'c': [1, 'x', 2]}], 'e': 1, 'f': 2, 'g': 3, 'h': 4},
+        {'a': [{'b': 1}], 'e': 1, 'f': 2, 'g': 3, 'h': 4},
+        [],
+    ]
+)
+def test_same_messages_with_explicit_stack(monkeypatch, data):
+    validator = compile_schema(ORDER_SCHEMA, backend=MATCH_SCHEMA.WALKER)
+    message = get_message(validator, data)
+
+    monkeypatch.setattr(MATCH_SCHEMA, 'RECURSION_DEPTH', 0)
+    assert get_message(validator, data) == message
+
+def generate_tree(depth, value):
+    node = {'value': value}
+    for index in range(depth):
+        node = {'value': index, 'child': node}
+    return {'root': node}
+
+@pytest.mark.parametrize('depth', [0, 10, 1000, 20000])
+def test_deep_data(depth):
+    validator = compile_schema(TREE_SCHEMA, backend=MATCH_SCHEMA.WALKER)
+    validator.validate(generate_tree(depth, 0))
+
+    with pytest.raises(TypeMismatchException) as execution_information:
+        validator.validate(generate_tree(depth, 'x'))
+
+    expected_name = "data['root']" + "['child']" * depth + "['value']"
+    assert str(execution_information.value) == expected_name + " = 'x', but its type should be int"
+
+def test_deep_data_with_profiler():
+    profiler = SchemaProfiler()
+    validator = Validator(compile_schema(TREE_SCHEMA).schema, profiler=profiler)
+    validator.validate(generate_tree(2000, 0))
+    with pytest.raises(TypeMismatchException):
+        validator.validate(generate_tree(2000, 'x'))
+
+    statistics = {item.path: item for item in profiler.statistics()}
+    assert statistics['#/definitions/node'].visits == 2 * 2001
+    assert statistics['#/definitions/node'].failures == 2001
+    assert statistics["#/definitions/node['value']"].visits == 2 * 2001
@@ -0,0 +1,119 @@
+"""
+description: this module contains the testcases about the vectorized fast path for lists of numbers.
+"""
+
+import pytest
+
+from fast_tornado.match_schema import compile_schema
+from fast_tornado.match_schema import vectorize
+from fast_tornado.match_schema.vectorize import find_first_failure
+from fast_tornado.constants import MATCH_SCHEMA
+
+from fast_tornado.exceptions import TypeMismatchException
+from fast_tornado.exceptions import ExceedMaximumException
+from fast_tornado.exceptions import ExceedMinimumException
+from fast_tornado.exceptions import MultipleOfException
+
+LENGTH = 1000
+
+def get_list_schema(items):
+    return 'type: list\nitems:\n{items}'.format(
+        items=''.join('    ' + line + '\n' for line in items.splitlines())
+    )
+
+@pytest.mark.parametrize(
+    'schema, vectorizable', [
+        ['type: list\nitems:\n    type: int', True],
+        ['type: list\nitems:\n    type: [int, float]\n    minimum: 0\n    maximum: 1.5', True],
+        [
+            'type: list\nitems:\n    type: float\n'
+            '    multiple_of: 0.5\n    exclusive_maximum: true',
+            True
+        ],
+        ['type: list\nitems:\n    type: [int, str]', False],
+        ['type: list\nitems:\n    type: int\n    enumeration: [1, 2]', False],
+        ['type: list\nitems:\n    type: int\n    assertion: "lambda x: x > 0"', False],
+        ['type: list\nitems:\n    type: int\n    multiple_of: 0', False],
+        ['type: list\nitems:\n    type: int\n    maximum: true', False],
+    ]
+)
+def test_is_vectorizable(schema, vectorizable):
+    validator = compile_schema(schema, backend=MATCH_SCHEMA.WALKER)
+    assert validator.schema.items.vectorizable is vectorizable
+
+def test_fall_back_without_numpy(monkeypatch):
+    monkeypatch.setattr(vectorize, 'numpy', None)
+    validator = compile_schema('type: list\nitems:\n    type: int', backend=MATCH_SCHEMA.WALKER)
+    assert find_first_failure(validator.schema.items, list(range(LENGTH))) == 0
+
+    with pytest.raises(TypeMismatchException) as execution_information:
+        validator.validate(list(range(LENGTH)) + [1.0])
+    assert str(execution_information.value) == \
+        'data[{index}] = 1.0, but its type should be int'.format(index=LENGTH)
+
+@pytest.mark.parametrize(
+    'items, data, start', [
+        ['type: int\nmaximum: 10', [1] * LENGTH, LENGTH],
+        ['type: int\nmaximum: 10', [1] * 10 + [11] + [1] * LENGTH, 10],
+        ['type: int\nmaximum: 10\nexclusive_maximum: true', [1] * 10 + [10] + [1] * LENGTH, 10],
+        ['type: int\nminimum: 0', [0] * 10 + [-1] * LENGTH, 10],
+        ['type: [int, float]\nmultiple_of: 2', [2, 4.0] * LENGTH + [3], 2 * LENGTH],
+        ['type: float\nmaximum: 1', [0.5] * LENGTH + [float('nan')], LENGTH],
+        ['type: int', [True, 1] * LENGTH, 2 * LENGTH],
+        ['type: int\nmaximum: 10', [1] * LENGTH + [2 ** 70], 0],
+        ['type: int\nmaximum: 10.5', [2 ** 60] * LENGTH, 0],
+        ['type: [int, float]\nmaximum: 10', [2 ** 60, 0.5] * LENGTH, 0],
+        ['type: int', [1] * LENGTH + [1.0], 0],
+        ['type: int', [1] * 3, 0],
+    ]
+)
+def test_find_first_failure(items, data, start):
+    pytest.importorskip('numpy')
+
+    schema = get_list_schema(items)
+    validator = compile_schema(schema, backend=MATCH_SCHEMA.WALKER)
+    assert find_first_failure(validator.schema.items, data) == start
+
+@pytest.mark.parametrize('backend', [MATCH_SCHEMA.WALKER, MATCH_SCHEMA.CODE])
+@pytest.mark.parametrize(
+    'items, data, exception_type, message', [
+        [
+            'type: int\nmaximum: 10',
+            [1] * LENGTH + [11, 12],
+            ExceedMaximumException,
+            'data[{index}] = 11, which should <= 10'.format(index=LENGTH)
+        ],
+        [
+            'type: [int, float]\nminimum: 0\nexclusive_minimum: true',
+            [1, 2.5] * LENGTH + [0],
+            ExceedMinimumException,
+            'data[{index}] = 0, which should > 0'.format(index=2 * LENGTH)
+        ],
+        [
+            'type: int\nmultiple_of: 3\nmaximum: 100',
+            [3] * LENGTH + [200],
+            ExceedMaximumException,
+            'data[{index}] = 200, which should <= 100'.format(index=LENGTH)
+        ],
+        [
+            'type: int\nmultiple_of: 3',
+            [3] * LENGTH + [4],
+            MultipleOfException,
+            'data[{index}] = 4, should be multiple of 3, but it is not'.format(index=LENGTH)
+        ],
+        [
+            'type: int\nmaximum: 10',
+            [1] * LENGTH + [1.0],
+            TypeMismatchException,
+            'data[{index}] = 1.0, but its type should be int'.format(index=LENGTH)
+        ]
+    ]
+)
+def test_validate_large_list_with_exception(backend, items, data, exception_type, message):
+    schema = get_list_schema(items)
+    validator = compile_schema(schema, backend=backend)
+
+    validator.validate(data[:LENGTH])
+    with pytest.raises(exception_type) as execution_information:
+        validator.validate(data)
+    assert str(execution_information.value) == message